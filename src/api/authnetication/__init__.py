@@ -1,5 +1,10 @@
 """Authentication module."""
 
-from api.authnetication.password import hash_password, verify_password
+from api.authnetication.password import (
+    PasswordHasher,
+    hash_password,
+    password_hasher,
+    verify_password,
+)
 from api.authnetication.scheme import oauth2_scheme
 from api.authnetication.token import create_access_token, decode_token
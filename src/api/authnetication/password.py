@@ -1,5 +1,12 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
 import bcrypt
 
+from cutom_types.base import T  # noqa: WPS347
+from settings import settings
+
 
 def hash_password(password: str) -> str:
     """
@@ -28,3 +35,82 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         password=password_byte_enc,
         hashed_password=hashed_password_byte_enc,
     )
+
+
+class PasswordHasher:
+    """
+    Password hasher that runs bcrypt in a bounded thread pool.
+
+    bcrypt releases the GIL while hashing, so hashing in threads does not block
+    the event loop.
+    """
+
+    def __init__(self, max_workers: int = settings.password_hash_workers):
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending_count = 0
+
+    @property
+    def pending_count(self) -> int:
+        """
+        Get number of hashing jobs that are running or waiting for a worker.
+
+        :return: number of pending jobs
+        """
+        return self._pending_count
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Get number of hashing jobs waiting for a worker.
+
+        :return: number of queued jobs
+        """
+        return max(self._pending_count - self._max_workers, 0)
+
+    async def hash(self, password: str) -> str:
+        """
+        Hash password in the thread pool.
+
+        :param password: plain password
+        :return: hashed password
+        """
+        return await self._run(hash_password, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Verify plain password against hashed password in the thread pool.
+
+        :param plain_password: plain password
+        :param hashed_password: hashed password
+        :return: whether plain password matches hashed password
+        """
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def close(self) -> None:
+        """
+        Shut down the thread pool.
+
+        :return:
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="password_hasher",
+            )
+        loop = asyncio.get_running_loop()
+        job = loop.run_in_executor(self._executor, func, *args)
+        self._pending_count += 1
+        job.add_done_callback(self._complete_job)
+        return await job
+
+    def _complete_job(self, job: asyncio.Future) -> None:
+        self._pending_count -= 1
+
+
+password_hasher = PasswordHasher()
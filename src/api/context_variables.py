@@ -1,3 +1,4 @@
 import contextvars
 
 is_concurrent = contextvars.ContextVar("is_concurrent", default=False)
+has_written = contextvars.ContextVar("has_written", default=False)
@@ -4,9 +4,8 @@ from fastapi import Depends, Header
 
 from api.authnetication import decode_token, oauth2_scheme
 from api.schemas.authnetication import UserInTokenSchema
-from api.schemas.nested.user import UserWithLobbiesInDBSchema
 from api.schemas.player import PlayerInDBSchema
-from api.services import PlayerService, UserService
+from api.services import PlayerService
 from exceptions.service.authorization import (
     InvalidCredentialsError,
     NotOwnerError,
@@ -49,20 +48,23 @@ async def check_current_user(
 async def check_current_user_in_lobby(
     lobby_id: int,
     current_user: Annotated[UserInTokenSchema, Depends(get_current_user)],
-    user_service: Annotated[UserService, Depends()],
-) -> UserWithLobbiesInDBSchema:
+    player_service: Annotated[PlayerService, Depends()],
+) -> UserInTokenSchema:
     """
     Check if current user has a player in the lobby.
 
     :param lobby_id: lobby id
     :param current_user: current user
-    :param user_service: user service
-    :return: current user with lobbies and players
+    :param player_service: player service
+    :return: current user that is in the lobby
     """
-    user_with_lobbies = await user_service.get_user_by_id(current_user.user_id)
-    if not user_with_lobbies.has_lobby(lobby_id):
+    in_lobby = await player_service.check_user_in_lobby(
+        user_id=current_user.user_id,
+        lobby_id=lobby_id,
+    )
+    if not in_lobby:
         raise UserNotInLobby()
-    return user_with_lobbies
+    return current_user
 
 
 async def get_current_user_from_header(
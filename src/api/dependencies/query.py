@@ -1,30 +1,55 @@
 from datetime import datetime
-from typing import Annotated, Literal
+from typing import Annotated, Literal, Optional
 
 from fastapi import Query
 from pydantic import ValidationError
 
-from api.schemas.query import DateTimeSchema, OrderSchema, PaginationSchema
+from api.enums import CountStrategyEnum
+from api.schemas.query import (
+    CursorSchema,
+    DateTimeSchema,
+    OrderSchema,
+    PaginationSchema,
+)
 from exceptions.service.request import DateTimeQueryParamsError, OrderQueryParamsError
 from settings import settings
 
 PAGE_SIZE_ANNOTATION = Annotated[int, Query(ge=1, le=settings.max_query_limit)]
+COUNT_ANNOTATION = Annotated[
+    Optional[Literal["exact", "estimated", "cached"]],
+    Query(),
+]
 
 
 async def get_pagination_parameters(
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: PAGE_SIZE_ANNOTATION = settings.page_size,
+    cursor: Annotated[str | None, Query()] = None,
+    count: COUNT_ANNOTATION = None,
+    include_total: Annotated[bool, Query()] = True,
 ) -> PaginationSchema:
     """
     Get pagination from query parameters.
 
+    If cursor is provided, page is ignored and rows are selected after or
+    before the cursor.
+
     :param page: page number
     :param page_size: page size
+    :param cursor: opaque cursor from `next_cursor` or `previous_cursor`
+    :param count: strategy to count total number of rows
+    :param include_total: whether to count total number of rows
     :return: pagination data with calculated offset
     """
+    if include_total:
+        count_strategy = CountStrategyEnum(count or settings.pagination_count_strategy)
+    else:
+        count_strategy = CountStrategyEnum.skipped
     return PaginationSchema(
         page=page,
         page_size=page_size,
+        cursor=CursorSchema.decode(cursor) if cursor else None,
+        count_strategy=count_strategy,
     )
 
 
@@ -1,6 +1,7 @@
+from contextlib import AsyncExitStack
 from typing import Annotated, AsyncGenerator
 
-from fastapi import Depends, WebSocket
+from fastapi import Depends, Query, WebSocket
 
 from api.dependencies import get_current_player
 from api.schemas.player import PlayerInDBSchema
@@ -35,20 +36,31 @@ async def get_lobby_connection(
     current_player: Annotated[PlayerInDBSchema, Depends(get_current_player)],
     conn_manager: Annotated[ConnectionManager, Depends(get_ws_connection_manager)],
     websocket: WebSocket,
+    since: Annotated[int | None, Query(ge=0)] = None,
 ) -> AsyncGenerator[Connection, None]:
     """
     Get lobby connection.
 
+    If `since` is provided, messages missed after it are replayed to the connection.
+
     :param lobby_room: lobby room
     :param current_player: current player
     :param conn_manager: websocket connection manager
     :param websocket: websocket connection
+    :param since: sequence number of the last message received by the client
     :yield: connection to a lobby
     """
     connection = await conn_manager.create_connection(
         room_id=lobby_room.id,
         connection_id=current_player.id,
         websocket=websocket,
+        since=since,
     )
-    async with connection:
+    async with AsyncExitStack() as exit_stack:
+        exit_stack.callback(
+            conn_manager.remove_connection,
+            room_id=lobby_room.id,
+            connection=connection,
+        )
+        await exit_stack.enter_async_context(connection)
         yield connection
@@ -2,4 +2,4 @@
 
 from api.enums.app_state import AppEnvironmentEnum
 from api.enums.player import PlayerStateEnum
-from api.enums.query import OrderQueryEnum
+from api.enums.query import CountStrategyEnum, CursorDirectionEnum, OrderQueryEnum
@@ -5,3 +5,15 @@ class OrderQueryEnum(Enum):
     desc = "desc"
     asc = "asc"
     not_set = None
+
+
+class CountStrategyEnum(Enum):
+    exact = "exact"
+    estimated = "estimated"
+    cached = "cached"
+    skipped = "skipped"
+
+
+class CursorDirectionEnum(Enum):
+    next = "next"
+    previous = "previous"
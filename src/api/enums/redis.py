@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class RedisCodecEnum(Enum):
+    json = "json"
+    msgpack = "msgpack"
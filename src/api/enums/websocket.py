@@ -6,3 +6,15 @@ class WebsocketMessageTypeEnum(Enum):
     disconnect = "disconnect"
     message = "message"
     error = "error"
+    resync = "resync"
+
+
+class WebsocketOverflowPolicyEnum(Enum):
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+    disconnect = "disconnect"
+
+
+class WebsocketBackplaneEnum(Enum):
+    memory = "memory"
+    redis = "redis"
@@ -53,17 +53,22 @@ class LobbyOperationsInterface:
         :param order: order by filter
         :return: paginated list of lobbies
         """
+        self._pagination.configure(pagination, order=order.order)
         lobbies, lobby_count = await run_concurrently(
             self._lobby_service.get_lobbies(
-                limit=pagination.page_size,
+                limit=pagination.limit,
                 offset=pagination.offset,
                 start=date.start,
                 end=date.end,
                 order=order.order,
+                cursor=pagination.cursor,
+            ),
+            self._pagination.count(
+                name="lobby",
+                total_count=self._lobby_service.total_count,
+                estimated_count=self._lobby_service.estimated_count,
             ),
-            self._lobby_service.total_count(),
         )
-        self._pagination.configure(pagination)
         return self._pagination.paginate(
             total=lobby_count,
             items=lobbies,
@@ -3,7 +3,7 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from api.authnetication import create_access_token, verify_password
+from api.authnetication import create_access_token, password_hasher
 from api.schemas.authnetication import TokenSchema, UserInTokenSchema
 from api.schemas.nested.user import UserWithLobbiesInDBSchema
 from api.schemas.query import PaginationSchema
@@ -41,14 +41,19 @@ class UserOperationsInterface:
         :param pagination: pagination parameters
         :return: paginated list of users
         """
+        self._pagination.configure(pagination)
         users, user_count = await run_concurrently(
             self._users_service.get_users(
-                limit=pagination.page_size,
+                limit=pagination.limit,
                 offset=pagination.offset,
+                cursor=pagination.cursor,
+            ),
+            self._pagination.count(
+                name="user",
+                total_count=self._users_service.total_count,
+                estimated_count=self._users_service.estimated_count,
             ),
-            self._users_service.total_count(),
         )
-        self._pagination.configure(pagination)
         return self._pagination.paginate(
             total=user_count,
             items=users,
@@ -76,7 +81,7 @@ class UserOperationsInterface:
         :return: access token
         """
         user = await self._users_service.get_user_by_username(username=username)
-        if not user or not verify_password(password, user.password):
+        if not user or not await self._verify_password(password, user):
             raise InvalidCredentialsError()
         return self._create_access_token(user)
 
@@ -142,5 +147,8 @@ class UserOperationsInterface:
         return TokenSchema(access_token=access_token, token_type=settings.token_type)
 
     @classmethod
-    def _verify_password(cls, password: str, user: UserInDBSchema) -> bool:
-        return verify_password(plain_password=password, hashed_password=user.password)
+    async def _verify_password(cls, password: str, user: UserInDBSchema) -> bool:
+        return await password_hasher.verify(
+            plain_password=password,
+            hashed_password=user.password,
+        )
@@ -1,4 +1,8 @@
 """Websocket message module."""
 
-from api.messages.connect import LobbyConnectMessage, LobbyDisconnectMessage
+from api.messages.connect import (
+    LobbyConnectMessage,
+    LobbyDisconnectMessage,
+    LobbyResyncMessage,
+)
 from api.messages.user import UserMessage
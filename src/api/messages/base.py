@@ -1,7 +1,10 @@
 from abc import ABC
 
+import orjson
+
 from api.enums.websocket import WebsocketMessageTypeEnum
 from api.schemas.websocket import BaseWebsocketMessageSchema
+from settings import settings
 
 
 class BaseWebsocketMessage(ABC):
@@ -15,12 +18,59 @@ class BaseWebsocketMessage(ABC):
             message=self.message,
             **kwargs,
         )
+        self._encoded: bytes | None = None
+
+    @property
+    def seq(self) -> int | None:
+        """
+        Get sequence number of the message in a room.
+
+        :return: sequence number or None if message was not sent to a room
+        """
+        return self._schema.seq
+
+    def set_sequence(self, seq: int) -> None:
+        """
+        Set sequence number of the message in a room.
+
+        :param seq: sequence number
+        :return:
+        """
+        self._schema.seq = seq
+        self._encoded = None
 
     def to_dict(self, exclude: set[str] | None = None):
         """
         Convert message to serializable dictionary.
 
+        Sequence number is omitted if the message was not sent to a room.
+
         :param exclude: fields to exclude
         :return: serializable message
         """
+        exclude = set(exclude or ())
+        if self._schema.seq is None:
+            exclude.add("seq")
         return self._schema.model_dump(mode="json", exclude=exclude)
+
+    def to_json(self) -> bytes:
+        """
+        Encode message to JSON bytes.
+
+        Message is encoded once, subsequent calls return the same buffer.
+
+        :return: encoded message
+        """
+        if self._encoded is None:
+            self._encoded = orjson.dumps(self.to_dict())
+        return self._encoded
+
+    def to_frame(self, binary: bool = settings.ws_binary_frames) -> str | bytes:
+        """
+        Convert message to websocket frame payload.
+
+        :param binary: whether to send message as binary frame
+        :return: frame payload, bytes for binary frames and string for text frames
+        """
+        encoded_message = self.to_json()
+        return encoded_message if binary else encoded_message.decode()
@@ -16,3 +16,8 @@ class LobbyDisconnectMessage(BaseWebsocketMessage):
     def __init__(self, player_id: int):
         self.message = f"Player {player_id} left the lobby."
         super().__init__()
+
+
+class LobbyResyncMessage(BaseWebsocketMessage):
+    message_type = WebsocketMessageTypeEnum.resync
+    message = "Missed messages are not available, fetch the lobby again."
@@ -0,0 +1,67 @@
+import functools
+from typing import Any, Mapping
+
+from fastapi.exceptions import ResponseValidationError
+from pydantic import TypeAdapter, ValidationError
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+from api.schemas.base import BaseSchema
+
+
+@functools.cache
+def get_response_adapter(schema: type[BaseSchema]) -> TypeAdapter:
+    """
+    Get type adapter of a response schema.
+
+    Adapters are built once per schema.
+
+    :param schema: response schema
+    :return: type adapter
+    """
+    return TypeAdapter(schema)
+
+
+class SchemaResponse(Response):
+    """
+    JSON response of a schema projected to response schema.
+
+    Content is validated to response schema from attributes, which drops
+    fields missing from it, and dumped to JSON bytes by pydantic-core.
+    Returned responses are not validated against `response_model` and not
+    encoded by `jsonable_encoder`, so `response_model` of a route only
+    documents the response.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        schema: type[BaseSchema],
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ):
+        self._schema = schema
+        super().__init__(
+            content=content,
+            status_code=status_code,
+            headers=headers,
+            background=background,
+        )
+
+    def render(self, content: Any) -> bytes:
+        """
+        Project content to response schema and dump it to JSON.
+
+        :param content: schema or other object with attributes of response schema
+        :raises ResponseValidationError: if content can not be projected
+        :return: JSON bytes
+        """
+        adapter = get_response_adapter(self._schema)
+        try:
+            response_content = adapter.validate_python(content, from_attributes=True)
+        except ValidationError as error:
+            raise ResponseValidationError(errors=error.errors(), body=content)
+        return adapter.dump_json(response_content, by_alias=True)
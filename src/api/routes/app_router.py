@@ -3,9 +3,11 @@
 from fastapi import APIRouter, Request
 from fastapi.responses import RedirectResponse
 
+from api.routes.internal import internal_router
 from api.routes.v1 import api_v1_router
 from api.routes.websocket import ws_router
 from exceptions.responses import INTERNAL_ERROR_RESPONSE, generate_responses
+from settings import settings
 
 api_router = APIRouter(prefix="/api")
 api_router.include_router(router=api_v1_router)
@@ -13,6 +15,8 @@ api_router.include_router(router=api_v1_router)
 app_router = APIRouter()
 app_router.include_router(router=api_router)
 app_router.include_router(router=ws_router)
+if settings.internal_routes_enabled:
+    app_router.include_router(router=internal_router)
 
 
 @app_router.get(
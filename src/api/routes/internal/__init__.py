@@ -0,0 +1,16 @@
+"""Internal routes module."""
+
+from fastapi import APIRouter
+
+from api.routes.internal.cache import cache_router
+from api.routes.internal.database import database_router
+from api.routes.internal.websocket import websocket_router
+
+internal_router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+    include_in_schema=False,
+)
+internal_router.include_router(database_router)
+internal_router.include_router(cache_router)
+internal_router.include_router(websocket_router)
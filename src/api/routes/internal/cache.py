@@ -0,0 +1,24 @@
+from fastapi import APIRouter
+
+from api.schemas.internal import CacheMetricsSchema
+from services.redis.cache import redis_cache
+
+cache_router = APIRouter(prefix="/cache")
+
+
+@cache_router.get("/hit-rates", response_model=CacheMetricsSchema)
+async def get_cache_metrics():
+    """
+    Get hit rates of in-process and Redis cache tiers.
+
+    :return: cache metrics
+    """
+    statistics = redis_cache.statistics
+    return CacheMetricsSchema(
+        local_hits=statistics.local_hits,
+        redis_hits=statistics.redis_hits,
+        misses=statistics.misses,
+        local_hit_rate=statistics.local_hit_rate,
+        redis_hit_rate=statistics.redis_hit_rate,
+        local_size=redis_cache.local_size,
+    )
@@ -0,0 +1,59 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from api.schemas.internal import (
+    PoolMetricsSchema,
+    SingleFlightMetricsSchema,
+    StatementTemplateMetricsSchema,
+)
+from database.dependencies import get_db_manager
+from database.manager import DatabaseConnectionManager
+from database.single_flight import single_flight
+from database.statement_templates import statement_templates
+
+database_router = APIRouter(prefix="/database")
+
+
+@database_router.get("/pools", response_model=dict[str, PoolMetricsSchema])
+async def get_pool_metrics(
+    db_manager: Annotated[DatabaseConnectionManager, Depends(get_db_manager)],
+):
+    """
+    Get connection pool metrics of primary and replica engines.
+
+    :param db_manager: database manager
+    :return: pool metrics by engine name
+    """
+    return db_manager.pool_metrics()
+
+
+@database_router.get("/single-flight", response_model=SingleFlightMetricsSchema)
+async def get_single_flight_metrics():
+    """
+    Get numbers of executed and deduplicated database reads.
+
+    :return: single flight metrics
+    """
+    return SingleFlightMetricsSchema(
+        executed=single_flight.executed_count,
+        deduplicated=single_flight.deduplicated_count,
+        in_flight=single_flight.in_flight_count,
+    )
+
+
+@database_router.get(
+    "/statement-templates",
+    response_model=StatementTemplateMetricsSchema,
+)
+async def get_statement_template_metrics():
+    """
+    Get hits and misses of select statement template cache.
+
+    :return: statement template metrics
+    """
+    return StatementTemplateMetricsSchema(
+        hits=statement_templates.hits,
+        misses=statement_templates.misses,
+        size=len(statement_templates),
+    )
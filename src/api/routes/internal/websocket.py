@@ -0,0 +1,25 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from api.dependencies.websocket import get_ws_connection_manager
+from api.schemas.internal import WebsocketMetricsSchema
+from api.services import ConnectionManager
+
+websocket_router = APIRouter(prefix="/websocket")
+
+
+@websocket_router.get("/rooms", response_model=WebsocketMetricsSchema)
+async def get_websocket_metrics(
+    conn_manager: Annotated[ConnectionManager, Depends(get_ws_connection_manager)],
+):
+    """
+    Get numbers of live rooms and connections of the current worker.
+
+    :param conn_manager: websocket connection manager
+    :return: websocket metrics
+    """
+    return WebsocketMetricsSchema(
+        rooms=conn_manager.room_count,
+        connections=conn_manager.connection_count,
+    )
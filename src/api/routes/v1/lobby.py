@@ -10,6 +10,7 @@ from api.dependencies import (
     get_pagination_parameters,
 )
 from api.interfaces import LobbyOperationsInterface
+from api.responses import SchemaResponse
 from api.routes.v1.player import player_router
 from api.schemas.authnetication import UserInTokenSchema
 from api.schemas.lobby import LobbyPlayerCreateSchema, PaginatedLobbiesSchema
@@ -42,11 +43,12 @@ async def get_lobbies(
     :param integration_interface: lobby operations interface
     :return: paginated list of lobbies
     """
-    return await integration_interface.get_lobbies(
+    lobbies = await integration_interface.get_lobbies(
         pagination=pagination,
         date=date,
         order=order,
     )
+    return SchemaResponse(lobbies, schema=PaginatedLobbiesSchema)
 
 
 @lobby_router.get(
@@ -70,7 +72,8 @@ async def get_lobby(
     :param integration_interface: lobby operations interface
     :return: lobby details with associated players
     """
-    return await integration_interface.get_lobby(lobby_id)
+    lobby = await integration_interface.get_lobby(lobby_id)
+    return SchemaResponse(lobby, schema=LobbyWithLinkShowSchema)
 
 
 @lobby_router.post(
@@ -95,7 +98,12 @@ async def create_lobby(
     :param integration_interface: integration interface
     :return: created lobby with lead player
     """
-    return await integration_interface.create_lobby(
+    lobby = await integration_interface.create_lobby(
         user_id=user.user_id,
         lobby_player_create=lobby_player_create_schema,
     )
+    return SchemaResponse(
+        lobby,
+        schema=LobbyWithLinkShowSchema,
+        status_code=status.HTTP_201_CREATED,
+    )
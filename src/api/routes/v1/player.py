@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, status
 
 from api.dependencies import check_current_user_in_lobby, get_current_user
 from api.interfaces import LobbyOperationsInterface
+from api.responses import SchemaResponse
 from api.schemas.authnetication import UserInTokenSchema
 from api.schemas.nested.player import PlayerWithLinkShowSchema
 from api.schemas.player import LobbyPlayerAddSchema
@@ -39,10 +40,11 @@ async def get_player(
     :param integration_interface: lobby operations interface
     :return: player with user and lobby informationW
     """
-    return await integration_interface.get_player(
+    player = await integration_interface.get_player(
         lobby_id=lobby_id,
         player_id=player_id,
     )
+    return SchemaResponse(player, schema=PlayerWithLinkShowSchema)
 
 
 @player_router.post(
@@ -71,8 +73,13 @@ async def create_player(
     :param integration_interface: integration interface
     :return: created player
     """
-    return await integration_interface.create_waiting_player(
+    player = await integration_interface.create_waiting_player(
         lobby_id=lobby_id,
         user_id=user.user_id,
         lobby_player_add=lobby_player_add,
     )
+    return SchemaResponse(
+        player,
+        schema=PlayerWithLinkShowSchema,
+        status_code=status.HTTP_201_CREATED,
+    )
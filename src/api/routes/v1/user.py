@@ -9,6 +9,7 @@ from api.dependencies import (
     get_pagination_parameters,
 )
 from api.interfaces import UserOperationsInterface
+from api.responses import SchemaResponse
 from api.schemas.nested.user import UserWithLobbiesShowSchema
 from api.schemas.query import PaginationSchema
 from api.schemas.user import (
@@ -46,7 +47,8 @@ async def get_users(
     :param integration_interface: user operations interface
     :return: paginated list of users
     """
-    return await integration_interface.get_users(pagination=pagination)
+    users = await integration_interface.get_users(pagination=pagination)
+    return SchemaResponse(users, schema=PaginatedUsersShowSchema)
 
 
 @user_router.get(
@@ -70,7 +72,8 @@ async def get_user_by_id(
     :param integration_interface: user operations interface
     :return: user with associated lobbies
     """
-    return await integration_interface.get_user(user_id)
+    user = await integration_interface.get_user(user_id)
+    return SchemaResponse(user, schema=UserWithLobbiesShowSchema)
 
 
 @user_router.post(
@@ -93,7 +96,12 @@ async def create_user(
     :param integration_interface: user operations interface
     :return: created user
     """
-    return await integration_interface.create_user(user_create)
+    user = await integration_interface.create_user(user_create)
+    return SchemaResponse(
+        user,
+        schema=UserShowSchema,
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @user_router.patch(
@@ -120,10 +128,11 @@ async def update_user(
     :param integration_interface: user operations interface
     :return: updated user
     """
-    return await integration_interface.update_user(
+    user = await integration_interface.update_user(
         user_id=user_id,
         user_update=user_update,
     )
+    return SchemaResponse(user, schema=UserShowSchema)
 
 
 @user_router.delete(
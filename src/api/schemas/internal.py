@@ -0,0 +1,39 @@
+from api.schemas.base import BaseSchema
+
+
+class PoolMetricsSchema(BaseSchema):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    checkouts: int
+    timeouts: int
+    total_wait_time: float
+    max_wait_time: float
+
+
+class SingleFlightMetricsSchema(BaseSchema):
+    executed: int
+    deduplicated: int
+    in_flight: int
+
+
+class StatementTemplateMetricsSchema(BaseSchema):
+    hits: int
+    misses: int
+    size: int
+
+
+class CacheMetricsSchema(BaseSchema):
+    local_hits: int
+    redis_hits: int
+    misses: int
+    local_hit_rate: float
+    redis_hit_rate: float
+    local_size: int
+
+
+class WebsocketMetricsSchema(BaseSchema):
+    rooms: int
+    connections: int
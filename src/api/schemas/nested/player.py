@@ -1,4 +1,4 @@
-from pydantic import Field
+from pydantic import AliasChoices, Field
 
 from api.enums import PlayerStateEnum
 from api.schemas.base import JoinLinkSchemaMixin
@@ -12,7 +12,9 @@ from exceptions.service.lobby import (
 
 
 class LobbyWithPlayersSchema(LobbyInDBSchema):
-    players: list[PlayerInDBSchema] = Field(validation_alias="player_associations")
+    players: list[PlayerInDBSchema] = Field(
+        validation_alias=AliasChoices("player_associations", "players"),
+    )
 
     def get_lead(self) -> PlayerInDBSchema:
         """
@@ -49,11 +51,17 @@ class LobbyWithLinkSchema(LobbyWithPlayersSchema, JoinLinkSchemaMixin):
         """
         Instantiate LobbyWithLinkSchema from lobby schema with players.
 
+        Lobby is already validated, so it is not validated again.
+
         :param base_lobby: lobby schema with players
         :param join_url: url to join lobby
         :return: lobby schema with players and join link
         """
-        return cls.model_validate({**base_lobby.model_dump(), "join_url": join_url})
+        return cls.model_construct(
+            _fields_set=base_lobby.model_fields_set | {"join_url"},
+            **dict(base_lobby),
+            join_url=join_url,
+        )
 
 
 class LobbyWithLinkShowSchema(LobbyShowSchema, JoinLinkSchemaMixin):
@@ -75,11 +83,17 @@ class PlayerWithLinkSchema(PlayerWithLobbyUserSchema, JoinLinkSchemaMixin):
         """
         Instantiate PlayerWithLinkSchema from player schema with lobby and user data.
 
+        Player is already validated, so it is not validated again.
+
         :param base_player: player schema with lobby and user data
         :param join_url: url to join lobby
         :return: player schema with lobby, use and join link
         """
-        return cls.model_validate({**base_player.model_dump(), "join_url": join_url})
+        return cls.model_construct(
+            _fields_set=base_player.model_fields_set | {"join_url"},
+            **dict(base_player),
+            join_url=join_url,
+        )
 
 
 class PlayerWithLinkShowSchema(PlayerShowSchema, JoinLinkSchemaMixin):
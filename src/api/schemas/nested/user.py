@@ -1,4 +1,4 @@
-from pydantic import Field, field_validator
+from pydantic import AliasChoices, Field, field_validator
 
 from api.schemas.lobby import LobbyInDBSchema, LobbyShowSchema
 from api.schemas.player import PlayerInDBSchema, PlayerShowSchema
@@ -8,7 +8,9 @@ from database.models.lobby import LobbyModel
 
 class UserWithLobbiesInDBSchema(UserInDBSchema):
     lobbies: list[LobbyInDBSchema]
-    players: list[PlayerInDBSchema] = Field(validation_alias="player_associations")
+    players: list[PlayerInDBSchema] = Field(
+        validation_alias=AliasChoices("player_associations", "players"),
+    )
 
     @field_validator("lobbies", mode="before")
     @classmethod
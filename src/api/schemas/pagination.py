@@ -2,18 +2,22 @@ from typing import Self
 
 from pydantic import model_validator
 
+from api.enums import CountStrategyEnum
 from api.schemas.base import BaseSchema
 from exceptions.service.schema import SchemaInputError
 
 
 class PaginatedResultsSchema(BaseSchema):
-    page: int
+    page: int | None
     page_size: int
-    page_count: int
-    total: int
+    page_count: int | None
+    total: int | None
+    count_strategy: CountStrategyEnum = CountStrategyEnum.exact
     items: list[BaseSchema]
     next: str | None
     previous: str | None
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
 
     @model_validator(mode="after")
     def check_number_of_items(self) -> Self:
@@ -1,18 +1,94 @@
+import base64
 from datetime import datetime
 from typing import Literal, Self
 
+import orjson
 from pydantic import field_validator, model_validator
 from pydantic_core.core_schema import ValidationInfo
 
-from api.enums import OrderQueryEnum
+from api.enums import CountStrategyEnum, CursorDirectionEnum, OrderQueryEnum
 from api.schemas.base import BaseSchema
-from exceptions.service.request import DateTimeQueryParamsError, OrderQueryParamsError
+from exceptions.service.request import (
+    CursorQueryParamsError,
+    DateTimeQueryParamsError,
+    OrderQueryParamsError,
+)
+
+# Fields of cursor in order of encoding
+CURSOR_FIELDS = ("direction", "order", "created_at", "id")
+
+
+class CursorSchema(BaseSchema):
+    direction: CursorDirectionEnum
+    order: OrderQueryEnum
+    created_at: datetime
+    id: int
+
+    def encode(self) -> str:
+        """
+        Encode cursor to an opaque URL safe string.
+
+        Sort order is encoded, so cursor is not used with another order.
+
+        :return: encoded cursor
+        """
+        payload = orjson.dumps(
+            [self.direction.value, self.order.value, self.created_at, self.id],
+        )
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> Self:
+        """
+        Decode cursor from an opaque string.
+
+        :param cursor: encoded cursor
+        :return: cursor
+        """
+        padded_cursor = cursor + "=" * (-len(cursor) % 4)
+        try:
+            cursor_values = orjson.loads(base64.urlsafe_b64decode(padded_cursor))
+        except ValueError:
+            raise CursorQueryParamsError()
+        try:
+            return cls.model_validate(
+                dict(zip(CURSOR_FIELDS, cursor_values, strict=True)),
+            )
+        except (ValueError, TypeError):
+            raise CursorQueryParamsError()
+
+    def check_order(self, order: OrderQueryEnum) -> None:
+        """
+        Check that cursor was created for the sort order.
+
+        :param order: sort order of requested page
+        :raises CursorQueryParamsError: if cursor has another order
+        :return:
+        """
+        if self.order is not order:
+            raise CursorQueryParamsError()
 
 
 class PaginationSchema(BaseSchema):
     page: int
     page_size: int
     offset: int = 0
+    cursor: CursorSchema | None = None
+    count_strategy: CountStrategyEnum = CountStrategyEnum.exact
+
+    @property
+    def limit(self) -> int:
+        """
+        Get number of rows to fetch for the page.
+
+        With cursor or without exact total count one extra row is fetched
+        to check if there are more rows.
+
+        :return: number of rows
+        """
+        if self.cursor is None and self.count_strategy is CountStrategyEnum.exact:
+            return self.page_size
+        return self.page_size + 1
 
     @model_validator(mode="before")
     @classmethod
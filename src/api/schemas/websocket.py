@@ -5,6 +5,7 @@ from api.schemas.base import BaseSchema
 class BaseWebsocketMessageSchema(BaseSchema):
     message_type: WebsocketMessageTypeEnum
     message: str
+    seq: int | None = None
 
 
 class UserWebsocketMessageSchema(BaseWebsocketMessageSchema):
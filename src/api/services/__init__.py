@@ -4,4 +4,11 @@ from api.services.lobby import LobbyService
 from api.services.player import PlayerService
 from api.services.route import RouteService
 from api.services.user import UserService
-from api.services.websocket import Connection, ConnectionManager, Room, ws_conn_manager
+from api.services.websocket import (
+    Connection,
+    ConnectionManager,
+    InMemoryBackplane,
+    RedisBackplane,
+    Room,
+    ws_conn_manager,
+)
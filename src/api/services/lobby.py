@@ -7,9 +7,12 @@ from pydantic import ValidationError
 from api.enums.query import OrderQueryEnum
 from api.schemas.lobby import LobbyCreateSchema, LobbyInDBSchema
 from api.schemas.nested.player import LobbyWithPlayersSchema
+from api.schemas.query import CursorSchema
 from api.services.mixins import DBModelValidatorMixin
 from database.dals.relational_dals.lobby import LobbyDAL
+from database.single_flight import single_flight
 from exceptions.service.schema import SchemaValidationError
+from services.redis.cache import redis_cache
 
 
 class LobbyService(DBModelValidatorMixin):
@@ -26,6 +29,7 @@ class LobbyService(DBModelValidatorMixin):
         start: datetime | None = None,
         end: datetime | None = None,
         order: OrderQueryEnum = OrderQueryEnum.desc,
+        cursor: CursorSchema | None = None,
     ) -> list[LobbyInDBSchema]:
         """
         Get lobbies.
@@ -35,6 +39,7 @@ class LobbyService(DBModelValidatorMixin):
         :param start: start date
         :param end: end date
         :param order: order of lobbies by create_at field, descending by default
+        :param cursor: cursor to fetch lobbies after or before instead of offset
         :return: lobbies
         """
         lobbies_in_db = await self._lobby_dal.get_lobbies(
@@ -43,9 +48,16 @@ class LobbyService(DBModelValidatorMixin):
             start_date=start,
             end_date=end,
             order=order,
+            cursor=cursor,
         )
         return self.validate(lobbies_in_db, LobbyInDBSchema)
 
+    @redis_cache.cached(
+        prefix="lobby",
+        schema=LobbyWithPlayersSchema,
+        tags=("lobby:{lobby_id}",),
+    )
+    @single_flight.coalesce
     async def get_lobby_by_id(self, lobby_id: int) -> LobbyWithPlayersSchema | None:
         """
         Get lobby by id.
@@ -77,3 +89,11 @@ class LobbyService(DBModelValidatorMixin):
         :return: total number of lobbies
         """
         return await self._lobby_dal.total_count()
+
+    async def estimated_count(self) -> int:
+        """
+        Get estimated number of lobbies.
+
+        :return: estimated number of lobbies
+        """
+        return await self._lobby_dal.estimated_count()
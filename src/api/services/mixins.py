@@ -1,28 +1,48 @@
-from typing import Iterable
+import functools
+from typing import Iterable, Mapping
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import Row
 
 from api.schemas.base import BaseSchema
 from database.base_model import BaseDBModel
 from exceptions.service.schema import SchemaValidationError
 
+DB_ROW_TYPE = BaseDBModel | Row | Mapping
+
+
+@functools.cache
+def get_list_adapter(schema: type[BaseSchema]) -> TypeAdapter:
+    """
+    Get type adapter that validates a list of rows to Pydantic models.
+
+    Adapters are built once per schema.
+
+    :param schema: Pydantic model
+    :return: type adapter
+    """
+    return TypeAdapter(list[schema])
+
 
 class DBModelValidatorMixin:
     @classmethod
     def validate(
         cls,
-        db_data: BaseDBModel | Iterable[BaseDBModel] | None,
+        db_data: DB_ROW_TYPE | Iterable[DB_ROW_TYPE] | None,
         schema: type[BaseSchema],
     ):
         """
         Validate an instance or a list of SQLAlchemy models to Pydantic model.
 
-        :param db_data: instance or list of SQLAlchemy models
+        Rows and mappings of Core queries are validated too, which skips
+        attribute access of SQLAlchemy models.
+
+        :param db_data: instance or list of SQLAlchemy models, rows or mappings
         :param schema: Pydantic model
         :return: instance or list of Pydantic models
         """
         if db_data is not None:
-            if isinstance(db_data, BaseDBModel):
+            if isinstance(db_data, DB_ROW_TYPE):
                 return cls._validate_db_model(
                     db_model=db_data,
                     schema=schema,
@@ -35,21 +55,26 @@ class DBModelValidatorMixin:
     @classmethod
     def _validate_db_model(
         cls,
-        db_model: BaseDBModel,
+        db_model: DB_ROW_TYPE,
         schema: type[BaseSchema],
     ) -> BaseSchema:
         try:
-            return schema.model_validate(db_model)
+            return schema.model_validate(db_model, from_attributes=True)
         except ValidationError as error:
             raise SchemaValidationError(error) from error
 
     @classmethod
     def _validate_db_models(
         cls,
-        db_models: Iterable[BaseDBModel],
+        db_models: Iterable[DB_ROW_TYPE],
         schema: type[BaseSchema],
     ) -> list[BaseSchema]:
+        if not isinstance(db_models, list):
+            db_models = list(db_models)
         try:
-            return [schema.model_validate(model) for model in db_models]
+            return get_list_adapter(schema).validate_python(
+                db_models,
+                from_attributes=True,
+            )
         except ValidationError as error:
             raise SchemaValidationError(error) from error
@@ -1,29 +1,105 @@
+import logging
+from typing import Awaitable, Callable
+
 from fastapi import Request
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
-from api.schemas.base import BaseSchema
+from api.enums import CountStrategyEnum, CursorDirectionEnum, OrderQueryEnum
+from api.schemas.base import BaseSchema, CreatedAtSchemaMixin, IDSchemaMixin
 from api.schemas.pagination import PaginatedResultsSchema
-from api.schemas.query import PaginationSchema
+from api.schemas.query import CursorSchema, PaginationSchema
 from exceptions.service.pagination import PaginationServiceNotConfiguredError
+from exceptions.service.redis import RedisConnectionError
+from services.redis.manager import redis_manager
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+COUNTER_TYPE = Callable[[], Awaitable[int]]
+
+
+class TotalCountCache:
+    """
+    Total numbers of rows cached in Redis.
+
+    Cached numbers expire after `ttl` seconds, so they may lag behind inserted
+    and deleted rows for that long. If Redis is not available, rows are
+    counted without cache. Shared Redis client is used by default.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis | None = None,
+        ttl: int = settings.pagination_count_cache_ttl,
+    ):
+        self._redis_client = redis_client
+        self._ttl = ttl
+
+    async def get_or_count(self, name: str, counter: COUNTER_TYPE) -> int:
+        """
+        Get cached number of rows or count and cache it.
+
+        :param name: name of counted rows
+        :param counter: coroutine function that counts rows
+        :return: number of rows
+        """
+        key = f"{settings.redis_namespace}:count:{name}"
+        try:
+            cached_count = await self._get_client().get(key)
+        except (RedisError, RedisConnectionError) as error:
+            logger.warning("Total count cache is not available: %s", error)
+            return await counter()
+        if cached_count is not None:
+            return int(cached_count)
+
+        total = await counter()
+        try:
+            await self._get_client().set(key, total, ex=self._ttl)
+        except (RedisError, RedisConnectionError) as error:  # noqa: WPS440
+            logger.warning("Total count cache is not available: %s", error)
+        return total
+
+    def _get_client(self) -> Redis:
+        return self._redis_client or redis_manager.client
+
+
+total_count_cache = TotalCountCache()
 
 
 class PaginationService:
+    _count_cache = total_count_cache
+
     def __init__(self, request: Request):
         self.is_configured = False
         self._request = request
         self._page: int | None = None
         self._page_size: int | None = None
         self._offset: int | None = None
+        self._cursor: CursorSchema | None = None
+        self._order = OrderQueryEnum.asc
+        self._count_strategy = CountStrategyEnum.exact
 
-    def configure(self, pagination: PaginationSchema) -> None:
+    def configure(
+        self,
+        pagination: PaginationSchema,
+        order: OrderQueryEnum = OrderQueryEnum.asc,
+    ) -> None:
         """
         Configure the service with pagination information.
 
         :param pagination: pagination information
+        :param order: sort order of resource list, encoded in cursors
         :return:
         """
+        if pagination.cursor is not None:
+            pagination.cursor.check_order(order)
         self._page = pagination.page
         self._page_size = pagination.page_size
         self._offset = pagination.offset
+        self._cursor = pagination.cursor
+        self._order = order
+        self._count_strategy = pagination.count_strategy
         self.is_configured = True
 
     def check_configuration(self, raise_error: bool = False) -> bool:
@@ -37,56 +113,135 @@ class PaginationService:
             raise PaginationServiceNotConfiguredError()
         return self.is_configured
 
+    async def count(
+        self,
+        name: str,
+        total_count: COUNTER_TYPE,
+        estimated_count: COUNTER_TYPE,
+    ) -> int | None:
+        """
+        Count total number of resource instances with configured strategy.
+
+        :param name: resource name used as a cache key
+        :param total_count: coroutine function that counts instances exactly
+        :param estimated_count: coroutine function that estimates instances
+        :return: number of instances or None if counting is skipped
+        """
+        self.check_configuration(raise_error=True)
+        if self._count_strategy is CountStrategyEnum.skipped:
+            return None
+        if self._count_strategy is CountStrategyEnum.estimated:
+            return await estimated_count()
+        if self._count_strategy is CountStrategyEnum.cached:
+            return await self._count_cache.get_or_count(name, total_count)
+        return await total_count()
+
     def paginate(
         self,
-        total: int,
+        total: int | None,
         items: list[BaseSchema],
         result_schema: type[PaginatedResultsSchema],
     ):
         """
         Create a page with a resource list.
 
-        :param total: total number of resource instances
+        In cursor mode or without exact total, items are expected to contain
+        one extra item fetched to check if there are more items. Page number
+        is not known in cursor mode.
+
+        Cursors are created if items have `created_at` and `id` fields.
+
+        :param total: total number of resource instances or None if not counted
         :param items: list of Pydantic models
         :param result_schema: pagination Pydantic model
         :return: instance of pagination Pydnatic model
         """
         self.check_configuration(raise_error=True)
+        items, has_next, has_previous = self._split_page(total, items)
+        next_cursor = None
+        previous_cursor = None
+        if has_next:
+            next_cursor = self._create_cursor(CursorDirectionEnum.next, items)
+        if has_previous:
+            previous_cursor = self._create_cursor(CursorDirectionEnum.previous, items)
         return result_schema(
-            page=self._page,
+            page=self._page if self._cursor is None else None,
             page_size=self._page_size,
             page_count=self._calculate_page_count(total),
             total=total,
+            count_strategy=self._count_strategy,
             items=items,
-            next=self._get_next_page_url(total),
-            previous=self._get_previous_page_url(),
+            next=self._get_next_url(has_next, next_cursor),
+            previous=self._get_previous_url(has_previous, previous_cursor),
+            next_cursor=next_cursor,
+            previous_cursor=previous_cursor,
         )
 
-    def _get_next_page_url(self, total: int) -> str | None:
-        next_page_number = self._calculate_next_page_number(total)
-        if next_page_number is not None:
-            return self._format_page_number(next_page_number)
+    def _split_page(
+        self,
+        total: int | None,
+        items: list[BaseSchema],
+    ) -> tuple[list[BaseSchema], bool, bool]:
+        if self._cursor is None:
+            has_previous = self._page > 1
+            if self._count_strategy is CountStrategyEnum.exact:
+                return items, self._page * self._page_size < total, has_previous
+            has_next = len(items) > self._page_size
+            return items[: self._page_size], has_next, has_previous
+
+        has_more = len(items) > self._page_size
+        if self._cursor.direction is CursorDirectionEnum.next:
+            return items[: self._page_size], has_more, True
+        return items[-self._page_size :], True, has_more  # noqa: E203
+
+    def _create_cursor(
+        self,
+        direction: CursorDirectionEnum,
+        items: list[BaseSchema],
+    ) -> str | None:
+        if not items:
+            return None
+        item = items[-1] if direction is CursorDirectionEnum.next else items[0]
+        if not isinstance(item, CreatedAtSchemaMixin):
+            return None
+        if not isinstance(item, IDSchemaMixin):
+            return None
+        cursor = CursorSchema(
+            direction=direction,
+            order=self._order,
+            created_at=item.created_at,
+            id=item.id,
+        )
+        return cursor.encode()
 
-    def _get_previous_page_url(self) -> str | None:
-        previous_page_number = self._calculate_previous_page_number()
-        if previous_page_number is not None:
-            return self._format_page_number(previous_page_number)
+    def _get_next_url(self, has_next: bool, next_cursor: str | None) -> str | None:
+        if self._cursor is not None:
+            return self._format_cursor(next_cursor)
+        if has_next:
+            return self._format_page_number(self._page + 1)
 
-    def _get_base_url(self) -> str:
-        return str(self._request.url).split("?")[0]
+    def _get_previous_url(
+        self,
+        has_previous: bool,
+        previous_cursor: str | None,
+    ) -> str | None:
+        if self._cursor is not None:
+            return self._format_cursor(previous_cursor)
+        if has_previous:
+            return self._format_page_number(self._page - 1)
 
     def _format_page_number(self, page_number: int) -> str:
-        self._request.url.include_query_params()
-        base_url = self._get_base_url()
-        return f"{base_url}?page={page_number}&page_size={self._page_size}"
-
-    def _calculate_page_count(self, total: int) -> int:
-        return (total + self._page_size - 1) // self._page_size
-
-    def _calculate_next_page_number(self, total: int) -> int | None:
-        if self._page * self._page_size < total:
-            return self._page + 1
-
-    def _calculate_previous_page_number(self) -> int | None:
-        if self._page > 1:
-            return self._page - 1
+        url = self._request.url.remove_query_params(["page", "cursor"])
+        url = url.include_query_params(page=page_number, page_size=self._page_size)
+        return str(url)
+
+    def _format_cursor(self, cursor: str | None) -> str | None:
+        if cursor is None:
+            return None
+        url = self._request.url.remove_query_params(["page", "cursor"])
+        url = url.include_query_params(cursor=cursor, page_size=self._page_size)
+        return str(url)
+
+    def _calculate_page_count(self, total: int | None) -> int | None:
+        if total is not None:
+            return (total + self._page_size - 1) // self._page_size
@@ -9,8 +9,10 @@ from api.schemas.player import PlayerCreateSchema, PlayerInDBSchema
 from api.services.mixins import DBModelValidatorMixin
 from cutom_types.player import UPDATE_PLAYER_STATE_TYPE
 from database.dals import PlayerDAL
+from database.single_flight import single_flight
 from exceptions.service.player import UpdatePlayerStateInvalidError
 from exceptions.service.schema import SchemaValidationError
+from services.redis.cache import redis_cache
 
 
 class PlayerService(DBModelValidatorMixin):
@@ -20,6 +22,12 @@ class PlayerService(DBModelValidatorMixin):
     ):
         self._player_dal = player_dal
 
+    @redis_cache.cached(
+        prefix="player",
+        schema=PlayerWithLobbyUserSchema,
+        tags=("player:{player_id}", "user:{result.user_id}"),
+    )
+    @single_flight.coalesce
     async def get_player_by_id(
         self,
         player_id: int,
@@ -51,6 +59,19 @@ class PlayerService(DBModelValidatorMixin):
         )
         return self.validate(player_in_db, PlayerInDBSchema)
 
+    async def check_user_in_lobby(self, user_id: int, lobby_id: int) -> bool:
+        """
+        Check if user has a player in the lobby.
+
+        :param user_id: user id
+        :param lobby_id: lobby id
+        :return: whether user has a player in the lobby
+        """
+        return await self._player_dal.check_user_in_lobby(
+            user_id=user_id,
+            lobby_id=lobby_id,
+        )
+
     async def update_state_by_lobby_id(
         self,
         lobby_id: int,
@@ -2,10 +2,14 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from api.authnetication import password_hasher
 from api.schemas.nested.user import UserWithLobbiesInDBSchema
+from api.schemas.query import CursorSchema
 from api.schemas.user import UserCreateSchema, UserInDBSchema, UserUpdateSchema
 from api.services.mixins import DBModelValidatorMixin
 from database.dals import UserDAL
+from database.single_flight import single_flight
+from services.redis.cache import redis_cache
 
 
 class UserService(DBModelValidatorMixin):
@@ -15,20 +19,33 @@ class UserService(DBModelValidatorMixin):
     ):
         self._user_dal = user_dal
 
-    async def get_users(self, limit: int, offset: int = 0) -> list[UserInDBSchema]:
+    async def get_users(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: CursorSchema | None = None,
+    ) -> list[UserInDBSchema]:
         """
         Get users.
 
         :param limit: limit of users to fetch
         :param offset: offset
+        :param cursor: cursor to fetch users after or before instead of offset
         :return: users
         """
         users_in_db = await self._user_dal.get_users(
             limit=limit,
             offset=offset,
+            cursor=cursor,
         )
         return self.validate(users_in_db, UserInDBSchema)
 
+    @redis_cache.cached(
+        prefix="user",
+        schema=UserWithLobbiesInDBSchema,
+        tags=("user:{user_id}",),
+    )
+    @single_flight.coalesce
     async def get_user_by_id(self, user_id: int) -> UserWithLobbiesInDBSchema | None:
         """
         Get user by id with associated Lobbies.
@@ -53,10 +70,15 @@ class UserService(DBModelValidatorMixin):
         """
         Create user.
 
-        :param user_create: data to create user
+        Password is hashed before the user is saved.
+
+        :param user_create: data to create user with plain password
         :return: created user
         """
-        created_user = await self._user_dal.create_user(user_create)
+        hashed_password = await password_hasher.hash(user_create.password)
+        created_user = await self._user_dal.create_user(
+            user_create.model_copy(update={"password": hashed_password}),
+        )
         return self.validate(created_user, UserInDBSchema)
 
     async def update_user_by_id(
@@ -94,3 +116,11 @@ class UserService(DBModelValidatorMixin):
         :return: total number of users
         """
         return await self._user_dal.total_count()
+
+    async def estimated_count(self) -> int:
+        """
+        Get estimated number of users.
+
+        :return: estimated number of users
+        """
+        return await self._user_dal.estimated_count()
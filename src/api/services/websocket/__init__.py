@@ -1,5 +1,10 @@
 """Websocket service module."""
 
+from api.services.websocket.backplane import (
+    BaseBackplane,
+    InMemoryBackplane,
+    RedisBackplane,
+)
 from api.services.websocket.connection import Connection
 from api.services.websocket.manager import ConnectionManager, ws_conn_manager
 from api.services.websocket.room import Room
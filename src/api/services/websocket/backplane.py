@@ -0,0 +1,260 @@
+import asyncio
+import contextlib
+import logging
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+BACKPLANE_HANDLER_TYPE = Callable[[bytes], Awaitable[None]]
+
+
+class BaseBackplane(ABC):
+    """
+    Backplane that delivers room messages to every worker.
+
+    Each worker subscribes to channels of rooms that have local connections
+    and fans out received messages to them.
+    """
+
+    @abstractmethod
+    async def publish(self, channel: str, payload: bytes) -> None:
+        """
+        Publish payload to a channel.
+
+        :param channel: channel name
+        :param payload: encoded message
+        :return:
+        """
+        pass
+
+    @abstractmethod
+    async def subscribe(self, channel: str, handler: BACKPLANE_HANDLER_TYPE) -> None:
+        """
+        Subscribe to a channel.
+
+        :param channel: channel name
+        :param handler: coroutine function called with each published payload
+        :return:
+        """
+        pass
+
+    @abstractmethod
+    async def unsubscribe(self, channel: str, handler: BACKPLANE_HANDLER_TYPE) -> None:
+        """
+        Unsubscribe from a channel.
+
+        :param channel: channel name
+        :param handler: handler passed on subscription
+        :return:
+        """
+        pass
+
+    @abstractmethod
+    async def next_sequence(self, channel: str) -> int:
+        """
+        Get next message sequence number of a channel.
+
+        Sequence numbers increase monotonically across all workers.
+
+        :param channel: channel name
+        :return: sequence number
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Close backplane.
+
+        :return:
+        """
+        pass
+
+
+class InMemoryBackplane(BaseBackplane):
+    """
+    Backplane for a single worker.
+
+    Payloads are passed to subscribed handlers of the same process. Several
+    connection managers can share an instance to emulate several workers.
+    """
+
+    def __init__(self):
+        self._handlers: dict[str, list[BACKPLANE_HANDLER_TYPE]] = {}
+        self._sequences: dict[str, int] = {}
+
+    async def publish(self, channel: str, payload: bytes) -> None:
+        """
+        Publish payload to handlers subscribed to a channel.
+
+        :param channel: channel name
+        :param payload: encoded message
+        :return:
+        """
+        for handler in self._handlers.get(channel, []):
+            await handler(payload)
+
+    async def subscribe(self, channel: str, handler: BACKPLANE_HANDLER_TYPE) -> None:
+        """
+        Subscribe to a channel.
+
+        :param channel: channel name
+        :param handler: coroutine function called with each published payload
+        :return:
+        """
+        self._handlers.setdefault(channel, []).append(handler)
+
+    async def unsubscribe(self, channel: str, handler: BACKPLANE_HANDLER_TYPE) -> None:
+        """
+        Unsubscribe handler from a channel.
+
+        :param channel: channel name
+        :param handler: handler passed on subscription
+        :return:
+        """
+        channel_handlers = self._handlers.get(channel, [])
+        if handler in channel_handlers:
+            channel_handlers.remove(handler)
+        if not channel_handlers:
+            self._handlers.pop(channel, None)
+            self._sequences.pop(channel, None)
+
+    async def next_sequence(self, channel: str) -> int:
+        """
+        Increment sequence number of a channel.
+
+        Sequence numbers are kept only while the channel has subscribers, since
+        messages of other channels are not received by anyone.
+
+        :param channel: channel name
+        :return: sequence number
+        """
+        sequence = self._sequences.get(channel, 0) + 1
+        if channel in self._handlers:
+            self._sequences[channel] = sequence
+        return sequence
+
+    async def close(self) -> None:
+        """
+        Remove all handlers and sequence numbers.
+
+        :return:
+        """
+        self._handlers.clear()
+        self._sequences.clear()
+
+
+class RedisBackplane(BaseBackplane):
+    """
+    Backplane shared by workers over Redis pub/sub.
+
+    If subscription connection fails, listener reconnects after a delay and
+    subscribes to channels of the worker again.
+    """
+
+    def __init__(self, redis_client: Redis):
+        self._redis_client = redis_client
+        self._pubsub: PubSub = redis_client.pubsub(ignore_subscribe_messages=True)
+        self._handlers: dict[str, BACKPLANE_HANDLER_TYPE] = {}
+        self._listener: asyncio.Task | None = None
+
+    async def publish(self, channel: str, payload: bytes) -> None:
+        """
+        Publish payload to Redis channel.
+
+        :param channel: channel name
+        :param payload: encoded message
+        :return:
+        """
+        await self._redis_client.publish(channel, payload)
+
+    async def subscribe(self, channel: str, handler: BACKPLANE_HANDLER_TYPE) -> None:
+        """
+        Subscribe to Redis channel and start listening if not started yet.
+
+        :param channel: channel name
+        :param handler: coroutine function called with each published payload
+        :return:
+        """
+        self._handlers[channel] = handler
+        await self._pubsub.subscribe(channel)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def unsubscribe(self, channel: str, handler: BACKPLANE_HANDLER_TYPE) -> None:
+        """
+        Unsubscribe from Redis channel.
+
+        :param channel: channel name
+        :param handler: handler passed on subscription
+        :return:
+        """
+        self._handlers.pop(channel, None)
+        await self._pubsub.unsubscribe(channel)
+
+    async def next_sequence(self, channel: str) -> int:
+        """
+        Increment sequence number of a channel in Redis.
+
+        Counter expires after default expiration time without messages.
+
+        :param channel: channel name
+        :return: sequence number
+        """
+        sequence_key = f"{channel}:seq"
+        async with self._redis_client.pipeline(transaction=True) as pipe:
+            pipe.incr(sequence_key)
+            if settings.redis_default_expiration_time:
+                pipe.expire(sequence_key, settings.redis_default_expiration_time)
+            results = await pipe.execute()
+        return results[0]
+
+    async def close(self) -> None:
+        """
+        Stop listening and close Redis subscription.
+
+        :return:
+        """
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        await self._pubsub.aclose()
+        await self._redis_client.aclose()
+
+    async def _listen(self) -> None:
+        while self._handlers:
+            try:
+                await self._receive()
+            except RedisError as error:
+                # Messages published while disconnected are lost.
+                logger.warning("Backplane is not available: %s", error)
+                await asyncio.sleep(settings.redis_socket_timeout)
+
+    async def _receive(self) -> None:
+        await self._pubsub.subscribe(*self._handlers)
+        async for message in self._pubsub.listen():
+            await self._handle_message(message)
+
+    async def _handle_message(self, message: dict) -> None:
+        channel = message["channel"]
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        handler = self._handlers.get(channel)
+        if handler is None:
+            return
+        try:
+            await handler(message["data"])
+        except Exception as error:
+            logger.exception(
+                f"Backplane handler failed, channel: {channel}",
+                exc_info=error,
+            )
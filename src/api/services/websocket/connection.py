@@ -1,18 +1,39 @@
+import asyncio
+import logging
 from types import TracebackType
 from typing import AsyncGenerator
 
 from fastapi import WebSocket, status
 from starlette.websockets import WebSocketDisconnect, WebSocketState
 
+from api.enums.websocket import WebsocketOverflowPolicyEnum
 from api.messages.base import BaseWebsocketMessage
 from exceptions.service.base import BaseServiceError
-from exceptions.service.websocket import WebsocketInvalidStateError
+from exceptions.service.websocket import (
+    WebsocketInvalidStateError,
+    WebsocketSlowConsumerError,
+)
+from settings import settings
+
+logger = logging.getLogger(__name__)
 
 
 class Connection:
-    def __init__(self, connection_id: str, websocket: WebSocket):
+    def __init__(
+        self,
+        connection_id: str,
+        websocket: WebSocket,
+        queue_size: int = settings.ws_send_queue_size,
+        overflow_policy: WebsocketOverflowPolicyEnum = settings.ws_overflow_policy,
+    ):
         self._id = connection_id
         self._websocket = websocket
+        self._overflow_policy = overflow_policy
+        self._queue: asyncio.Queue[str | bytes | BaseServiceError] = asyncio.Queue(
+            maxsize=queue_size,
+        )
+        self._writer: asyncio.Task | None = None
+        self._dropped_count = 0
 
     @property
     def id(self) -> str:
@@ -32,13 +53,32 @@ class Connection:
         """
         return self._websocket.client_state
 
+    @property
+    def pending_count(self) -> int:
+        """
+        Get number of messages waiting to be sent.
+
+        :return: number of queued messages
+        """
+        return self._queue.qsize()
+
+    @property
+    def dropped_count(self) -> int:
+        """
+        Get number of messages dropped because the queue was full.
+
+        :return: number of dropped messages
+        """
+        return self._dropped_count
+
     async def __aenter__(self):
         """
-        Connect to websocket.
+        Connect to websocket and start the writer task.
 
         :return:
         """
         await self._websocket.accept()
+        self._writer = asyncio.create_task(self._write())
         return self
 
     async def __aexit__(
@@ -48,13 +88,14 @@ class Connection:
         tb: TracebackType | None,
     ):
         """
-        Disconnect from websocket.
+        Stop the writer task and disconnect from websocket.
 
         :param exc_type: error type if present
         :param exc: error if present
         :param tb: traceback if present
         :return:
         """
+        await self._stop_writer()
         code = getattr(exc, "ws_status_code", BaseServiceError.ws_status_code)
         reason = getattr(exc, "detail", BaseServiceError.detail)
         await self.disconnect(code=code, reason=reason)
@@ -95,8 +136,84 @@ class Connection:
         :param message: message
         :return:
         """
+        await self.send_frame(message.to_frame())
+
+    async def send_frame(self, frame: str | bytes) -> None:
+        """
+        Send encoded message to websocket connection.
+
+        Bytes are sent as binary frame, strings are sent as text frame.
+
+        :param frame: encoded message
+        :return:
+        """
         self._check_client_state()
-        await self._websocket.send_json(message.to_dict())
+        if isinstance(frame, bytes):
+            await self._websocket.send_bytes(frame)
+        else:
+            await self._websocket.send_text(frame)
+
+    def enqueue(self, frame: str | bytes) -> None:
+        """
+        Put encoded message to the outbound queue without waiting for it to be sent.
+
+        If the queue is full, configured overflow policy is applied.
+
+        :param frame: encoded message
+        :return:
+        """
+        try:
+            self._queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self._handle_overflow(frame)
+
+    def _handle_overflow(self, frame: str | bytes) -> None:
+        match self._overflow_policy:
+            case WebsocketOverflowPolicyEnum.drop_oldest:
+                self._queue.get_nowait()
+                self._queue.put_nowait(frame)
+            case WebsocketOverflowPolicyEnum.drop_newest:
+                pass  # noqa: WPS420
+            case WebsocketOverflowPolicyEnum.disconnect:
+                self._clear_queue()
+                self._queue.put_nowait(WebsocketSlowConsumerError())
+        self._dropped_count += 1
+        logger.warning(
+            "Outbound queue of connection {0} is full, policy: {1}".format(
+                self._id,
+                self._overflow_policy.value,
+            ),
+        )
+
+    def _clear_queue(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._dropped_count += 1
+
+    async def _write(self) -> None:
+        while True:
+            queued_item = await self._queue.get()
+            if isinstance(queued_item, BaseServiceError):
+                await self.disconnect(
+                    code=queued_item.ws_status_code,
+                    reason=queued_item.detail,
+                )
+                break
+            try:
+                await self.send_frame(queued_item)
+            except (WebsocketInvalidStateError, WebSocketDisconnect, RuntimeError):
+                logger.info(f"Connection {self._id} closed, writer stopped")
+                break
+
+    async def _stop_writer(self) -> None:
+        if self._writer is None:
+            return
+        self._writer.cancel()
+        try:
+            await self._writer
+        except asyncio.CancelledError:
+            pass  # noqa: WPS420
+        self._writer = None
 
     def _check_client_state(
         self,
@@ -1,16 +1,77 @@
+import asyncio
+import contextlib
+import logging
+import time
+
 from fastapi import WebSocket
 
+from api.services.websocket.backplane import BaseBackplane, InMemoryBackplane
 from api.services.websocket.connection import Connection
 from api.services.websocket.room import Room
 from exceptions.service.websocket import (
     WebsocketRoomExistsError,
     WebsocketRoomNotExistsError,
 )
+from settings import settings
+
+logger = logging.getLogger(__name__)
 
 
 class ConnectionManager:
-    def __init__(self):
+    def __init__(self, backplane: BaseBackplane | None = None):
         self._rooms: dict[str | int, Room] = {}
+        self._backplane = backplane or InMemoryBackplane()
+        self._room_collector: asyncio.Task | None = None
+
+    @property
+    def room_count(self) -> int:
+        """
+        Get number of live rooms on the current worker.
+
+        :return: number of rooms
+        """
+        return len(self._rooms)
+
+    @property
+    def connection_count(self) -> int:
+        """
+        Get number of live connections on the current worker.
+
+        :return: number of connections
+        """
+        return sum(room.connection_count for room in self._rooms.values())
+
+    @property
+    def backplane(self) -> BaseBackplane:
+        """
+        Get backplane that shares room messages between workers.
+
+        :return: backplane
+        """
+        return self._backplane
+
+    async def set_backplane(self, backplane: BaseBackplane) -> None:
+        """
+        Replace backplane.
+
+        Must be called before any room is created, e.g. on application startup.
+
+        :param backplane: backplane
+        :return:
+        """
+        await self._backplane.close()
+        self._backplane = backplane
+
+    async def close(self) -> None:
+        """
+        Stop room collector, unsubscribe rooms and close backplane.
+
+        :return:
+        """
+        await self.stop_room_collector()
+        for room in self._rooms.values():
+            await room.unsubscribe()
+        await self._backplane.close()
 
     def get_room(self, room_id: str | int, raise_error: bool = False) -> Room | None:
         """
@@ -31,6 +92,7 @@ class ConnectionManager:
         connection_id: str | int,
         websocket: WebSocket,
         disconnect_existing: bool = True,
+        since: int | None = None,
     ) -> Connection:
         """
         Create a connection in the room.
@@ -41,6 +103,7 @@ class ConnectionManager:
         :param connection_id: connection id
         :param websocket: websocket connection
         :param disconnect_existing: whether to disconnect existing connection
+        :param since: sequence number of the last message received by the client
         :return: connection
         """
         room = self.get_or_create_room(room_id)
@@ -48,8 +111,83 @@ class ConnectionManager:
             connection_id,
             websocket,
             disconnect_existing,
+            since,
         )
 
+    def remove_connection(self, room_id: str | int, connection: Connection) -> None:
+        """
+        Remove a closed connection from the room.
+
+        Connections are removed by whoever created them, once they are closed.
+
+        :param room_id: room id
+        :param connection: connection
+        :return:
+        """
+        room = self.get_room(room_id)
+        if room:
+            room.remove_connection(connection)
+
+    async def evict_idle_rooms(
+        self,
+        idle_ttl: float = settings.ws_room_idle_ttl,
+    ) -> int:
+        """
+        Remove rooms that have had no connections for longer than idle TTL.
+
+        Evicted rooms are unsubscribed from the backplane and get recreated
+        on the next request to them.
+
+        :param idle_ttl: idle time to live in seconds
+        :return: number of evicted rooms
+        """
+        now = time.monotonic()
+        idle_rooms = [
+            room for room in self._rooms.values() if room.is_idle(idle_ttl, now)
+        ]
+        for room in idle_rooms:
+            self._rooms.pop(room.id)
+            await room.unsubscribe()
+        if idle_rooms:
+            logger.debug(
+                "Evicted {0} idle rooms, live rooms: {1}, live connections: {2}".format(
+                    len(idle_rooms),
+                    self.room_count,
+                    self.connection_count,
+                ),
+            )
+        return len(idle_rooms)
+
+    def start_room_collector(
+        self,
+        interval: float = settings.ws_room_gc_interval,
+        idle_ttl: float = settings.ws_room_idle_ttl,
+    ) -> None:
+        """
+        Start background task that periodically evicts idle rooms.
+
+        :param interval: seconds between collections
+        :param idle_ttl: idle time to live in seconds
+        :return:
+        """
+        if self._room_collector is None or self._room_collector.done():
+            self._room_collector = asyncio.create_task(
+                self._collect_rooms(interval, idle_ttl),
+            )
+
+    async def stop_room_collector(self) -> None:
+        """
+        Stop background task that evicts idle rooms.
+
+        :return:
+        """
+        if self._room_collector is None:
+            return
+        self._room_collector.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._room_collector
+        self._room_collector = None
+
     def get_or_create_room(self, room_id: str | int) -> Room:
         """
         Get or create a room.
@@ -65,9 +203,17 @@ class ConnectionManager:
     def _create_room(self, room_id: str | int) -> Room:
         if self.get_room(room_id):
             raise WebsocketRoomExistsError()
-        new_room = Room(room_id)
+        new_room = Room(room_id, backplane=self._backplane)
         self._rooms[room_id] = new_room
         return new_room
 
+    async def _collect_rooms(self, interval: float, idle_ttl: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle_rooms(idle_ttl)
+            except Exception as error:
+                logger.exception("Failed to evict idle rooms", exc_info=error)
+
 
 ws_conn_manager = ConnectionManager()
@@ -1,19 +1,44 @@
-from typing import AsyncGenerator, Iterable
+import asyncio
+import bisect
+import operator
+import time
+from collections import deque
+from typing import AsyncGenerator, Iterable, Optional
 
+import orjson
 from fastapi import WebSocket
 
+from api.messages import LobbyResyncMessage
 from api.messages.base import BaseWebsocketMessage
+from api.services.websocket.backplane import BaseBackplane, InMemoryBackplane
 from api.services.websocket.connection import Connection
 from exceptions.service.websocket import (
     WebsocketConnectionExistsError,
     WebsocketConnectionNotExistsError,
 )
+from settings import settings
+
+ENVELOPE_SEPARATOR = b"\n"
+
+CONNECTION_IDS_TYPE = Optional[list[str | int]]
+REPLAY_ITEM_TYPE = tuple[int, CONNECTION_IDS_TYPE, str | bytes]
 
 
 class Room:
-    def __init__(self, room_id: str):
+    def __init__(
+        self,
+        room_id: str,
+        backplane: BaseBackplane | None = None,
+        replay_size: int = settings.ws_replay_buffer_size,
+    ):
         self._id = room_id
         self._connections: dict[str, Connection] = {}
+        self._backplane = backplane or InMemoryBackplane()
+        self._channel = f"{settings.redis_namespace}:room:{room_id}"
+        self._is_subscribed = False
+        self._idle_since: float | None = time.monotonic()
+        self._replay_buffer: deque[REPLAY_ITEM_TYPE] = deque(maxlen=replay_size)
+        self._send_lock = asyncio.Lock()
 
     @property
     def id(self) -> str:
@@ -24,6 +49,58 @@ class Room:
         """
         return self._id
 
+    @property
+    def channel(self) -> str:
+        """
+        Get backplane channel of the room.
+
+        :return: channel name
+        """
+        return self._channel
+
+    @property
+    def connection_count(self) -> int:
+        """
+        Get number of live connections of the room on the current worker.
+
+        :return: number of connections
+        """
+        return len(self._connections)
+
+    @property
+    def last_seq(self) -> int:
+        """
+        Get sequence number of the last message delivered by the current worker.
+
+        :return: sequence number or 0 if no message was delivered
+        """
+        if not self._replay_buffer:
+            return 0
+        return self._replay_buffer[-1][0]
+
+    @property
+    def idle_since(self) -> float | None:
+        """
+        Get monotonic time since which the room has no connections.
+
+        :return: monotonic time or None if the room has connections
+        """
+        return self._idle_since
+
+    def is_idle(self, idle_ttl: float, now: float | None = None) -> bool:
+        """
+        Check whether the room has had no connections for longer than idle TTL.
+
+        :param idle_ttl: idle time to live in seconds
+        :param now: current monotonic time
+        :return: whether the room is idle
+        """
+        if self._idle_since is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        return now - self._idle_since >= idle_ttl
+
     def get_connection(
         self,
         connection_id: str,
@@ -46,13 +123,21 @@ class Room:
         connection_id: str | int,
         websocket: WebSocket,
         disconnect_existing: bool = True,
+        since: int | None = None,
     ) -> Connection:
         """
         Create a connection.
 
+        Room is subscribed to its backplane channel when it gets a connection.
+
+        If `since` is provided, messages with greater sequence number are queued
+        to the new connection before any new message. If some of them are
+        no longer buffered, resync message is queued instead.
+
         :param connection_id: connection id
         :param websocket: websocket connection
         :param disconnect_existing: whether to disconnect existing connection
+        :param since: sequence number of the last message received by the client
         :return: created connection
         """
         existing_connection = self.get_connection(connection_id)
@@ -68,6 +153,10 @@ class Room:
                 raise conn_exists_error
         new_connection = Connection(connection_id, websocket)
         self._connections[connection_id] = new_connection
+        self._idle_since = None
+        if since is not None:
+            self._replay(new_connection, since)
+        await self.subscribe()
         return new_connection
 
     async def send(
@@ -80,17 +169,64 @@ class Room:
 
         If connection ids are not provided, send message to all connections.
 
+        Message is numbered with the next sequence number of the room and
+        published to the room channel, so connections of the room on every
+        worker receive it. Sequence number is taken and message is published
+        under a lock, so messages sent concurrently are published in order.
+
         :param message: message
         :param connection_ids: connection ids
         :return:
         """
+        if connection_ids is not None:
+            connection_ids = list(connection_ids)
+        async with self._send_lock:
+            message.set_sequence(await self._backplane.next_sequence(self._channel))
+            payload = self._encode_payload(message, connection_ids)
+            await self._backplane.publish(self._channel, payload)
+
+    def deliver(
+        self,
+        frame: str | bytes,
+        connection_ids: Iterable[str | int] | None = None,
+    ) -> None:
+        """
+        Deliver encoded message to connections of the current worker.
+
+        Frame is put to outbound queue of each connection, so slow connections
+        do not delay delivery to the rest of the room.
+
+        :param frame: encoded message
+        :param connection_ids: connection ids
+        :return:
+        """
         if connection_ids is None:
             connection_ids = self._connections.keys()
 
         for connection_id in connection_ids:
             connection = self.get_connection(connection_id)
             if connection:
-                await connection.send(message)
+                connection.enqueue(frame)
+
+    async def subscribe(self) -> None:
+        """
+        Subscribe to room channel of the backplane.
+
+        :return:
+        """
+        if not self._is_subscribed:
+            await self._backplane.subscribe(self._channel, self._handle_payload)
+            self._is_subscribed = True
+
+    async def unsubscribe(self) -> None:
+        """
+        Unsubscribe from room channel of the backplane.
+
+        :return:
+        """
+        if self._is_subscribed:
+            await self._backplane.unsubscribe(self._channel, self._handle_payload)
+            self._is_subscribed = False
 
     async def receive(
         self,
@@ -107,6 +243,21 @@ class Room:
             async for message in connection:
                 yield message
 
+    def remove_connection(self, connection: Connection) -> None:
+        """
+        Remove a closed connection from the room.
+
+        Connection is removed only if it was not replaced by a newer connection
+        with the same id. The room becomes idle when its last connection is removed.
+
+        :param connection: connection
+        :return:
+        """
+        if self._connections.get(connection.id) is connection:
+            self._connections.pop(connection.id)
+        if not self._connections and self._idle_since is None:
+            self._idle_since = time.monotonic()
+
     async def _remove_connection(
         self,
         connection: Connection,
@@ -114,4 +265,62 @@ class Room:
         reason: str | None = None,
     ) -> None:
         await connection.disconnect(code=code, reason=reason)
-        self._connections.pop(connection.id)
+        self.remove_connection(connection)
+
+    def _replay(self, connection: Connection, since: int) -> None:
+        if not self._is_buffered(since):
+            connection.enqueue(LobbyResyncMessage().to_frame())
+            return
+        missed_items = (item for item in self._replay_buffer if item[0] > since)
+        for _, connection_ids, frame in missed_items:
+            if connection_ids is None or connection.id in connection_ids:
+                connection.enqueue(frame)
+
+    def _is_buffered(self, since: int) -> bool:
+        if not self._replay_buffer:
+            return since >= self.last_seq
+        return self._replay_buffer[0][0] - 1 <= since <= self.last_seq
+
+    async def _handle_payload(self, payload: bytes) -> None:
+        seq, connection_ids, encoded_message = self._decode_payload(payload)
+        if settings.ws_binary_frames:
+            frame = encoded_message
+        else:
+            frame = encoded_message.decode()
+        self._buffer((seq, connection_ids, frame))
+        self.deliver(frame, connection_ids)
+
+    def _buffer(self, replay_item: REPLAY_ITEM_TYPE) -> None:
+        if replay_item[0] > self.last_seq:
+            self._replay_buffer.append(replay_item)
+            return
+        # Messages sent by other workers may be received out of order.
+        position = bisect.bisect(
+            self._replay_buffer,
+            replay_item[0],
+            key=operator.itemgetter(0),
+        )
+        if len(self._replay_buffer) == self._replay_buffer.maxlen:
+            if not position:
+                return
+            self._replay_buffer.popleft()
+            position -= 1
+        self._replay_buffer.insert(position, replay_item)
+
+    @classmethod
+    def _encode_payload(
+        cls,
+        message: BaseWebsocketMessage,
+        connection_ids: list[str | int] | None,
+    ) -> bytes:
+        header = orjson.dumps([message.seq, connection_ids])
+        return header + ENVELOPE_SEPARATOR + message.to_json()
+
+    @classmethod
+    def _decode_payload(
+        cls,
+        payload: bytes,
+    ) -> tuple[int, list[str | int] | None, bytes]:
+        header, encoded_message = payload.split(ENVELOPE_SEPARATOR, 1)
+        seq, connection_ids = orjson.loads(header)
+        return seq, connection_ids, encoded_message
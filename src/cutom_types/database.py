@@ -1,6 +1,7 @@
 from typing import Literal
 
 from sqlalchemy import ColumnElement
+from sqlalchemy.sql.base import ReadOnlyColumnCollection
 
 from database.base_model import BaseDBModel
 
@@ -16,3 +17,5 @@ ASSOCIATION_MODEL_TYPE = dict[
     str,
     dict[str, type[BaseDBModel] | ColumnElement | bool],
 ]
+
+MODEL_COLUMNS_TYPE = type[BaseDBModel] | ReadOnlyColumnCollection
@@ -1,10 +1,22 @@
+import contextlib
 import contextvars
+import itertools
 import logging
 from abc import ABC, abstractmethod
-from typing import Annotated, Any
+from typing import (
+    Annotated,
+    Any,
+    AsyncContextManager,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 
+from asyncpg import PostgresError
 from fastapi import Depends
-from sqlalchemy import Executable
+from sqlalchemy import Dialect, Executable, Result, Row, Table
 from sqlalchemy.exc import (
     DataError,
     DBAPIError,
@@ -14,12 +26,16 @@ from sqlalchemy.exc import (
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.context_variables import is_concurrent
+from api.context_variables import has_written, is_concurrent
+from api.enums import CursorDirectionEnum, OrderQueryEnum
+from api.schemas.query import CursorSchema
 from database.base_model import BaseDBModel
 from database.dependencies import get_db_manager, get_db_session
 from database.manager import DatabaseConnectionManager, default_db_manager
 from database.query_managers.base import BaseQueryManager
 from exceptions.service.database import DatabaseDetailError
+from services.redis.cache import PENDING_CACHE_TAGS, redis_cache
+from settings import settings
 
 logger = logging.getLogger(__name__)
 
@@ -30,11 +46,19 @@ common_db_exceptions = (
     DataError,
     DBAPIError,
 )
+copy_exceptions = (PostgresError, *common_db_exceptions)
+
+ROW_VALUES_TYPE = Mapping[str, Any]
+
+SESSION_FACTORY_TYPE = Callable[[], AsyncContextManager[AsyncSession]]
 
 DB_MANAGER_ANNOTATION = Annotated[DatabaseConnectionManager, Depends(get_db_manager)]
 
 
 class BaseDAL(ABC):  # noqa: WPS338
+    # Templates of tags of cached reads that depend on a row, e.g. `"lobby:{id}"`
+    _cache_tags: tuple[str, ...] = ()
+
     @property
     @abstractmethod
     def _qm(self) -> BaseQueryManager:
@@ -63,10 +87,17 @@ class BaseDAL(ABC):  # noqa: WPS338
         group_by: list[Any] | None = None,
         having: dict[str, Any] | None = None,
         distinct: bool = False,
+        seek: tuple[str, dict[str, Any]] | None = None,
+        rows: bool = False,
+        replica: bool = True,
     ):
         """
         Select rows for a table.
 
+        In rows mode, table columns are selected with SQLAlchemy Core and
+        rows are returned as they are, without building model instances in
+        session. Rows can only be read and validated to schemas.
+
         :param many: select many rows
         :param model: database model
         :param columns: columns to select
@@ -79,9 +110,13 @@ class BaseDAL(ABC):  # noqa: WPS338
         :param group_by: list of columns for grouping
         :param having: having conditions
         :param distinct: whether to select distinct values
+        :param seek: keyset operator and values of key columns
+        :param rows: whether to return rows instead of model instances
+        :param replica: whether rows can be read from a replica, which may lag
+            behind primary
         :return: select query
         """
-        query = self._qm.select(
+        query, parameters = self._qm.select_template(
             model=model,
             columns=columns,
             where=where,
@@ -93,11 +128,66 @@ class BaseDAL(ABC):  # noqa: WPS338
             group_by=group_by,
             having=having,
             distinct=distinct,
+            seek=seek,
+            rows=rows,
         )
 
+        if rows:
+            selected_rows = await self._rows(query, parameters, read_only=replica)
+            if many:
+                return selected_rows
+            return selected_rows[0] if selected_rows else None
         if many:
-            return await self._scalars(query)
-        return await self._scalar(query)
+            return await self._scalars(query, parameters, read_only=replica)
+        return await self._scalar(query, parameters, read_only=replica)
+
+    async def select_page(
+        self,
+        limit: int,
+        offset: int | None = None,
+        cursor: CursorSchema | None = None,
+        order: OrderQueryEnum = OrderQueryEnum.asc,
+        where: dict[str, Any] | None = None,
+        model: type[BaseDBModel] | None = None,
+        rows: bool = False,
+    ) -> list[BaseDBModel] | list[Row]:
+        """
+        Select a page of rows ordered by `created_at` and `id` columns.
+
+        Without cursor, page starts at the offset. With cursor, rows right after
+        or right before the cursor are selected, so rows of previous pages are
+        not scanned. Rows are returned in the requested order in both cases.
+
+        :param limit: max number of rows
+        :param offset: offset, ignored if cursor is provided
+        :param cursor: cursor
+        :param order: order of rows
+        :param where: where conditions
+        :param model: database model
+        :param rows: whether to return rows instead of model instances
+        :return: list of rows
+        """
+        backwards = (
+            cursor is not None and cursor.direction is CursorDirectionEnum.previous
+        )
+        if backwards:
+            order = self._reverse_order(order)
+        seek = None
+        if cursor is not None:
+            offset = None
+            operator = "lt" if order is OrderQueryEnum.desc else "gt"
+            seek = (operator, {"created_at": cursor.created_at, "id": cursor.id})
+        page = await self.select(
+            many=True,
+            model=model,
+            where=where,
+            order={"created_at": order.value, "id": order.value},
+            limit=limit,
+            offset=offset,
+            seek=seek,
+            rows=rows,
+        )
+        return page[::-1] if backwards else page
 
     async def insert(
         self,
@@ -117,10 +207,103 @@ class BaseDAL(ABC):  # noqa: WPS338
             returning=returning,
             **values,
         )
+        self._mark_written()
         if returning:
             return await self._scalar(query)
         await self._execute(query)
 
+    async def insert_many(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        model: type[BaseDBModel] | None = None,
+        returning: bool = True,
+        batch_size: int | None = None,
+    ) -> list[BaseDBModel] | None:
+        """
+        Insert rows to a table in batches.
+
+        Every batch is sent as multi-row INSERT statements, so rows do not
+        cost a round trip each. Cached reads of inserted rows are invalidated.
+
+        :param rows: values of rows
+        :param model: database model
+        :param returning: whether to return inserted rows
+        :param batch_size: max number of rows in a batch, from settings by default
+        :return: inserted rows or None
+        """
+        query = self._qm.insert(model=model, returning=returning)
+        return await self._execute_many(query, rows, returning, batch_size)
+
+    async def upsert_many(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        constraint: str,
+        update_columns: Sequence[str] = (),
+        model: type[BaseDBModel] | None = None,
+        returning: bool = True,
+        batch_size: int | None = None,
+    ) -> list[BaseDBModel] | None:
+        """
+        Insert rows to a table in batches, updating or skipping conflicting rows.
+
+        Without update columns, conflicting rows are skipped and not returned.
+        Cached reads of inserted and updated rows are invalidated, tags that
+        need values missing from rows are only formatted from returned rows.
+
+        :param rows: values of rows
+        :param constraint: name of unique constraint, e.g. `uq_lobby_user`
+        :param update_columns: columns to update in conflicting rows
+        :param model: database model
+        :param returning: whether to return inserted and updated rows
+        :param batch_size: max number of rows in a batch, from settings by default
+        :return: inserted and updated rows or None
+        """
+        query = self._qm.upsert(
+            constraint=constraint,
+            update_columns=update_columns,
+            model=model,
+            returning=returning,
+        )
+        return await self._execute_many(query, rows, returning, batch_size)
+
+    async def copy_rows(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        columns: Sequence[str],
+        model: type[BaseDBModel] | None = None,
+        batch_size: int | None = None,
+    ) -> int:
+        """
+        Copy rows to a table with COPY in batches.
+
+        Rows are streamed in binary format without statements to parse and
+        plan, which is the fastest way to load many rows. Values are
+        converted by column types, but defaults of model columns are not
+        applied, only server defaults are. Rows are not returned, so cached
+        reads are invalidated by tags formatted from values of rows.
+
+        :param rows: values of rows
+        :param columns: columns to copy, other columns get server defaults
+        :param model: database model
+        :param batch_size: max number of rows in a batch, from settings by default
+        :return: number of copied rows
+        """
+        table = self._qm.get_table(model)
+        self._mark_written()
+        tags: set[str] = set()
+        try:
+            copied_count = await self._copy_in_session(
+                table,
+                self._collect_cache_tags(rows, tags),
+                columns,
+                batch_size,
+            )
+        except copy_exceptions as error:
+            self._handle_error(error, f"COPY {table.name}")
+        else:
+            await self.invalidate_cache(*tags)
+            return copied_count
+
     async def update(
         self,
         where: dict[str, Any],
@@ -145,6 +328,7 @@ class BaseDAL(ABC):  # noqa: WPS338
             model=model,
             **values,
         )
+        self._mark_written()
         if returning:
             return await self._scalars(query) if many else await self._scalar(query)
         await self._execute(query)
@@ -165,6 +349,7 @@ class BaseDAL(ABC):  # noqa: WPS338
             where_clauses=where_clauses,
             model=model,
         )
+        self._mark_written()
         await self._execute(query)
 
     async def total_count(
@@ -178,8 +363,54 @@ class BaseDAL(ABC):  # noqa: WPS338
         :return: number of rows
         """
         query = self._qm.total_count(model)
+        return await self._scalar(query, read_only=True)
+
+    async def estimated_count(
+        self,
+        model: type[BaseDBModel] | None = None,
+    ) -> int:
+        """
+        Estimate number of rows in a table from planner statistics.
+
+        Rows are counted exactly if the table has never been analyzed.
+
+        :param model: database model
+        :return: estimated number of rows
+        """
+        query = self._qm.estimated_count(model)
+        row_count = await self._scalar(query, read_only=True)
+        if row_count is None or row_count < 0:
+            return await self.total_count(model)
+        return row_count
+
+    async def exists(
+        self,
+        model: type[BaseDBModel] | None = None,
+        **where_clauses: Any,
+    ) -> bool:
+        """
+        Check if rows matching where conditions exist in a table.
+
+        :param model: database model
+        :param where_clauses: where conditions
+        :return: whether rows exist
+        """
+        query = self._qm.exists(where=where_clauses, model=model)
         return await self._scalar(query)
 
+    async def invalidate_cache(self, *tags: str) -> None:
+        """
+        Invalidate cached reads with any of the tags.
+
+        Tags are invalidated right away and once more after request session
+        is committed, so reads that cached old rows in the meantime are dropped.
+
+        :param tags: cache tags of changed rows
+        :return:
+        """
+        await redis_cache.invalidate(*tags)
+        self._db_session.info.setdefault(PENDING_CACHE_TAGS, set()).update(tags)
+
     async def commit(self) -> None:
         """
         Commit changes to database.
@@ -188,19 +419,26 @@ class BaseDAL(ABC):  # noqa: WPS338
         """
         await self._db_session.commit()
 
-    async def _execute(self, query: Executable):
+    async def _execute(
+        self,
+        query: Executable,
+        parameters: dict[str, Any] | None = None,
+        read_only: bool = False,
+    ):
         """
         Execute SQL query..
 
         :param query: SQLAlchemy Core statement
+        :param parameters: values of statement placeholders
+        :param read_only: whether query may be executed on a read replica
         :return: SQLAlchemy result
         """
-        concurrent = self._get_concurrency_status()
+        session_factory = self._get_session_factory(read_only)
 
-        if concurrent:
+        if session_factory is not None:
             try:
-                async with self._db_manager.session() as session:
-                    result = await session.execute(query)
+                async with session_factory() as session:
+                    result = await session.execute(query, parameters)
                     session.expunge_all()
             except common_db_exceptions as error:
                 self._handle_error(error, str(error))
@@ -208,11 +446,16 @@ class BaseDAL(ABC):  # noqa: WPS338
                 return result
         else:
             try:
-                return await self._db_session.execute(query)
+                return await self._db_session.execute(query, parameters)
             except common_db_exceptions as error:  # noqa: WPS440
                 self._handle_error(error, str(query))
 
-    async def _scalar(self, query: Executable):
+    async def _scalar(
+        self,
+        query: Executable,
+        parameters: dict[str, Any] | None = None,
+        read_only: bool = False,
+    ):
         """
         Execute SQL query that returns a single row and apply scalar.
 
@@ -221,14 +464,16 @@ class BaseDAL(ABC):  # noqa: WPS338
         The method should be used to execute statements that return a single row.
 
         :param query: SQLAlchemy Core statement
+        :param parameters: values of statement placeholders
+        :param read_only: whether query may be executed on a read replica
         :return: SQLAlchemy model instance
         """
-        concurrent = self._get_concurrency_status()
+        session_factory = self._get_session_factory(read_only)
 
-        if concurrent:
+        if session_factory is not None:
             try:
-                async with self._db_manager.session() as session:
-                    result = await session.scalar(query)
+                async with session_factory() as session:
+                    result = await session.scalar(query, parameters)
                     session.expunge_all()
             except common_db_exceptions as error:
                 self._handle_error(error, str(query))
@@ -236,11 +481,16 @@ class BaseDAL(ABC):  # noqa: WPS338
                 return result
         else:
             try:
-                return await self._db_session.scalar(query)
+                return await self._db_session.scalar(query, parameters)
             except common_db_exceptions as error:  # noqa: WPS440
                 self._handle_error(error, str(query))
 
-    async def _scalars(self, query: Executable):
+    async def _scalars(
+        self,
+        query: Executable,
+        parameters: dict[str, Any] | None = None,
+        read_only: bool = False,
+    ):
         """
         Execute SQL query that returns several rows and applies scalar.
 
@@ -249,14 +499,16 @@ class BaseDAL(ABC):  # noqa: WPS338
         The method should be used to execute statements that return a list of rows.
 
         :param query: SQLAlchemy Core statement
+        :param parameters: values of statement placeholders
+        :param read_only: whether query may be executed on a read replica
         :return: list of SQLAlchemy model instances
         """
-        concurrent = self._get_concurrency_status()
+        session_factory = self._get_session_factory(read_only)
 
-        if concurrent:
+        if session_factory is not None:
             try:
-                async with self._db_manager.session() as session:
-                    scalar_result = await session.scalars(query)
+                async with session_factory() as session:
+                    scalar_result = await session.scalars(query, parameters)
                     realized_result = scalar_result.all()
                     session.expunge_all()
             except common_db_exceptions as error:
@@ -265,17 +517,250 @@ class BaseDAL(ABC):  # noqa: WPS338
                 return realized_result
         else:
             try:
-                scalar_result = await self._db_session.scalars(query)
+                scalar_result = await self._db_session.scalars(query, parameters)
             except common_db_exceptions as error:  # noqa: WPS440
                 self._handle_error(error, str(query))
             else:
                 return scalar_result.all()
 
+    async def _execute_many(
+        self,
+        query: Executable,
+        rows: Iterable[Mapping[str, Any]],
+        returning: bool,
+        batch_size: int | None,
+    ) -> list[BaseDBModel] | None:
+        """
+        Execute SQL query with batches of rows.
+
+        :param query: SQLAlchemy Core statement
+        :param rows: values of rows
+        :param returning: whether query returns rows
+        :param batch_size: max number of rows in a batch, from settings by default
+        :return: returned rows or None
+        """
+        self._mark_written()
+        tags: set[str] = set()
+        returned_rows = []
+        for batch in self._batch(self._collect_cache_tags(rows, tags), batch_size):
+            if returning:
+                returned_rows.extend(await self._scalars(query, batch))
+            else:
+                await self._execute(query, batch)
+        for returned_row in returned_rows:
+            tags.update(self._get_cache_tags(returned_row))
+        await self.invalidate_cache(*tags)
+        return returned_rows if returning else None
+
+    async def _copy_in_session(
+        self,
+        table: Table,
+        rows: Iterable[ROW_VALUES_TYPE],
+        columns: Sequence[str],
+        batch_size: int | None,
+    ) -> int:
+        session_factory = self._get_session_factory(read_only=False)
+        if session_factory is None:
+            return await self._copy(self._db_session, table, rows, columns, batch_size)
+        async with session_factory() as session:
+            return await self._copy(session, table, rows, columns, batch_size)
+
+    @classmethod
+    async def _copy(
+        cls,
+        session: AsyncSession,
+        table: Table,
+        rows: Iterable[Mapping[str, Any]],
+        columns: Sequence[str],
+        batch_size: int | None,
+    ) -> int:
+        """
+        Copy rows to a table on connection of a session.
+
+        Session transaction is begun on the driver connection first, since
+        the driver adapter begins it lazily on the first statement. Batches
+        are copied in a savepoint of it, so rows are never copied partially
+        and are rolled back with the session.
+
+        :param session: database session
+        :param table: table
+        :param rows: values of rows
+        :param columns: columns to copy
+        :param batch_size: max number of rows in a batch, from settings by default
+        :return: number of copied rows
+        """
+        if session.autoflush:
+            await session.flush()
+        connection = await session.connection()
+        await connection.exec_driver_sql("SELECT 1")
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        processors = cls._get_bind_processors(connection.dialect, table, columns)
+        copied_count = 0
+        async with driver_connection.transaction():
+            for batch in cls._batch(rows, batch_size):
+                copy_status = await driver_connection.copy_records_to_table(
+                    table.name,
+                    records=cls._make_records(batch, columns, processors),
+                    columns=list(columns),
+                    schema_name=table.schema,
+                )
+                copied_count += int(copy_status.split()[-1])
+        return copied_count
+
+    async def _rows(
+        self,
+        query: Executable,
+        parameters: dict[str, Any] | None = None,
+        read_only: bool = False,
+    ) -> list[Row]:
+        """
+        Execute SQL query that returns rows of table columns.
+
+        Rows are returned without building SQLAlchemy model instances, so
+        nothing is added to session identity map.
+
+        :param query: SQLAlchemy Core statement
+        :param parameters: values of statement placeholders
+        :param read_only: whether query may be executed on a read replica
+        :return: list of rows
+        """
+        session_factory = self._get_session_factory(read_only)
+
+        if session_factory is not None:
+            try:
+                async with session_factory() as session:
+                    result = await session.execute(query, parameters)
+                    realized_result = result.all()
+            except common_db_exceptions as error:
+                self._handle_error(error, str(query))
+            else:
+                return realized_result
+        else:
+            try:
+                result = await self._execute_core(query, parameters)
+            except common_db_exceptions as error:  # noqa: WPS440
+                self._handle_error(error, str(query))
+            else:
+                return result.all()
+
+    async def _execute_core(
+        self,
+        query: Executable,
+        parameters: dict[str, Any] | None,
+    ) -> Result:
+        # Core statements do not autoflush pending model instances
+        if self._db_session.autoflush:
+            await self._db_session.flush()
+        return await self._db_session.execute(query, parameters)
+
+    def _get_session_factory(self, read_only: bool) -> SESSION_FACTORY_TYPE | None:
+        """
+        Get factory of a separate session for a query.
+
+        Reads go to a replica until something is written in the current
+        context, after that they use request session to see own writes.
+        Concurrent queries get their own primary sessions. Otherwise, None
+        is returned and request session is used.
+
+        :param read_only: whether query only reads
+        :return: session factory or None
+        """
+        if read_only and self._db_manager.has_replicas:
+            if not self._get_write_status():
+                return self._db_manager.read_session
+        if self._get_concurrency_status():
+            return self._db_manager.session
+        return None
+
+    def _collect_cache_tags(
+        self,
+        rows: Iterable[ROW_VALUES_TYPE],
+        tags: set[str],
+    ) -> Iterator[ROW_VALUES_TYPE]:
+        for row in rows:
+            tags.update(self._get_cache_tags(row))
+            yield row
+
+    @classmethod
+    def _get_cache_tags(cls, row: ROW_VALUES_TYPE | BaseDBModel) -> list[str]:
+        """
+        Format cache tags of a row.
+
+        Tags that need values missing from the row are skipped.
+
+        :param row: values of row or model instance
+        :return: cache tags
+        """
+        if isinstance(row, BaseDBModel):
+            row = row.to_dict()
+        tags = []
+        for template in cls._cache_tags:
+            with contextlib.suppress(KeyError):
+                tags.append(template.format_map(row))
+        return tags
+
+    @classmethod
+    def _get_bind_processors(
+        cls,
+        dialect: Dialect,
+        table: Table,
+        columns: Sequence[str],
+    ) -> list[Callable[[Any], Any] | None]:
+        return [
+            table.c[column].type.dialect_impl(dialect).bind_processor(dialect)
+            for column in columns
+        ]
+
+    @classmethod
+    def _make_records(
+        cls,
+        batch: list[ROW_VALUES_TYPE],
+        columns: Sequence[str],
+        processors: list[Callable[[Any], Any] | None],
+    ) -> list[tuple]:
+        return [
+            tuple(
+                processor(row[column]) if processor else row[column]
+                for column, processor in zip(columns, processors)
+            )
+            for row in batch
+        ]
+
+    @classmethod
+    def _batch(
+        cls,
+        rows: Iterable[ROW_VALUES_TYPE],
+        batch_size: int | None,
+    ) -> Iterator[list[ROW_VALUES_TYPE]]:
+        batch_size = batch_size or settings.db_bulk_batch_size
+        rows_iterator = iter(rows)
+        while True:
+            batch = list(itertools.islice(rows_iterator, batch_size))
+            if not batch:
+                return
+            yield batch
+
+    @classmethod
+    def _reverse_order(cls, order: OrderQueryEnum) -> OrderQueryEnum:
+        if order is OrderQueryEnum.asc:
+            return OrderQueryEnum.desc
+        return OrderQueryEnum.asc
+
     @classmethod
     def _get_concurrency_status(cls) -> bool:
         ctxt = contextvars.copy_context()
         return ctxt.get(is_concurrent, False)
 
+    @classmethod
+    def _get_write_status(cls) -> bool:
+        ctxt = contextvars.copy_context()
+        return ctxt.get(has_written, False)
+
+    @classmethod
+    def _mark_written(cls) -> None:
+        has_written.set(True)
+
     @classmethod
     def _handle_error(cls, error: Exception, statement: str) -> None:
         logger.error(
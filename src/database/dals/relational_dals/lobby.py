@@ -1,7 +1,10 @@
 from datetime import datetime
 
+from sqlalchemy import Row
+
 from api.enums import OrderQueryEnum
 from api.schemas.lobby import LobbyCreateSchema
+from api.schemas.query import CursorSchema
 from database.dals.relational_dals.base import BaseDAL
 from database.models.lobby import LobbyModel
 from database.query_managers import LobbyQueryManager
@@ -9,6 +12,7 @@ from database.query_managers import LobbyQueryManager
 
 class LobbyDAL(BaseDAL):
     _qm = LobbyQueryManager
+    _cache_tags = ("lobby:{id}",)
 
     async def get_lobbies(
         self,
@@ -17,35 +21,43 @@ class LobbyDAL(BaseDAL):
         start_date: datetime | None = None,
         end_date: datetime | None = None,
         order: OrderQueryEnum = OrderQueryEnum.desc,
-    ) -> list[LobbyModel]:
+        cursor: CursorSchema | None = None,
+    ) -> list[Row]:
         """
         Get lobbies.
 
+        Lobbies are selected as rows, which are only validated to schemas.
+
         :param limit: max number of lobbies
         :param offset: offset
         :param start_date: start date
         :param end_date: end date
         :param order: order of lobbies in created_at column, descending by default
+        :param cursor: cursor to select lobbies after or before instead of offset
         :return: list of lobbies
         """
-        return await self.select(
+        return await self.select_page(
             where={"created_at": ("between", (start_date, end_date))},
-            order={"created_at": order.value},
-            many=True,
+            order=order,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            rows=True,
         )
 
     async def get_lobby_by_id(self, lobby_id: int) -> LobbyModel | None:
         """
         Get lobby by id.
 
+        Lobby is read from primary, since it is cached.
+
         :param lobby_id: lobby id
         :return: lobby model or None
         """
         return await self.select(
             where={"id": lobby_id},
             related=["player_associations"],
+            replica=False,
         )
 
     async def create_lobby(self, lobby_create: LobbyCreateSchema) -> LobbyModel:
@@ -55,4 +67,6 @@ class LobbyDAL(BaseDAL):
         :param lobby_create: lobby create data
         :return: created lobby
         """
-        return await self.insert(**lobby_create.model_dump())
+        lobby = await self.insert(**lobby_create.model_dump())
+        await self.invalidate_cache(f"lobby:{lobby.id}")
+        return lobby
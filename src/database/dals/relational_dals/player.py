@@ -1,23 +1,28 @@
 from api.enums import PlayerStateEnum
 from api.schemas.player import PlayerCreateSchema
 from database.dals.relational_dals.base import BaseDAL
+from database.membership import lobby_membership_cache
 from database.models.player import PlayerModel
 from database.query_managers import PlayerQueryManager
 
 
 class PlayerDAL(BaseDAL):
     _qm = PlayerQueryManager
+    _cache_tags = ("player:{id}", "lobby:{lobby_id}", "user:{user_id}")
 
     async def get_player_by_id(self, player_id: int) -> PlayerModel | None:
         """
         Get player by id.
 
+        Player is read from primary, since it is cached.
+
         :param player_id: player id
         :return: player or None
         """
         return await self.select(
             where={"id": player_id},
             related=["lobby", "user"],
+            replica=False,
         )
 
     async def get_player_by_user_lobby(
@@ -36,6 +41,24 @@ class PlayerDAL(BaseDAL):
             where={"user_id": user_id, "lobby_id": lobby_id},
         )
 
+    async def check_user_in_lobby(self, user_id: int, lobby_id: int) -> bool:
+        """
+        Check if user has a player in the lobby.
+
+        Confirmed memberships are cached, so repeated checks do not query database.
+        Cached memberships are removed once user or lobby tags are invalidated.
+
+        :param user_id: user id
+        :param lobby_id: lobby id
+        :return: whether user has a player in the lobby
+        """
+        if lobby_membership_cache.contains(user_id, lobby_id):
+            return True
+        in_lobby = await self.exists(user_id=user_id, lobby_id=lobby_id)
+        if in_lobby:
+            lobby_membership_cache.add(user_id, lobby_id)
+        return in_lobby
+
     async def update_state_by_lobby_id(
         self,
         lobby_id: int,
@@ -50,7 +73,7 @@ class PlayerDAL(BaseDAL):
         :param state:
         :return: list of updated players
         """
-        return await self.update(
+        players = await self.update(
             where={
                 "lobby_id": lobby_id,
                 "state": ("not_in", (PlayerStateEnum.lead, PlayerStateEnum.banned)),
@@ -58,6 +81,11 @@ class PlayerDAL(BaseDAL):
             many=True,
             state=state,
         )
+        tags = [f"lobby:{lobby_id}"]
+        for player in players:
+            tags.extend(self._get_cache_tags(player))
+        await self.invalidate_cache(*tags)
+        return players
 
     async def ban_player_by_id(self, player_id: int) -> PlayerModel:
         """
@@ -66,10 +94,13 @@ class PlayerDAL(BaseDAL):
         :param player_id: player id to ban
         :return: banned player
         """
-        return await self.update(
+        banned_player = await self.update(
             where={"id": player_id},
             state=PlayerStateEnum.banned,
         )
+        if banned_player:
+            await self.invalidate_cache(*self._get_cache_tags(banned_player))
+        return banned_player
 
     async def create_player(self, player_create: PlayerCreateSchema) -> PlayerModel:
         """
@@ -78,4 +109,6 @@ class PlayerDAL(BaseDAL):
         :param player_create: player create data
         :return: created player
         """
-        return await self.insert(**player_create.model_dump())
+        player = await self.insert(**player_create.model_dump())
+        await self.invalidate_cache(*self._get_cache_tags(player))
+        return player
@@ -1,3 +1,6 @@
+from sqlalchemy import Row
+
+from api.schemas.query import CursorSchema
 from api.schemas.user import UserCreateSchema, UserUpdateSchema
 from database.dals.relational_dals.base import BaseDAL
 from database.models.user import UserModel
@@ -6,27 +9,38 @@ from database.query_managers import UserQueryManager
 
 class UserDAL(BaseDAL):
     _qm = UserQueryManager
+    _cache_tags = ("user:{id}",)
 
-    async def get_users(self, limit: int, offset: int | None = 0) -> list[UserModel]:
+    async def get_users(
+        self,
+        limit: int,
+        offset: int | None = 0,
+        cursor: CursorSchema | None = None,
+    ) -> list[Row]:
         """
-        Get active users.
+        Get active users in order of creation.
+
+        Users are selected as rows, which are only validated to schemas.
 
         :param limit:  limit of users to fetch
         :param offset: offset
+        :param cursor: cursor to select users after or before instead of offset
         :return: list of users
         """
-        return await self.select(
-            many=True,
+        return await self.select_page(
             limit=limit,
             offset=offset,
+            cursor=cursor,
             where={"is_active": True},
+            rows=True,
         )
 
     async def get_user_by_id(self, user_id: int) -> UserModel | None:
         """
         Get user by id with their lobbies and players.
 
-        If user is not active, return None.
+        If user is not active, return None. User is read from primary, since
+        it is cached.
 
         :param user_id: user id
         :return: user with lobbies and players.
@@ -34,6 +48,7 @@ class UserDAL(BaseDAL):
         return await self.select(
             where={"id": user_id, "is_active": True},
             related=["lobbies", "player_associations"],
+            replica=False,
         )
 
     async def get_user_by_username(self, username: str) -> UserModel | None:
@@ -54,7 +69,9 @@ class UserDAL(BaseDAL):
         :param user_create: user create data
         :return: created user
         """
-        return await self.insert(**user_create.model_dump())
+        user = await self.insert(**user_create.model_dump())
+        await self.invalidate_cache(f"user:{user.id}")
+        return user
 
     async def update_user_by_id(
         self,
@@ -68,7 +85,9 @@ class UserDAL(BaseDAL):
         :param user_update: user update data
         :return: updated user
         """
-        return await self.update(where={"id": user_id}, **user_update.model_dump())
+        user = await self.update(where={"id": user_id}, **user_update.model_dump())
+        await self.invalidate_cache(f"user:{user_id}")
+        return user
 
     async def disable_user(self, user_id: int) -> UserModel:
         """
@@ -77,4 +96,6 @@ class UserDAL(BaseDAL):
         :param user_id: user id
         :return: disabled user
         """
-        return await self.update(where={"id": user_id}, is_active=False)
+        user = await self.update(where={"id": user_id}, is_active=False)
+        await self.invalidate_cache(f"user:{user_id}")
+        return user
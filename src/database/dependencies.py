@@ -1,9 +1,11 @@
+from contextlib import AsyncExitStack
 from typing import AsyncIterator
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.manager import DatabaseConnectionManager, default_db_manager
+from services.redis.cache import PENDING_CACHE_TAGS, redis_cache
 
 
 async def get_db_manager() -> DatabaseConnectionManager:
@@ -21,7 +23,18 @@ async def get_db_session(
     """
     Get database session.
 
+    Cache tags of rows changed in the session are invalidated once the session
+    is committed or rolled back, reads cached in the meantime are dropped.
+
     :yield: asynchronous database session
     """
-    async with db_manager.session() as session:
+    pending_tags: set[str] = set()
+    async with AsyncExitStack() as exit_stack:
+        exit_stack.push_async_callback(_invalidate_tags, pending_tags)
+        session = await exit_stack.enter_async_context(db_manager.session())
+        session.info[PENDING_CACHE_TAGS] = pending_tags
         yield session
+
+
+async def _invalidate_tags(tags: set[str]) -> None:
+    await redis_cache.invalidate(*tags)
@@ -1,22 +1,36 @@
 import contextlib
+import itertools
 import logging
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Mapping, Sequence
 
+from orjson import orjson
 from sqlalchemy import URL
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
 
 from cutom_types.database import ISOLATION_LEVEL_TYPE
+from database.pool import InstrumentedQueuePool
 from exceptions.service.database import DatabaseSessionManagerNotInitializedError
 from settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+def serialize_json(json_value: Any) -> str:
+    """
+    Serialize value of JSON column with orjson.
+
+    :param json_value: value of JSON column
+    :return: JSON string
+    """
+    return orjson.dumps(json_value).decode()
+
+
 class DatabaseConnectionManager:
     def __init__(
         self,
@@ -26,19 +40,77 @@ class DatabaseConnectionManager:
         db_isolation_level: ISOLATION_LEVEL_TYPE = "READ COMMITTED",
         db_expire_on_commit: bool = False,
         rollback: bool = False,
+        db_replica_urls: Sequence[str | URL] = (),
+        db_pool_size: int = 5,
+        db_max_overflow: int = 10,
+        db_pool_timeout: float = 30,
+        db_pool_recycle: int = -1,
+        db_pool_pre_ping: bool = False,
+        db_prepared_statement_cache_size: int = 100,
+        db_statement_cache_size: int = 100,
+        db_server_settings: Mapping[str, str] | None = None,
     ):
-        self._engine = create_async_engine(
-            url=db_url,
-            echo=db_echo,
-            echo_pool=db_echo_pool,
-            isolation_level=db_isolation_level,
-        )
+        engine_options = {
+            "echo": db_echo,
+            "echo_pool": db_echo_pool,
+            "isolation_level": db_isolation_level,
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": db_pool_size,
+            "max_overflow": db_max_overflow,
+            "pool_timeout": db_pool_timeout,
+            "pool_recycle": db_pool_recycle,
+            "pool_pre_ping": db_pool_pre_ping,
+            "json_serializer": serialize_json,
+            "json_deserializer": orjson.loads,
+            "connect_args": {
+                "prepared_statement_cache_size": db_prepared_statement_cache_size,
+                "statement_cache_size": db_statement_cache_size,
+                "server_settings": dict(db_server_settings or {}),
+            },
+        }
+        self._engine = create_async_engine(url=db_url, **engine_options)
         self._sessionmaker = async_sessionmaker(
             bind=self._engine,
             expire_on_commit=db_expire_on_commit,
         )
+        self._read_engines = [
+            create_async_engine(url=replica_url, **engine_options)
+            for replica_url in db_replica_urls
+        ]
+        self._read_sessionmakers = [
+            async_sessionmaker(bind=read_engine, expire_on_commit=db_expire_on_commit)
+            for read_engine in self._read_engines
+        ]
+        self._read_counter = itertools.count()
         self._rollback = rollback
 
+    @property
+    def has_replicas(self) -> bool:
+        """
+        Check if read replicas are configured.
+
+        :return: whether read replicas are configured
+        """
+        return bool(self._read_sessionmakers)
+
+    def pool_metrics(self) -> dict[str, dict[str, int | float]]:
+        """
+        Get connection pool metrics of every engine.
+
+        Primary engine is named `primary`, replicas are named `replica_<index>`.
+
+        :return: pool metrics by engine name
+        """
+        if self._engine is None:
+            raise DatabaseSessionManagerNotInitializedError()
+        engines = {"primary": self._engine}
+        for index, read_engine in enumerate(self._read_engines):
+            engines[f"replica_{index}"] = read_engine
+        return {
+            engine_name: self._get_pool_metrics(engine)
+            for engine_name, engine in engines.items()
+        }
+
     async def close(self) -> None:
         """
         Close session to database.
@@ -48,9 +120,13 @@ class DatabaseConnectionManager:
         if self._engine is None:
             raise DatabaseSessionManagerNotInitializedError()
         await self._engine.dispose()
+        for read_engine in self._read_engines:
+            await read_engine.dispose()
 
         self._engine = None
         self._sessionmaker = None
+        self._read_engines = []
+        self._read_sessionmakers = []
 
     @contextlib.asynccontextmanager
     async def connect(self) -> AsyncIterator[AsyncConnection]:
@@ -103,6 +179,42 @@ class DatabaseConnectionManager:
                 if self._rollback:
                     await session.rollback()
 
+    @contextlib.asynccontextmanager
+    async def read_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Create session to a read replica.
+
+        Replicas are chosen in turn. If no replicas are configured, session
+        to primary database is created. Transaction is rolled back on close,
+        so the session must only be used for reads.
+
+        :yield: database session
+        """
+        if not self._read_sessionmakers:
+            async with self.session() as primary_session:
+                yield primary_session
+            return
+
+        replica_index = next(self._read_counter) % len(self._read_sessionmakers)
+        async with self._read_sessionmakers[replica_index]() as session:
+            yield session
+
+    @classmethod
+    def _get_pool_metrics(cls, engine: AsyncEngine) -> dict[str, int | float]:
+        pool: InstrumentedQueuePool = engine.pool
+        statistics = pool.statistics
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": statistics.max_overflow,
+            "checkouts": statistics.checkouts,
+            "timeouts": statistics.timeouts,
+            "total_wait_time": statistics.total_wait_time,
+            "max_wait_time": statistics.max_wait_time,
+        }
+
 
 def create_database_connection_manager(
     db_url: str | URL = None,
@@ -111,6 +223,15 @@ def create_database_connection_manager(
     db_isolation_level: ISOLATION_LEVEL_TYPE | None = None,
     db_expire_on_commit: bool | None = None,
     rollback: bool = False,
+    db_replica_urls: Sequence[str | URL] | None = None,
+    db_pool_size: int | None = None,
+    db_max_overflow: int | None = None,
+    db_pool_timeout: float | None = None,
+    db_pool_recycle: int | None = None,
+    db_pool_pre_ping: bool | None = None,
+    db_prepared_statement_cache_size: int | None = None,
+    db_statement_cache_size: int | None = None,
+    db_server_settings: Mapping[str, str] | None = None,
 ) -> DatabaseConnectionManager:
     """
     Create and return a new DatabaseConnectionManager instance.
@@ -125,8 +246,29 @@ def create_database_connection_manager(
     :param db_isolation_level: isolation level for database transactions
     :param db_expire_on_commit: if True, all instances will be expired after each commit
     :param rollback: if True, all changes are be rolled back in connection or session
+    :param db_replica_urls: read replica URLs, replicas from settings are used only
+        with default database URL
+    :param db_pool_size: number of connections kept open in the pool of every engine
+    :param db_max_overflow: number of connections opened above pool size
+    :param db_pool_timeout: seconds to wait for a connection before raising an error
+    :param db_pool_recycle: seconds after which connections are reopened
+    :param db_pool_pre_ping: if True, connections are tested on checkout
+    :param db_prepared_statement_cache_size: number of prepared statements
+        cached by SQLAlchemy for every connection
+    :param db_statement_cache_size: number of prepared statements cached by
+        asyncpg for every connection
+    :param db_server_settings: PostgreSQL settings sent on connection startup,
+        application name, JIT and statement timeout from settings by default
     :return: configured instance of DatabaseSessionManager
     """
+    if db_replica_urls is None:
+        db_replica_urls = settings.db_replica_urls if db_url is None else ()
+    if db_server_settings is None:
+        db_server_settings = {
+            "application_name": settings.db_application_name,
+            "jit": "on" if settings.db_jit else "off",
+            "statement_timeout": str(settings.db_statement_timeout),
+        }
     return DatabaseConnectionManager(
         db_url=db_url or settings.db_url,
         db_echo=db_echo or settings.db_echo,
@@ -134,7 +276,27 @@ def create_database_connection_manager(
         db_isolation_level=db_isolation_level or settings.db_isolation_level,
         db_expire_on_commit=db_expire_on_commit or settings.db_expire_on_commit,
         rollback=rollback,
+        db_replica_urls=db_replica_urls,
+        db_pool_size=_get_value(db_pool_size, settings.db_pool_size),
+        db_max_overflow=_get_value(db_max_overflow, settings.db_max_overflow),
+        db_pool_timeout=_get_value(db_pool_timeout, settings.db_pool_timeout),
+        db_pool_recycle=_get_value(db_pool_recycle, settings.db_pool_recycle),
+        db_pool_pre_ping=_get_value(db_pool_pre_ping, settings.db_pool_pre_ping),
+        db_prepared_statement_cache_size=_get_value(
+            db_prepared_statement_cache_size,
+            settings.db_prepared_statement_cache_size,
+        ),
+        db_statement_cache_size=_get_value(
+            db_statement_cache_size,
+            settings.db_statement_cache_size,
+        ),
+        db_server_settings=db_server_settings,
     )
 
 
+def _get_value(value: Any, default: Any) -> Any:
+    # Zero and False are valid values, so only None is replaced with default
+    return default if value is None else value
+
+
 default_db_manager = create_database_connection_manager()
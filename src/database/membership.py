@@ -0,0 +1,54 @@
+from services.redis.cache import redis_cache
+from services.redis.local_cache import LocalCache
+from settings import settings
+
+
+class LobbyMembershipCache(LocalCache):
+    """
+    In-process cache of lobbies in which users have players.
+
+    Only confirmed memberships are cached, so a membership created on another
+    worker is found by the next database lookup. Memberships are tagged with
+    user and lobby tags, so invalidations of cached reads, also published by
+    other workers, remove them. Entries expire after `ttl` seconds, which
+    bounds staleness if an invalidation is lost.
+    """
+
+    def __init__(
+        self,
+        max_size: int = settings.lobby_membership_cache_size,
+        ttl: float = settings.lobby_membership_cache_ttl,
+    ):
+        super().__init__(max_size=max_size, ttl=ttl)
+
+    def contains(self, user_id: int, lobby_id: int) -> bool:
+        """
+        Check if user is cached as a member of the lobby.
+
+        :param user_id: user id
+        :param lobby_id: lobby id
+        :return: whether membership is cached
+        """
+        return self.get(self._make_key(user_id, lobby_id)) is not None
+
+    def add(self, user_id: int, lobby_id: int) -> None:
+        """
+        Cache membership of user in the lobby.
+
+        :param user_id: user id
+        :param lobby_id: lobby id
+        :return:
+        """
+        self.set(
+            key=self._make_key(user_id, lobby_id),
+            value=None,
+            tags=[f"user:{user_id}", f"lobby:{lobby_id}"],
+        )
+
+    @classmethod
+    def _make_key(cls, user_id: int, lobby_id: int) -> str:
+        return f"{user_id}:{lobby_id}"
+
+
+lobby_membership_cache = LobbyMembershipCache()
+redis_cache.register_local_cache(lobby_membership_cache)
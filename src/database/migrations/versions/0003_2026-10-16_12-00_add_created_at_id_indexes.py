@@ -0,0 +1,38 @@
+"""
+Add created at and id indexes for keyset pagination.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_lobby_created_at_id",
+        "lobby",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_user_created_at_id",
+        "user",
+        ["created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_created_at_id", table_name="user")
+    op.drop_index("ix_lobby_created_at_id", table_name="lobby")
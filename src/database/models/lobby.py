@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database.base_model import BaseDBModelWithID
@@ -8,6 +8,7 @@ from database.base_model import BaseDBModelWithID
 
 class LobbyModel(BaseDBModelWithID):
     __tablename__ = "lobby"
+    __table_args__ = (Index("ix_lobby_created_at_id", "created_at", "id"),)
 
     name: Mapped[str] = mapped_column(String(50), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, DateTime, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database.base_model import BaseDBModelWithID
@@ -8,6 +8,7 @@ from database.base_model import BaseDBModelWithID
 
 class UserModel(BaseDBModelWithID):
     __tablename__ = "user"
+    __table_args__ = (Index("ix_user_created_at_id", "created_at", "id"),)
 
     username: Mapped[str] = mapped_column(
         String(50),
@@ -0,0 +1,67 @@
+import time
+
+from sqlalchemy import AsyncAdaptedQueuePool, PoolProxiedConnection
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+
+class PoolStatistics:
+    """Counters of connection checkouts from a pool."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_time: float = 0
+        self.max_wait_time: float = 0
+        self.max_overflow = 0
+
+    def record_checkout(self, wait_time: float, overflow: int) -> None:
+        """
+        Record a checkout of a connection.
+
+        :param wait_time: seconds spent waiting for the connection
+        :param overflow: number of overflow connections after checkout
+        :return:
+        """
+        self.checkouts += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        self.max_overflow = max(self.max_overflow, overflow)
+
+    def record_timeout(self) -> None:
+        """
+        Record a checkout that timed out.
+
+        :return:
+        """
+        self.timeouts += 1
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records checkout statistics.
+
+    Wait time covers waiting for a free connection, opening a new one
+    and pre ping. Statistics are reset when the pool is recreated.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.statistics = PoolStatistics()
+
+    def connect(self) -> PoolProxiedConnection:
+        """
+        Check out a connection and record statistics.
+
+        :return: pooled connection
+        """
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.statistics.record_timeout()
+            raise
+        self.statistics.record_checkout(
+            wait_time=time.perf_counter() - start,
+            overflow=self.overflow(),
+        )
+        return connection
@@ -1,38 +1,60 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Sequence
 
 from sqlalchemy import (  # noqa: WPS235
+    BigInteger,
     BinaryExpression,
+    ClauseElement,
     ColumnElement,
     Delete,
     Dialect,
     Insert,
+    Integer,
     Label,
     Select,
+    String,
+    Table,
     Update,
     asc,
+    bindparam,
+    cast,
     delete,
     desc,
+    exists,
     func,
     insert,
+    literal,
     select,
-    text,
+    tuple_,
     update,
 )
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from sqlalchemy.orm import InstrumentedAttribute, selectinload
+from sqlalchemy.sql import expression
 from sqlalchemy.sql.dml import ReturningDelete, ReturningInsert, ReturningUpdate
 
-from cutom_types.database import ASSOCIATION_MODEL_TYPE
+from cutom_types.database import ASSOCIATION_MODEL_TYPE, MODEL_COLUMNS_TYPE
 from database.base_model import BaseDBModel
+from database.statement_templates import statement_templates
 from exceptions.service.query_manager import (
     AssociationModelNotFoundError,
     InvalidBetweenClauseError,
     InvalidInClauseError,
+    RelatedRowsError,
     UnsupportedWhereClauseError,
 )
 from settings import settings
 
+pg_class = expression.table(
+    "pg_class",
+    expression.column("oid"),
+    expression.column("reltuples"),
+)
+
+WHERE_SHAPE_TYPE = tuple[tuple[str, str, Any], ...]
+BOUND_PLACEHOLDER: tuple[Any, ...] = ()
+
 
 class BaseQueryManager(ABC):
     """
@@ -70,10 +92,16 @@ class BaseQueryManager(ABC):
         group_by: list[Any] | None = None,
         having: dict[str, Any] | None = None,
         distinct: bool = False,
+        seek: tuple[str, dict[str, Any]] | None = None,
+        rows: bool = False,
     ) -> Select:
         """
         Select query for a model.
 
+        In rows mode, table columns are selected and conditions are applied
+        to them, so the query is executed by SQLAlchemy Core without building
+        model instances.
+
         :param model: database model
         :param columns: columns to select
         :param where: where conditions
@@ -85,15 +113,14 @@ class BaseQueryManager(ABC):
         :param group_by: list of columns for grouping
         :param having: having conditions
         :param distinct: whether to select distinct values
+        :param seek: keyset operator and values of key columns
+        :param rows: whether to select table columns instead of model
+        :raises RelatedRowsError: if related columns are selected in rows mode
         :return: select query
         """
         model = model or cls._model
-
-        if columns:
-            columns = [text(column) for column in columns]
-            query = select(*columns)
-        else:
-            query = select(model)
+        fields = model.__table__.c if rows else model
+        query = cls._select_columns(model, columns, rows)
 
         if distinct:
             query = cls.distinct(query)
@@ -101,6 +128,9 @@ class BaseQueryManager(ABC):
         if join:
             query = cls.join(query, join)
 
+        if related and rows:
+            raise RelatedRowsError()
+
         if related:
             query = cls.select_related(
                 query,
@@ -109,7 +139,7 @@ class BaseQueryManager(ABC):
             )
 
         if where:
-            query = cls.where(query, model=model, **where)
+            query = cls.where(query, model=fields, **where)
 
         if group_by:
             query = cls.group_by(query, group_by)
@@ -117,16 +147,92 @@ class BaseQueryManager(ABC):
         if having:
             query = cls.having(query, model, **having)
 
-        if order:
-            query = cls.order(query, model=model, **order)
+        return cls._select_page(
+            query,
+            fields=fields,
+            seek=seek,
+            order=order,
+            limit=limit,
+            offset=offset,
+        )
 
-        if limit is not None:
-            query = cls.limit(query, limit)
+    @classmethod
+    def select_template(  # noqa: WPS211
+        cls,
+        model: type[BaseDBModel] | None = None,
+        columns: list[str] | None = None,
+        where: dict[str, Any] | None = None,
+        order: dict[str, str] | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+        join: list[str | dict[str, Any]] | None = None,
+        related: list[str] | None = None,
+        group_by: list[Any] | None = None,
+        having: dict[str, Any] | None = None,
+        distinct: bool = False,
+        seek: tuple[str, dict[str, Any]] | None = None,
+        rows: bool = False,
+    ) -> tuple[Select, dict[str, Any]]:
+        """
+        Select query template for a model and values of its placeholders.
 
-        if offset is not None:
-            query = cls.offset(query, offset)
+        Templates are cached by the shape of a call: columns, where fields and
+        operators, seek and order fields, joins, related columns and whether
+        limit and offset are set. Repeated calls only collect their values.
+        Calls with grouping, joins defined in place or SQL expressions as values
+        are not cached, they get a select query with values in it.
 
-        return query
+        :param model: database model
+        :param columns: columns to select
+        :param where: where conditions
+        :param order: order conditions
+        :param limit: limit number of columns
+        :param offset: offset in results
+        :param join: join conditions
+        :param related: columns that have relationship woth other tables
+        :param group_by: list of columns for grouping
+        :param having: having conditions
+        :param distinct: whether to select distinct values
+        :param seek: keyset operator and values of key columns
+        :param rows: whether to select table columns instead of model
+        :return: select query and values to execute it with
+        """
+        model = model or cls._model
+        parameters: dict[str, Any] = {}
+        where_shape = cls._create_where_shape(where or {}, parameters)
+        if not cls._is_template_call(where_shape, columns, join, group_by, having):
+            query = cls.select(
+                model=model,
+                columns=columns,
+                where=where,
+                order=order,
+                limit=limit,
+                offset=offset,
+                join=join,
+                related=related,
+                group_by=group_by,
+                having=having,
+                distinct=distinct,
+                seek=seek,
+                rows=rows,
+            )
+            return query, {}
+
+        seek_shape = cls._collect_page_parameters(seek, limit, offset, parameters)
+        template = cls._get_select_template(
+            model=model,
+            columns=columns,
+            where_shape=where_shape,
+            seek_shape=seek_shape,
+            order=order,
+            has_limit=limit is not None,
+            has_offset=offset is not None,
+            join=join,
+            related=related,
+            distinct=distinct,
+            rows=rows,
+        )
+        return template, parameters
 
     @classmethod
     def insert(
@@ -150,6 +256,39 @@ class BaseQueryManager(ABC):
             return cls.returning(query, model=model)
         return query
 
+    @classmethod
+    def upsert(
+        cls,
+        constraint: str,
+        update_columns: Sequence[str] = (),
+        model: type[BaseDBModel] | None = None,
+        returning: bool = True,
+    ) -> Insert | ReturningInsert:
+        """
+        Insert query for a model that updates or skips conflicting rows.
+
+        Conflicting rows are updated with inserted values of update columns.
+        Without update columns, conflicting rows are skipped and not returned.
+
+        :param constraint: name of unique constraint, e.g. `uq_lobby_user`
+        :param update_columns: columns to update in conflicting rows
+        :param model: database model
+        :param returning: whether to return inserted and updated rows
+        :return: insert query with on conflict clause
+        """
+        model = model or cls._model
+        query = postgresql_insert(model)
+        if update_columns:
+            query = query.on_conflict_do_update(
+                constraint=constraint,
+                set_={column: query.excluded[column] for column in update_columns},
+            )
+        else:
+            query = query.on_conflict_do_nothing(constraint=constraint)
+        if returning:
+            return cls.returning(query, model=model)
+        return query
+
     @classmethod
     def update(
         cls,
@@ -193,6 +332,17 @@ class BaseQueryManager(ABC):
         query = delete(model)
         return cls.where(query, model=model, **where_clauses)
 
+    @classmethod
+    def get_table(cls, model: type[BaseDBModel] | None = None) -> Table:
+        """
+        Get table of a model.
+
+        :param model: database model
+        :return: table
+        """
+        model = model or cls._model
+        return model.__table__
+
     @classmethod
     def total_count(cls, model: type[BaseDBModel] | None = None) -> Select:
         """
@@ -204,6 +354,40 @@ class BaseQueryManager(ABC):
         model = model or cls._model
         return select(func.count()).select_from(model)
 
+    @classmethod
+    def estimated_count(cls, model: type[BaseDBModel] | None = None) -> Select:
+        """
+        Estimated count query for a model.
+
+        Number of rows is taken from planner statistics in `pg_class`, which
+        are updated by VACUUM and ANALYZE, so no rows are scanned.
+
+        :param model: database model
+        :return: select query for estimated count
+        """
+        model = model or cls._model
+        return select(cast(pg_class.c.reltuples, BigInteger)).where(
+            pg_class.c.oid
+            == func.to_regclass(literal(model.__table__.fullname, String)),
+        )
+
+    @classmethod
+    def exists(
+        cls,
+        where: dict[str, Any],
+        model: type[BaseDBModel] | None = None,
+    ) -> Select:
+        """
+        Exists query for a model.
+
+        :param where: where conditions
+        :param model: database model
+        :return: select query for whether matching rows exist
+        """
+        model = model or cls._model
+        query = cls.where(exists().select_from(model), model=model, **where)
+        return select(query)
+
     @classmethod
     def convert_query_to_string(
         cls,
@@ -227,14 +411,14 @@ class BaseQueryManager(ABC):
     def where(
         cls,
         query: Select | Update | Delete,
-        model: type[BaseDBModel] = _model,
+        model: MODEL_COLUMNS_TYPE = _model,
         **where_clauses: tuple[str, Any] | Any,
     ) -> Select | Delete:
         """
         Apply where conditions to SQL Alchemy query.
 
         :param query: select, update or delete query
-        :param model: database model
+        :param model: database model or its table columns
         :param where_clauses: where conditions
         :return: query with where conditions applied
         """
@@ -248,18 +432,47 @@ class BaseQueryManager(ABC):
                 conditions.append(condition)
         return query.where(*conditions) if conditions else query
 
+    @classmethod
+    def seek(
+        cls,
+        query: Select,
+        operator: str,
+        model: MODEL_COLUMNS_TYPE = _model,
+        **keys: Any,
+    ) -> Select:
+        """
+        Apply keyset condition to select query.
+
+        Row value of key columns is compared with given values, e.g.
+        `(created_at, id) > (:created_at, :id)`, so database can start reading
+        an index right after the key instead of skipping offset rows.
+
+        :param query: select query
+        :param operator: comparison operator, `gt`, `ge`, `lt` or `le`
+        :param model: database model or its table columns
+        :param keys: key columns and their values
+        :return: query with keyset condition applied
+        """
+        key_columns = tuple_(*(getattr(model, field) for field in keys))
+        condition = cls._match_where_clause(
+            column=key_columns,
+            operator=operator,
+            value=tuple_(*keys.values()),
+        )
+        return query.where(condition)
+
     @classmethod
     def order(
         cls,
         query: Select,
-        model: type[BaseDBModel] = _model,
+        model: MODEL_COLUMNS_TYPE = _model,
         **order_clauses: str,
     ) -> Select:
         """
         Apply order conditions to select query.
 
         :param query: select query
-        :param model: database model
+        :param model: database model or its table columns
         :param order_clauses: order conditions
         :return: query with order conditions applied
         """
@@ -403,6 +616,46 @@ class BaseQueryManager(ABC):
         """
         return query.returning(model)
 
+    @classmethod
+    def _select_columns(
+        cls,
+        model: type[BaseDBModel],
+        columns: list[Any] | None,
+        rows: bool,
+    ) -> Select:
+        fields = model.__table__.c if rows else model
+        if columns:
+            return select(
+                *(
+                    getattr(fields, selected) if isinstance(selected, str) else selected
+                    for selected in columns
+                ),
+            )
+        if rows:
+            return select(*model.__table__.columns)
+        return select(model)
+
+    @classmethod
+    def _select_page(
+        cls,
+        query: Select,
+        fields: MODEL_COLUMNS_TYPE,
+        seek: tuple[str, dict[str, Any]] | None,
+        order: dict[str, str] | None,
+        limit: int | None,
+        offset: int | None,
+    ) -> Select:
+        if seek:
+            operator, keys = seek
+            query = cls.seek(query, model=fields, operator=operator, **keys)
+        if order:
+            query = cls.order(query, model=fields, **order)
+        if limit is not None:
+            query = cls.limit(query, limit)
+        if offset is not None:
+            query = cls.offset(query, offset)
+        return query
+
     @classmethod
     def _join_details(
         cls,
@@ -495,28 +748,45 @@ class BaseQueryManager(ABC):
                 raise UnsupportedWhereClauseError(operator)
 
     @classmethod
-    def _create_between_clause(  # noqa: WPS231
+    def _create_between_clause(
         cls,
         column: InstrumentedAttribute,
         bounds: tuple[Any, Any],
         negative: bool = False,
     ) -> BinaryExpression | None:
+        lower, upper = cls._check_between_bounds(bounds)
+        return cls._build_between_clause(
+            column=column,
+            lower=lower,
+            upper=upper,
+            negative=negative,
+        )
+
+    @classmethod
+    def _check_between_bounds(cls, bounds: tuple[Any, Any]) -> tuple[Any, Any]:
         if not isinstance(bounds, tuple) or len(bounds) != 2:
             raise InvalidBetweenClauseError(bounds)
-
         lower, upper = bounds
+        if lower is not None and upper is not None and lower >= upper:
+            raise InvalidBetweenClauseError(bounds)
+        return lower, upper
 
+    @classmethod
+    def _build_between_clause(
+        cls,
+        column: InstrumentedAttribute,
+        lower: Any,
+        upper: Any,
+        negative: bool = False,
+    ) -> BinaryExpression | None:
         if lower is None and upper is None:
             return None
         if lower is None:
             between_clause = column <= upper
         elif upper is None:
             between_clause = column >= lower
-        elif lower < upper:
-            between_clause = column.between(lower, upper)
         else:
-            raise InvalidBetweenClauseError(bounds)
-
+            between_clause = column.between(lower, upper)
         return ~between_clause if negative else between_clause
 
     @classmethod
@@ -531,6 +801,249 @@ class BaseQueryManager(ABC):
             return ~in_clause if negative else in_clause
         raise InvalidInClauseError(collection)
 
+    @classmethod
+    def _collect_between_parameters(
+        cls,
+        name: str,
+        bounds: tuple[Any, Any],
+        parameters: dict[str, Any],
+    ) -> tuple[bool, bool] | None:
+        lower, upper = cls._check_between_bounds(bounds)
+        if isinstance(lower, ClauseElement) or isinstance(upper, ClauseElement):
+            return None
+        if lower is not None:
+            parameters[f"{name}__lower"] = lower
+        if upper is not None:
+            parameters[f"{name}__upper"] = upper
+        return lower is not None, upper is not None
+
+    @classmethod
+    def _create_where_shape(
+        cls,
+        where_clauses: dict[str, Any],
+        parameters: dict[str, Any],
+    ) -> WHERE_SHAPE_TYPE | None:
+        """
+        Get fields, operators and placeholder kinds of where conditions.
+
+        Values are collected to parameters by placeholder names. Values that
+        are not bound with placeholders, None and `is_not` values, are part of
+        the shape.
+
+        :param where_clauses: where conditions
+        :param parameters: values of placeholders
+        :return: where shape or None if values can not be bound
+        """
+        shape = []
+        for field, clause in where_clauses.items():
+            operator, where_value = cls._split_where_clause(clause)
+            placeholder = cls._create_where_placeholder(
+                f"where_{field}",
+                operator,
+                where_value,
+                parameters,
+            )
+            if placeholder is None:
+                return None
+            if operator in {"between", "not_between"} and not any(placeholder):
+                continue
+            shape.append((field, operator, placeholder))
+        return tuple(shape)
+
+    @classmethod
+    def _split_where_clause(cls, clause: tuple[str, Any] | Any) -> tuple[str, Any]:
+        if isinstance(clause, tuple) and len(clause) == 2:
+            return clause
+        return "eq", clause
+
+    @classmethod
+    def _create_where_placeholder(
+        cls,
+        name: str,
+        operator: str,
+        where_value: Any,
+        parameters: dict[str, Any],
+    ) -> tuple[Any, ...] | None:
+        if operator in {"between", "not_between"}:
+            return cls._collect_between_parameters(name, where_value, parameters)
+        if operator in {"in", "not_in"}:
+            if not isinstance(where_value, (list, tuple, set)):
+                raise InvalidInClauseError(where_value)
+            parameters[name] = list(where_value)
+            return BOUND_PLACEHOLDER
+        if operator == "is_not" or where_value is None:
+            return (where_value,)
+        if isinstance(where_value, ClauseElement):
+            return None
+        parameters[name] = where_value
+        return BOUND_PLACEHOLDER
+
+    @classmethod
+    def _is_template_call(
+        cls,
+        where_shape: tuple[Any, ...] | None,
+        columns: list[Any] | None,
+        join: list[str | dict[str, Any]] | None,
+        group_by: list[Any] | None,
+        having: dict[str, Any] | None,
+    ) -> bool:
+        if where_shape is None or group_by or having:
+            return False
+        names = [*(columns or ()), *(join or ())]
+        return all(isinstance(name, str) for name in names)
+
+    @classmethod
+    def _collect_page_parameters(
+        cls,
+        seek: tuple[str, dict[str, Any]] | None,
+        limit: int | None,
+        offset: int | None,
+        parameters: dict[str, Any],
+    ) -> tuple[str, tuple[str, ...]] | None:
+        if limit is not None:
+            parameters["limit"] = limit
+        if offset is not None:
+            parameters["offset"] = offset
+        if not seek:
+            return None
+        operator, keys = seek
+        for field, key_value in keys.items():
+            parameters[f"seek_{field}"] = key_value
+        return operator, tuple(keys)
+
+    @classmethod
+    def _get_select_template(
+        cls,
+        model: type[BaseDBModel],
+        columns: list[str] | None,
+        where_shape: tuple[Any, ...],
+        seek_shape: tuple[str, tuple[str, ...]] | None,
+        order: dict[str, str] | None,
+        has_limit: bool,
+        has_offset: bool,
+        join: list[str] | None,
+        related: list[str] | None,
+        distinct: bool,
+        rows: bool,
+    ) -> Select:
+        shape = (
+            cls,
+            model,
+            tuple(columns or ()),
+            where_shape,
+            seek_shape,
+            tuple((order or {}).items()),
+            has_limit,
+            has_offset,
+            tuple(join or ()),
+            tuple(related or ()),
+            distinct,
+            rows,
+        )
+        template = statement_templates.get(shape)
+        if template is None:
+            template = cls._create_select_template(
+                model=model,
+                columns=columns,
+                where_shape=where_shape,
+                seek_shape=seek_shape,
+                order=order,
+                has_limit=has_limit,
+                has_offset=has_offset,
+                join=join,
+                related=related,
+                distinct=distinct,
+                rows=rows,
+            )
+            statement_templates.set(shape, template)
+        return template
+
+    @classmethod
+    def _create_select_template(  # noqa: WPS211
+        cls,
+        model: type[BaseDBModel],
+        columns: list[str] | None,
+        where_shape: WHERE_SHAPE_TYPE,
+        seek_shape: tuple[str, tuple[str, ...]] | None,
+        order: dict[str, str] | None,
+        has_limit: bool,
+        has_offset: bool,
+        join: list[str] | None,
+        related: list[str] | None,
+        distinct: bool,
+        rows: bool,
+    ) -> Select:
+        query = cls.select(
+            model=model,
+            columns=columns,
+            order=order,
+            join=join,
+            related=related,
+            distinct=distinct,
+            rows=rows,
+        )
+        fields = model.__table__.c if rows else model
+        conditions = [
+            cls._create_where_template_clause(fields, field, operator, placeholder)
+            for field, operator, placeholder in where_shape
+        ]
+        if conditions:
+            query = query.where(*conditions)
+        if seek_shape is not None:
+            operator, key_fields = seek_shape
+            query = cls.seek(
+                query,
+                model=fields,
+                operator=operator,
+                **{
+                    key: bindparam(f"seek_{key}", type_=getattr(fields, key).type)
+                    for key in key_fields
+                },
+            )
+        if has_limit:
+            query = cls.limit(query, bindparam("limit", type_=Integer))
+        if has_offset:
+            query = cls.offset(query, bindparam("offset", type_=Integer))
+        return query
+
+    @classmethod
+    def _create_where_template_clause(
+        cls,
+        model: MODEL_COLUMNS_TYPE,
+        field: str,
+        operator: str,
+        placeholder: Any,
+    ) -> ColumnElement | BinaryExpression:
+        column = getattr(model, field)
+        name = f"where_{field}"
+        if operator in {"between", "not_between"}:
+            has_lower, has_upper = placeholder
+            return cls._build_between_clause(
+                column=column,
+                lower=(
+                    bindparam(f"{name}__lower", type_=column.type)
+                    if has_lower
+                    else None
+                ),
+                upper=(
+                    bindparam(f"{name}__upper", type_=column.type)
+                    if has_upper
+                    else None
+                ),
+                negative=operator == "not_between",
+            )
+        if operator in {"in", "not_in"}:
+            in_clause = column.in_(bindparam(name, type_=column.type, expanding=True))
+            return ~in_clause if operator == "not_in" else in_clause
+        where_value = bindparam(name, type_=column.type)
+        if placeholder:
+            where_value = placeholder[0]
+        return cls._match_where_clause(
+            column=column,
+            operator=operator,
+            value=where_value,
+        )
+
     @classmethod
     def _alias_columns(cls, model: type[BaseDBModel]) -> list[Label]:
         model_name = model.__tablename__
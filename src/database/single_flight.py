@@ -0,0 +1,109 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Hashable
+
+from api.context_variables import has_written
+
+READ_METHOD_TYPE = Callable[..., Awaitable[Any]]
+
+
+class SingleFlight:
+    """
+    In-process deduplication of concurrent identical reads.
+
+    The first call with a key runs, calls with the same key made while it is
+    in flight wait for its result instead of querying database again. Callers
+    share returned objects, so they must only be read. Only validated schemas
+    can be shared, ORM instances belong to session of the first caller.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self.executed_count = 0
+        self.deduplicated_count = 0
+
+    @property
+    def in_flight_count(self) -> int:
+        """
+        Get number of calls in flight.
+
+        :return: number of calls
+        """
+        return len(self._calls)
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a call or wait for an identical call in flight.
+
+        If the call in flight is cancelled, waiting callers run the call
+        themselves.
+
+        :param key: key of identical calls
+        :param call: coroutine function to run
+        :return: result of the call
+        """
+        in_flight = self._calls.get(key)
+        if in_flight is None:
+            return await self._run_first(key, call)
+        self.deduplicated_count += 1
+        return await self._wait(in_flight, call)
+
+    def coalesce(self, method: READ_METHOD_TYPE) -> READ_METHOD_TYPE:
+        """
+        Deduplicate concurrent calls of a service read method.
+
+        Calls are identical if they have the same method and arguments, so the
+        method must return validated schemas. Calls made after a write in the
+        same context are not deduplicated, so they see own writes.
+
+        :param method: service method with hashable arguments
+        :return: decorated method
+        """
+
+        @functools.wraps(method)
+        async def wrapper(service, *args, **kwargs):
+            if has_written.get():
+                return await method(service, *args, **kwargs)
+            key = (method.__qualname__, args, frozenset(kwargs.items()))
+            return await self.run(key, lambda: method(service, *args, **kwargs))
+
+        return wrapper
+
+    async def _run_first(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        in_flight = asyncio.get_running_loop().create_future()
+        self._calls[key] = in_flight
+        self.executed_count += 1
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            in_flight.cancel()
+            raise
+        except Exception as error:
+            in_flight.set_exception(error)
+            in_flight.exception()
+            raise
+        else:
+            in_flight.set_result(result)
+        finally:
+            self._calls.pop(key, None)
+        return result
+
+    @classmethod
+    async def _wait(
+        cls,
+        in_flight: asyncio.Future,
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        try:
+            return await asyncio.shield(in_flight)
+        except asyncio.CancelledError:
+            if not in_flight.cancelled():
+                raise
+        return await call()
+
+
+single_flight = SingleFlight()
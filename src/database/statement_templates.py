@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from typing import Hashable
+
+from sqlalchemy import Select
+
+from settings import settings
+
+
+class StatementTemplateCache:
+    """
+    In-process LRU cache of select statement templates.
+
+    Templates are keyed by the shape of a call, so repeated calls with other
+    values reuse the same statement object. SQLAlchemy memoizes cache key of a
+    statement object, so reused templates also skip the cache key traversal
+    before their compiled form is looked up.
+    """
+
+    def __init__(self, max_size: int = settings.db_statement_template_cache_size):
+        self._max_size = max_size
+        self._templates: OrderedDict[Hashable, Select] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """
+        Get number of cached templates.
+
+        :return: number of templates
+        """
+        return len(self._templates)
+
+    def get(self, key: Hashable) -> Select | None:
+        """
+        Get template of a call shape.
+
+        :param key: call shape
+        :return: statement template or None if not cached
+        """
+        template = self._templates.get(key)
+        if template is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._templates.move_to_end(key)
+        return template
+
+    def set(self, key: Hashable, template: Select) -> None:
+        """
+        Cache template of a call shape.
+
+        :param key: call shape
+        :param template: statement template
+        :return:
+        """
+        if self._max_size <= 0:
+            return
+        self._templates[key] = template
+        self._templates.move_to_end(key)
+        if len(self._templates) > self._max_size:
+            self._templates.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all templates.
+
+        :return:
+        """
+        self._templates.clear()
+
+
+statement_templates = StatementTemplateCache()
@@ -11,6 +11,10 @@ class AssociationModelNotFoundError(QueryManagerError):
     detail = "Association model not found"
 
 
+class RelatedRowsError(QueryManagerError):
+    detail = "Related columns can not be selected in rows mode"
+
+
 class UnsupportedWhereClauseError(QueryManagerError):
     def __init__(self, operator: str):
         detail = f"Unsupported where clause, operator: {operator}"
@@ -18,3 +18,7 @@ class DateTimeQueryParamsError(InvalidQueryParamsError):
 
 class OrderQueryParamsError(InvalidQueryParamsError):
     detail = "Invalid order in query parameters"
+
+
+class CursorQueryParamsError(InvalidQueryParamsError):
+    detail = "Invalid cursor in query parameters"
@@ -23,3 +23,10 @@ class JSONDecoderError(SerializationError):
 
     def __init__(self, decoded_value: Any):
         super().__init__(detail=self.detail.format(decoded_value=decoded_value))
+
+
+class CodecNotAvailableError(SerializationError):
+    detail = "Codec {codec_name} is not available"
+
+    def __init__(self, codec_name: str):
+        super().__init__(detail=self.detail.format(codec_name=codec_name))
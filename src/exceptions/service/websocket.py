@@ -1,3 +1,5 @@
+from fastapi import status
+
 from exceptions.service.base import BaseServiceError
 
 
@@ -23,3 +25,8 @@ class WebsocketConnectionExistsError(BaseWebsocketError):
 
 class WebsocketConnectionNotExistsError(BaseWebsocketError):
     detail = "Connection does not exists"
+
+
+class WebsocketSlowConsumerError(BaseWebsocketError):
+    detail = "Connection is too slow to receive messages"
+    ws_status_code = status.WS_1013_TRY_AGAIN_LATER
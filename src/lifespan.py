@@ -2,9 +2,16 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from redis.asyncio import Redis
 
+from api.authnetication import password_hasher
+from api.enums.websocket import WebsocketBackplaneEnum
+from api.services import RedisBackplane, ws_conn_manager
 from api.utilities import customize_openapi
 from database.manager import default_db_manager
+from services.redis.cache import redis_cache
+from services.redis.manager import redis_manager
+from settings import settings
 
 
 @asynccontextmanager
@@ -32,6 +39,32 @@ async def run_startup_events(app: FastAPI) -> None:
     """
     app.openapi = customize_openapi(app.openapi)
 
+    # Shared Redis client, connections are opened on first use.
+    redis_manager.connect()
+
+    # Subscriber of cache invalidations published by other workers.
+    await redis_cache.start_invalidation_listener(
+        Redis(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            password=settings.redis_pass,
+            socket_connect_timeout=settings.redis_socket_timeout,
+        ),
+    )
+
+    if settings.ws_backplane is WebsocketBackplaneEnum.redis:
+        # Subscriber connection blocks while waiting for messages,
+        # so only connection attempts are limited by timeout.
+        redis_client = Redis(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            password=settings.redis_pass,
+            socket_connect_timeout=settings.redis_socket_timeout,
+        )
+        await ws_conn_manager.set_backplane(RedisBackplane(redis_client))
+
+    ws_conn_manager.start_room_collector()
+
 
 async def run_shutdown_events(app: FastAPI) -> None:
     """
@@ -40,6 +73,15 @@ async def run_shutdown_events(app: FastAPI) -> None:
     :param app: application
     :return:
     """
+    # Stop websocket room collector and close backplane.
+    await ws_conn_manager.close()
+    # Stop password hashing threads.
+    password_hasher.close()
+
+    # Stop listening for cache invalidations and close shared Redis client.
+    await redis_cache.close()
+    await redis_manager.close()
+
     # Close the DB connection.
     if default_db_manager._engine is not None:  # noqa: WPS437
         await default_db_manager.close()
@@ -0,0 +1,375 @@
+import asyncio
+import contextlib
+import functools
+import inspect
+import logging
+import uuid
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+import orjson
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from api.context_variables import has_written
+from api.schemas.base import BaseSchema
+from exceptions.service.redis import RedisConnectionError
+from services.redis.local_cache import LocalCache
+from services.redis.manager import redis_manager
+from services.redis.utils import KeyTemplate, deserialize, serialize
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+PENDING_CACHE_TAGS = "pending_cache_tags"
+
+CACHED_FUNCTION_TYPE = Callable[..., Awaitable[Optional[BaseSchema]]]
+
+
+class CacheStatistics:
+    """Counters of cache lookups by tier that served them."""
+
+    def __init__(self):
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    @property
+    def local_hit_rate(self) -> float:
+        """
+        Get share of lookups served by in-process cache.
+
+        :return: hit rate
+        """
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return self.local_hits / lookups if lookups else 0
+
+    @property
+    def redis_hit_rate(self) -> float:
+        """
+        Get share of lookups missed by in-process cache and served by Redis.
+
+        :return: hit rate
+        """
+        lookups = self.redis_hits + self.misses
+        return self.redis_hits / lookups if lookups else 0
+
+
+class RedisCache:
+    """
+    Read-through cache of service reads in Redis.
+
+    Every cached entry is added to sets of its tags, so writes can invalidate
+    all entries that depend on a changed row. Missing entities are cached with
+    empty value. If Redis is not available, reads go to the database.
+
+    Reads made after a write in the same context bypass the cache, since
+    written rows may not be committed yet. Entries expire after a short time,
+    which bounds staleness if an invalidation races with a concurrent read.
+
+    Validated schemas are also kept in an in-process cache in front of Redis.
+    Invalidated tags are published to other workers, which remove their
+    in-process entries once they receive them. Other in-process caches can be
+    registered to be invalidated along with it.
+    """
+
+    def __init__(
+        self,
+        redis_client: Redis | None = None,
+        namespace: str = settings.redis_namespace,
+        expiration: int | None = settings.redis_cache_expiration_time,
+        empty_value: str = settings.redis_empty_value,
+        local_cache: LocalCache | None = None,
+    ):
+        self._redis_client = redis_client
+        self._namespace = namespace
+        self._expiration = expiration
+        self._empty_value = empty_value.encode(settings.redis_encoding)
+        self._local_cache = local_cache or LocalCache()
+        self._local_caches = [self._local_cache]
+        self._invalidation_channel = f"{namespace}:invalidation"
+        self._instance_id = uuid.uuid4().hex
+        self._subscriber_client: Redis | None = None
+        self._pubsub: PubSub | None = None
+        self._listener: asyncio.Task | None = None
+        self.statistics = CacheStatistics()
+
+    @property
+    def local_size(self) -> int:
+        """
+        Get number of entries in in-process cache.
+
+        :return: number of entries
+        """
+        return len(self._local_cache)
+
+    def register_local_cache(self, local_cache: LocalCache) -> None:
+        """
+        Invalidate entries of another in-process cache along with cached reads.
+
+        :param local_cache: in-process cache with tagged entries
+        :return:
+        """
+        self._local_caches.append(local_cache)
+
+    def cached(
+        self,
+        prefix: str,
+        schema: type[BaseSchema],
+        tags: Sequence[str] = (),
+        expire: int | None = None,
+    ) -> Callable[[CACHED_FUNCTION_TYPE], CACHED_FUNCTION_TYPE]:
+        """
+        Cache results of a coroutine method.
+
+        Tags are formatted with method arguments and `result`, for example
+        `"lobby:{lobby_id}"` or `"user:{result.user_id}"`. Tags that refer to
+        `result` are skipped for missing entities.
+
+        :param prefix: prefix of cache keys
+        :param schema: schema used to deserialize cached result
+        :param tags: tag templates
+        :param expire: expiration time, default expiration time if not provided
+        :return: decorator
+        """
+
+        def decorator(func: CACHED_FUNCTION_TYPE) -> CACHED_FUNCTION_TYPE:
+            signature = inspect.signature(func)
+            key_template = KeyTemplate(
+                namespace=self._namespace,
+                prefix=prefix,
+                parameters=[
+                    parameter
+                    for parameter in signature.parameters
+                    if parameter != "self"
+                ],
+            )
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs) -> BaseSchema | None:
+                if has_written.get():
+                    # Rows written in this context may not be committed yet.
+                    return await func(*args, **kwargs)
+                bound_arguments = signature.bind(*args, **kwargs)
+                bound_arguments.apply_defaults()
+                arguments = dict(bound_arguments.arguments)
+                arguments.pop("self", None)
+                entity_key = key_template.make_key(arguments)
+
+                local_entry = self._local_cache.get(entity_key)
+                if local_entry is not None:
+                    self.statistics.local_hits += 1
+                    return local_entry.value
+                return await self._read_through(
+                    entity_key=entity_key,
+                    schema=schema,
+                    tags=tags,
+                    arguments=arguments,
+                    expire=expire or self._expiration,
+                    read=functools.partial(func, *args, **kwargs),
+                )
+
+            return wrapper
+
+        return decorator
+
+    async def invalidate(self, *tags: str) -> None:
+        """
+        Remove cached entries with any of the tags.
+
+        Tags are published to other workers to invalidate their in-process
+        entries.
+
+        :param tags: tags
+        :return:
+        """
+        if not tags:
+            return
+        self._invalidate_local(tags)
+        try:
+            await self._delete_tagged(tags)
+        except (RedisError, RedisConnectionError) as error:
+            logger.warning("Cache is not available: %s", error)
+
+    async def start_invalidation_listener(self, redis_client: Redis) -> None:
+        """
+        Listen for tags invalidated by other workers.
+
+        Subscriber connection blocks while waiting for messages, so a client
+        that is not shared with other requests is expected.
+
+        :param redis_client: Redis client used for subscription
+        :return:
+        """
+        if self._listener is not None or not self._has_local_cache():
+            return
+        self._subscriber_client = redis_client
+        self._pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        self._listener = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        """
+        Stop listening for invalidations and close subscriber client.
+
+        :return:
+        """
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            await self._subscriber_client.aclose()
+            self._pubsub = None
+            self._subscriber_client = None
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                await self._receive_invalidations()
+            except RedisError as error:
+                # Invalidations published while disconnected are lost.
+                logger.warning("Cache invalidations are not available: %s", error)
+                for local_cache in self._local_caches:
+                    local_cache.clear()
+                await asyncio.sleep(settings.redis_socket_timeout)
+
+    async def _receive_invalidations(self) -> None:
+        await self._pubsub.subscribe(self._invalidation_channel)
+        async for message in self._pubsub.listen():
+            self._handle_invalidation(message["data"])
+
+    def _handle_invalidation(self, payload: bytes) -> None:
+        try:
+            invalidation = orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            logger.warning("Invalid cache invalidation: %s", payload)
+            return
+        if invalidation["sender"] != self._instance_id:
+            self._invalidate_local(invalidation["tags"])
+
+    async def _read_through(
+        self,
+        entity_key: str,
+        schema: type[BaseSchema],
+        tags: Sequence[str],
+        arguments: dict[str, Any],
+        expire: int | None,
+        read: Callable[[], Awaitable[BaseSchema | None]],
+    ) -> BaseSchema | None:
+        try:
+            stored_entity = await self._get_client().get(entity_key)
+        except (RedisError, RedisConnectionError) as error:
+            logger.warning("Cache is not available: %s", error)
+            self.statistics.misses += 1
+            return await read()
+
+        if stored_entity is None:
+            self.statistics.misses += 1
+            result = await read()
+        else:
+            self.statistics.redis_hits += 1
+            result = self._deserialize(stored_entity, schema)
+        formatted_tags = self._format_tags(tags, arguments, result)
+        if stored_entity is None:
+            await self._set(entity_key, result, formatted_tags, expire)
+        self._local_cache.set(key=entity_key, value=result, tags=formatted_tags)
+        return result
+
+    async def _set(
+        self,
+        entity_key: str,
+        value: BaseSchema | None,
+        tags: list[str],
+        expire: int | None,
+    ) -> None:
+        stored_value = self._empty_value if value is None else serialize(value)
+        try:
+            await self._store(entity_key, stored_value, tags, expire)
+        except (RedisError, RedisConnectionError) as error:
+            logger.warning("Cache is not available: %s", error)
+
+    async def _store(
+        self,
+        entity_key: str,
+        value: bytes,
+        tags: list[str],
+        expire: int | None,
+    ) -> None:
+        async with self._get_client().pipeline(transaction=False) as pipe:
+            pipe.set(entity_key, value, ex=expire)
+            for tag in tags:
+                tag_key = self._make_tag_key(tag)
+                pipe.sadd(tag_key, entity_key)
+                if expire:
+                    pipe.expire(tag_key, expire)
+            await pipe.execute()
+
+    async def _delete_tagged(self, tags: Sequence[str]) -> None:
+        redis_client = self._get_client()
+        tagged_entries = await self._get_tagged_entries(redis_client, tags)
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for tag_key, entity_keys in tagged_entries:
+                pipe.delete(*entity_keys)
+                pipe.srem(tag_key, *entity_keys)
+            if self._has_local_cache():
+                pipe.publish(
+                    self._invalidation_channel,
+                    orjson.dumps({"sender": self._instance_id, "tags": tags}),
+                )
+            await pipe.execute()
+
+    async def _get_tagged_entries(
+        self,
+        redis_client: Redis,
+        tags: Sequence[str],
+    ) -> list[tuple[str, set]]:
+        tag_keys = [self._make_tag_key(tag) for tag in tags]
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key in tag_keys:
+                pipe.smembers(key)
+            tagged_keys = await pipe.execute()
+        return [
+            (tag_key, entity_keys)
+            for tag_key, entity_keys in zip(tag_keys, tagged_keys)
+            if entity_keys
+        ]
+
+    def _deserialize(
+        self,
+        stored_entity: bytes,
+        schema: type[BaseSchema],
+    ) -> BaseSchema | None:
+        if stored_entity == self._empty_value:
+            return None
+        return deserialize(stored_entity, schema)
+
+    def _invalidate_local(self, tags: Sequence[str]) -> None:
+        for local_cache in self._local_caches:
+            local_cache.invalidate(*tags)
+
+    def _has_local_cache(self) -> bool:
+        return any(local_cache.is_enabled for local_cache in self._local_caches)
+
+    def _get_client(self) -> Redis:
+        return self._redis_client or redis_manager.client
+
+    def _make_tag_key(self, tag: str) -> str:
+        return f"{self._namespace}:tag:{tag}"
+
+    @classmethod
+    def _format_tags(
+        cls,
+        tags: Sequence[str],
+        arguments: dict[str, Any],
+        result: BaseSchema | None,
+    ) -> list[str]:
+        formatted_tags = []
+        for tag in tags:
+            with contextlib.suppress(AttributeError):
+                formatted_tags.append(tag.format(**arguments, result=result))
+        return formatted_tags
+
+
+redis_cache = RedisCache()
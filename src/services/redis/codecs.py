@@ -0,0 +1,204 @@
+import importlib
+from abc import ABC, abstractmethod
+from importlib.util import find_spec
+from typing import Any
+
+import orjson
+
+from api.enums.redis import RedisCodecEnum
+from api.schemas.base import BaseSchema
+from exceptions.service.serialization import (
+    CodecNotAvailableError,
+    JSONDecoderError,
+    JSONEncoderError,
+)
+from settings import settings
+
+# msgpack is installed with `msgpack` extra
+msgpack = importlib.import_module("msgpack") if find_spec("msgpack") else None
+
+
+class BaseCodec(ABC):
+    """
+    Encoder of values stored in Redis.
+
+    Encoded values are prefixed with codec version byte, so values written
+    by any registered codec can be decoded after default codec is changed.
+    Version bytes are control characters, so they are not confused with
+    values written without version.
+    """
+
+    name: RedisCodecEnum
+    version: int
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode value.
+
+        :param value: dumped schemas
+        :return: encoded value without version byte
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, value: bytes) -> Any:
+        """
+        Decode value.
+
+        :param value: encoded value without version byte
+        :return: decoded value
+        """
+        pass
+
+    def decode_schema(
+        self,
+        value: bytes,
+        schema: type[BaseSchema],
+    ) -> BaseSchema | None:
+        """
+        Decode and validate encoded object.
+
+        Codecs that can validate objects without decoding them to dictionary
+        first override it.
+
+        :param value: encoded value without version byte
+        :param schema: pydantic model
+        :return: pydantic model instance or None if value is not an object
+        """
+        decoded_value = self.decode(value)
+        if not isinstance(decoded_value, dict):
+            return None
+        return schema.model_validate(decoded_value)
+
+
+class JSONCodec(BaseCodec):
+    name = RedisCodecEnum.json
+    version = 1
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode value to JSON.
+
+        :param value: dumped schemas
+        :raises JSONEncoderError: if value can not be encoded
+        :return: encoded value
+        """
+        try:
+            return orjson.dumps(value)
+        except orjson.JSONEncodeError as json_error:
+            raise JSONEncoderError(value) from json_error
+
+    def decode(self, value: bytes) -> Any:
+        """
+        Decode value from JSON.
+
+        :param value: encoded value
+        :raises JSONDecoderError: if value can not be decoded
+        :return: decoded value
+        """
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError as json_error:
+            raise JSONDecoderError(value) from json_error
+
+    def decode_schema(
+        self,
+        value: bytes,
+        schema: type[BaseSchema],
+    ) -> BaseSchema | None:
+        """
+        Validate JSON object without decoding it to dictionary first.
+
+        :param value: encoded value
+        :param schema: pydantic model
+        :return: pydantic model instance or None if value is not an object
+        """
+        if value[:1] != b"{":
+            return None
+        return schema.model_validate_json(value)
+
+
+class MsgpackCodec(BaseCodec):
+    """Codec that stores values in MessagePack, which is smaller than JSON."""
+
+    name = RedisCodecEnum.msgpack
+    version = 2
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode value to MessagePack.
+
+        :param value: dumped schemas
+        :return: encoded value
+        """
+        return msgpack.packb(value)
+
+    def decode(self, value: bytes) -> Any:
+        """
+        Decode value from MessagePack.
+
+        :param value: encoded value
+        :return: decoded value
+        """
+        return msgpack.unpackb(value)
+
+
+class CodecRegistry:
+    """Codecs by name and version byte."""
+
+    def __init__(self, default_codec: RedisCodecEnum = settings.redis_codec):
+        self._default_codec = default_codec
+        self._codecs_by_name: dict[RedisCodecEnum, BaseCodec] = {}
+        self._codecs_by_version: dict[int, BaseCodec] = {}
+
+    @property
+    def default(self) -> BaseCodec:
+        """
+        Get codec used to encode values.
+
+        :return: codec
+        """
+        return self.get(self._default_codec)
+
+    def register(self, codec: BaseCodec) -> None:
+        """
+        Register a codec.
+
+        :param codec: codec
+        :raises ValueError: if version is taken by another codec
+        :return:
+        """
+        registered_codec = self._codecs_by_version.get(codec.version)
+        if registered_codec is not None and registered_codec.name != codec.name:
+            raise ValueError(f"Codec version {codec.version} is already registered")
+        self._codecs_by_name[codec.name] = codec
+        self._codecs_by_version[codec.version] = codec
+
+    def get(self, name: RedisCodecEnum) -> BaseCodec:
+        """
+        Get codec by name.
+
+        :param name: codec name
+        :raises CodecNotAvailableError: if codec is not registered
+        :return: codec
+        """
+        codec = self._codecs_by_name.get(name)
+        if codec is None:
+            raise CodecNotAvailableError(name.value)
+        return codec
+
+    def get_by_version(self, version: int) -> BaseCodec | None:
+        """
+        Get codec by version byte.
+
+        :param version: version byte
+        :return: codec or None if value is not versioned
+        """
+        return self._codecs_by_version.get(version)
+
+
+codec_registry = CodecRegistry()
+codec_registry.register(JSONCodec())
+if msgpack is not None:
+    codec_registry.register(MsgpackCodec())
@@ -1,12 +1,52 @@
-from typing import Annotated, AsyncGenerator
+from typing import Annotated, Sequence
 
 from fastapi import Depends
 from redis.asyncio.client import Redis
-from redis.exceptions import RedisError
 
 from cutom_types.redis import REDIS_VALUE_TYPE
-from exceptions.service.redis import RedisConnectionError
-from src.settings import settings
+from services.redis.manager import redis_manager
+
+
+class FakePipeline:
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._commands = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        """
+        Enter the pipeline, dummy.
+
+        :return: pipeline
+        """
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """
+        Exit the pipeline, dummy.
+
+        :return:
+        """
+        self._commands.clear()
+
+    def set(self, name: str, value: REDIS_VALUE_TYPE, **kwargs) -> None:
+        """
+        Queue set to the redis database, dummy.
+
+        :return:
+        """
+        self._commands.append((name, value))
+
+    async def execute(self) -> list:
+        """
+        Execute queued commands, dummy.
+
+        :return: command results
+        """
+        results = []
+        for name, value in self._commands:
+            results.append(await self._redis.set(name, value))
+        self._commands.clear()
+        return results
 
 
 class FakeRedis:
@@ -21,6 +61,14 @@ class FakeRedis:
         """
         return self._data.get(name)
 
+    async def mget(self, names: Sequence[str]) -> list[REDIS_VALUE_TYPE | None]:
+        """
+        Get many values from the redis database, dummy.
+
+        :return: Redis values or None for missing names
+        """
+        return [self._data.get(name) for name in names]
+
     async def set(self, name: str, value: REDIS_VALUE_TYPE, **kwargs) -> None:
         """
         Set to the redis database, dummy.
@@ -29,6 +77,14 @@ class FakeRedis:
         """
         self._data[name] = value
 
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        """
+        Create a pipeline, dummy.
+
+        :return: pipeline
+        """
+        return FakePipeline(self)
+
     async def delete(self, *names: str) -> None:
         """
         Delete from the redis database, dummy.
@@ -57,31 +113,17 @@ class FakeRedis:
         pass
 
 
-async def _get_redis_client() -> AsyncGenerator[Redis, None]:
+async def _get_redis_client() -> Redis:
     """
-    Get redis client as an iterator.
+    Get redis client shared by requests.
+
+    Connections are taken from the pool created on application startup and
+    checked by the pool health checks, so no ping is sent per request. If the
+    pool is not created, manager raises `RedisConnectionError`.
 
-    :raises RedisConnectionError: If redis client is not available
-    :yield: redis client
+    :return: redis client
     """
-    try:
-        redis_client = Redis(
-            host=settings.redis_host,
-            port=settings.redis_port,
-            password=settings.redis_password,
-            socket_timeout=settings.redis_socket_timeout,
-            encoding=settings.redis_encoding,
-        )
-    except RedisError as redis_error:
-        raise RedisConnectionError() from redis_error
-
-    response = await redis_client.ping()
-    if not response:
-        raise RedisConnectionError()
-    try:  # noqa: WPS501
-        yield redis_client
-    finally:
-        await redis_client.aclose()
+    return redis_manager.client
 
 
 async def get_redis_client(
@@ -0,0 +1,127 @@
+import time
+from collections import OrderedDict
+
+from api.schemas.base import BaseSchema
+from settings import settings
+
+
+class LocalCacheEntry:
+    """Cached schema with its tags and expiration time."""
+
+    def __init__(
+        self,
+        value: BaseSchema | None,
+        tags: tuple[str, ...],
+        expires_at: float,
+    ):
+        self.value = value
+        self.tags = tags
+        self.expires_at = expires_at
+
+
+class LocalCache:
+    """
+    In-process LRU cache of validated schemas.
+
+    Cached schemas are shared by all requests of a worker, so they must only be
+    read. Entries expire after `ttl` seconds, which bounds staleness if an
+    invalidation from another worker is lost. Least recently used entries are
+    evicted once cache holds `max_size` entries, zero size disables cache.
+    """
+
+    def __init__(
+        self,
+        max_size: int = settings.redis_local_cache_size,
+        ttl: float = settings.redis_local_cache_ttl,
+    ):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[str, LocalCacheEntry] = OrderedDict()
+        self._tagged_keys: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        """
+        Get number of cached entries.
+
+        :return: number of entries
+        """
+        return len(self._entries)
+
+    @property
+    def is_enabled(self) -> bool:
+        """
+        Check if cache can hold entries.
+
+        :return: whether cache is enabled
+        """
+        return self._max_size > 0
+
+    def get(self, key: str) -> LocalCacheEntry | None:
+        """
+        Get entry that has not expired.
+
+        :param key: cache key
+        :return: cached entry or None if not cached
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, value: BaseSchema | None, tags: list[str]) -> None:
+        """
+        Cache a schema or None for a missing entity.
+
+        :param key: cache key
+        :param value: schema
+        :param tags: tags of the entry
+        :return:
+        """
+        if not self.is_enabled:
+            return
+        self._remove(key)
+        self._entries[key] = LocalCacheEntry(
+            value=value,
+            tags=tuple(tags),
+            expires_at=time.monotonic() + self._ttl,
+        )
+        for tag in tags:
+            self._tagged_keys.setdefault(tag, set()).add(key)
+        if len(self._entries) > self._max_size:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, *tags: str) -> None:
+        """
+        Remove entries with any of the tags.
+
+        :param tags: tags
+        :return:
+        """
+        for tag in tags:
+            for key in self._tagged_keys.pop(tag, set()):
+                self._remove(key)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+
+        :return:
+        """
+        self._entries.clear()
+        self._tagged_keys.clear()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            tagged_keys = self._tagged_keys.get(tag)
+            if tagged_keys is None:
+                continue
+            tagged_keys.discard(key)
+            if not tagged_keys:
+                self._tagged_keys.pop(tag)
@@ -0,0 +1,70 @@
+from redis.asyncio import ConnectionPool, Redis
+
+from exceptions.service.redis import RedisConnectionError
+from settings import settings
+
+
+class RedisConnectionManager:
+    """
+    Owner of Redis client shared by all requests of a worker.
+
+    Client is backed by a connection pool, so requests reuse open connections
+    instead of connecting and pinging Redis each time.
+    """
+
+    def __init__(
+        self,
+        host: str = settings.redis_host,
+        port: int = settings.redis_port,
+        password: str | None = settings.redis_pass,
+        socket_timeout: int = settings.redis_socket_timeout,
+        max_connections: int = settings.redis_max_connections,
+        health_check_interval: int = settings.redis_health_check_interval,
+    ):
+        self._pool_options = {
+            "host": host,
+            "port": port,
+            "password": password,
+            "socket_timeout": socket_timeout,
+            "max_connections": max_connections,
+            "health_check_interval": health_check_interval,
+        }
+        self._client: Redis | None = None
+
+    @property
+    def client(self) -> Redis:
+        """
+        Get shared Redis client.
+
+        :raises RedisConnectionError: if manager is not connected
+        :return: Redis client
+        """
+        if self._client is None:
+            raise RedisConnectionError()
+        return self._client
+
+    def connect(self) -> None:
+        """
+        Create connection pool and client.
+
+        Connections are opened on first use.
+
+        :return:
+        """
+        if self._client is None:
+            connection_pool = ConnectionPool(**self._pool_options)
+            self._client = Redis(connection_pool=connection_pool)
+
+    async def close(self) -> None:
+        """
+        Close client and disconnect pooled connections.
+
+        :return:
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            await self._client.connection_pool.aclose()
+            self._client = None
+
+
+redis_manager = RedisConnectionManager()
@@ -1,11 +1,11 @@
-from typing import Annotated
+from typing import Annotated, Mapping, Sequence
 
 from fastapi import BackgroundTasks, Depends
 from redis.asyncio import Redis
 
 from api.schemas.base import BaseSchema
 from cutom_types.base import FUNCTION_TYPE
-from cutom_types.redis import REDIS_SETTABLE_TYPE, REDIS_VALUE_TYPE
+from cutom_types.redis import REDIS_KEY_TYPE, REDIS_SETTABLE_TYPE, REDIS_VALUE_TYPE
 from services.redis.dependencies import get_redis_client
 from services.redis.utils import deserialize, make_key, serialize
 from settings import settings
@@ -13,7 +13,7 @@ from settings import settings
 
 class RedisStoreService:
     _default_expiration = settings.redis_default_expiration_time
-    _default_namespace = settings.redis_default_namespace
+    _default_namespace = settings.redis_namespace
     _default_empty_value = settings.redis_empty_value
 
     def __init__(
@@ -46,6 +46,35 @@ class RedisStoreService:
         if stored_entity and stored_entity != self._empty_value:
             return self._deserialize(stored_entity, schema)
 
+    async def get_entities(
+        self,
+        entity_keys: Sequence[REDIS_KEY_TYPE],
+        schema: type[BaseSchema] = None,
+    ) -> tuple[dict, list]:
+        """
+        Get saved objects for many object keys in one round trip.
+
+        Objects saved with empty value are returned as None, so they are not
+        looked up again.
+
+        :param entity_keys: keys generated based on object args and kwargs
+        :param schema: a schema used to deserialize objects
+        :return: saved entities by key and keys that are not saved
+        """
+        if not entity_keys:
+            return {}, []
+        stored_entities = await self._store_client.mget(entity_keys)
+        entities = {}
+        missing_keys = []
+        for entity_key, stored_entity in zip(entity_keys, stored_entities):
+            if stored_entity is None:
+                missing_keys.append(entity_key)
+            elif self._is_empty(stored_entity):
+                entities[entity_key] = None
+            else:
+                entities[entity_key] = self._deserialize(stored_entity, schema)
+        return entities, missing_keys
+
     async def set_entity(
         self,
         entity_key: bytes | str | memoryview,
@@ -80,6 +109,33 @@ class RedisStoreService:
             keep_time_stamp=keep_time_stamp,
         )
 
+    async def set_entities(
+        self,
+        entities: Mapping[REDIS_KEY_TYPE, REDIS_SETTABLE_TYPE],
+        expire: int | Mapping[REDIS_KEY_TYPE, int] | None = None,
+    ) -> None:
+        """
+        Set many entities to storage in one round trip.
+
+        :param entities: objects by key name
+        :param expire: expiration time of all entities or by key name,
+            default expiration time if not provided
+        :return:
+        """
+        if not entities:
+            return
+        async with self._store_client.pipeline(transaction=False) as pipe:
+            for entity_key, value in entities.items():
+                entity_expire = expire
+                if isinstance(expire, Mapping):
+                    entity_expire = expire.get(entity_key)
+                pipe.set(
+                    name=entity_key,
+                    value=self._serialize(value),
+                    ex=entity_expire or self._expiration,
+                )
+            await pipe.execute()
+
     async def background_set_entity(
         self,
         entity_key: bytes | str | memoryview,
@@ -191,12 +247,12 @@ class RedisStoreService:
         """
         stored_entity = await self.get_entity(entity_key, schema)
         if not stored_entity:
-            self.set_entity(
+            await self.set_entity(
                 entity_key=entity_key,
                 value=value,
                 expire=expire,
             )
-            stored_entity = self.get_entity(entity_key, schema)
+            stored_entity = await self.get_entity(entity_key, schema)
         return stored_entity
 
     def make_entity_key(
@@ -248,6 +304,11 @@ class RedisStoreService:
             keepttl=keep_time_stamp,
         )
 
+    def _is_empty(self, stored_entity: REDIS_VALUE_TYPE) -> bool:
+        if isinstance(stored_entity, bytes):
+            return stored_entity == self._empty_value.encode(settings.redis_encoding)
+        return stored_entity == self._empty_value
+
     async def _add_to_background(self, func: FUNCTION_TYPE, *args, **kwargs) -> None:
         self._background_tasks.add_task(func, *args, **kwargs)
 
@@ -3,7 +3,7 @@ from typing import Any, Literal, Sequence
 
 from fastapi.types import IncEx
 from orjson import JSONDecodeError, JSONEncodeError, orjson
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 from pydantic_core import PydanticSerializationError
 
 from api.schemas.base import BaseSchema
@@ -18,8 +18,12 @@ from exceptions.service.serialization import (
     JSONEncoderError,
     NonSerializableError,
 )
+from services.redis.codecs import BaseCodec, codec_registry
 from settings import settings
 
+# Digest size of hashed cache keys, 128 bits
+KEY_HASH_SIZE = 16
+
 
 def make_key(
     namespace: str = "",
@@ -30,7 +34,7 @@ def make_key(
     kwargs: dict[str, Any],
 ) -> str:
     """
-    Make cache key based on md5 algorithm.
+    Make cache key based on canonical encoding of arguments.
 
     :param namespace: entity_key prefix
     :param prefix: entity_key prefix
@@ -41,10 +45,62 @@ def make_key(
     """
     if exclude_self:
         args = args[1:]
+    return f"{namespace}:{prefix}:{hash_key_arguments(args, kwargs)}"
+
+
+def hash_key_arguments(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """
+    Hash canonical encoding of function arguments.
+
+    Keyword arguments are sorted, pydantic models are encoded as dictionaries,
+    enums as their values and datetimes in ISO format, so equal arguments
+    have equal hashes regardless of their order and representation.
 
-    key_string = f"{args}:{kwargs}".encode()
-    entity_key = hashlib.md5(key_string, usedforsecurity=False)
-    return f"{namespace}:{prefix}:{entity_key.hexdigest()}"
+    :param args: function args
+    :param kwargs: function kwargs
+    :raises JSONEncoderError: if arguments can not be encoded
+    :return: hex digest of 128-bit hash
+    """
+    key_arguments = (args, kwargs)
+    try:
+        key_bytes = orjson.dumps(
+            key_arguments,
+            default=_encode_key_argument,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+    except JSONEncodeError as json_error:
+        raise JSONEncoderError(key_arguments) from json_error
+    return hashlib.blake2s(key_bytes, digest_size=KEY_HASH_SIZE).hexdigest()
+
+
+class KeyTemplate:
+    """
+    Key maker of a cached function.
+
+    Key format is prepared once from namespace, prefix and parameter names.
+    Keys of calls with only integer arguments, like entity ids, are formatted
+    from argument values without hashing, other keys are hashed by
+    `hash_key_arguments`.
+    """
+
+    def __init__(self, namespace: str, prefix: str, parameters: Sequence[str]):
+        self._key_prefix = f"{namespace}:{prefix}:"
+        self._key_format = self._key_prefix + ":".join(
+            f"{parameter}={{{index}}}" for index, parameter in enumerate(parameters)
+        )
+
+    def make_key(self, arguments: dict[str, Any]) -> str:
+        """
+        Make key for bound function arguments.
+
+        :param arguments: arguments by parameter name in parameters order
+        :return: key
+        """
+        values = tuple(arguments.values())
+        for value in values:
+            if isinstance(value, bool) or not isinstance(value, int):
+                return self._key_prefix + hash_key_arguments((), arguments)
+        return self._key_format.format(*values)
 
 
 def dump_pydantic_schema(  # noqa: WPS211
@@ -137,65 +193,105 @@ def validate_to_pydantic_schemas(values: Sequence, schema: type[BaseSchema]) ->
 
 def serialize(
     value: REDIS_SETTABLE_TYPE,
+    codec: BaseCodec | None = None,
 ) -> REDIS_VALUE_TYPE:
     """
     Serialize value.
 
-    Value is serialized to bytes by default.
+    Value is serialized to bytes by default codec and prefixed with codec
+    version byte. Single values are stored as is.
 
     If value is a pydantic model, it is converted to dictionary.
 
     If a value is a sequence, pydantic models inside are converted to dictionary.
 
     :param value: value to serialize
-    :raises JSONEncoderError: if value can not be encoded
+    :param codec: codec used instead of default codec
     :return: serialized value
     """
     if isinstance(value, REDIS_SINGLE_VALUE_TYPE):
         return value
 
-    if isinstance(value, BaseSchema):
-        value = dump_pydantic_schema(value)
-    elif isinstance(value, Sequence):
-        value = [
-            dump_pydantic_schema(item) if isinstance(item, BaseSchema) else item
-            for item in value
-        ]
-
-    try:
-        return orjson.dumps(value)
-    except JSONEncodeError as json_error:
-        raise JSONEncoderError(value) from json_error
+    codec = codec or codec_registry.default
+    return bytes((codec.version,)) + codec.encode(_dump_pydantic_schemas(value))
 
 
-def deserialize(  # noqa: C901
+def deserialize(
     value: REDIS_VALUE_TYPE,
     schema: type[BaseSchema] = None,
 ) -> REDIS_SETTABLE_TYPE:
     """
     Deserialize value.
 
+    Value is decoded by codec of its version byte. Values without version
+    byte are decoded from JSON or text.
+
     If pydantic model is provided, objects within decoded objected are validated.
+    Objects are validated without decoding them first if codec supports it.
 
     :param value: value to deserialize
     :param schema: pydantic model
-    :raises JSONDecoderError: if value can not be decoded
     :return: deserialized value
     """
     if isinstance(value, REDIS_SINGLE_VALUE_TYPE):
         return value
 
+    codec = codec_registry.get_by_version(value[0]) if value else None
+    if codec is None:
+        return _validate_decoded(_deserialize_unversioned(value), schema)
+    if schema:
+        validated_value = _decode_pydantic_schema(codec, value[1:], schema)
+        if validated_value is not None:
+            return validated_value
+    return _validate_decoded(codec.decode(value[1:]), schema)
+
+
+def _validate_decoded(
+    decoded_value: REDIS_SETTABLE_TYPE,
+    schema: type[BaseSchema] | None,
+) -> REDIS_SETTABLE_TYPE:
+    if isinstance(decoded_value, dict) and schema:
+        return validate_to_pydantic_schema(decoded_value, schema)
+    if isinstance(decoded_value, Sequence) and schema:
+        return validate_to_pydantic_schemas(decoded_value, schema)
+    return decoded_value
+
+
+def _dump_pydantic_schemas(value: REDIS_SETTABLE_TYPE) -> REDIS_SETTABLE_TYPE:
+    if isinstance(value, BaseSchema):
+        return dump_pydantic_schema(value)
+    if isinstance(value, Sequence):
+        return [
+            dump_pydantic_schema(item) if isinstance(item, BaseSchema) else item
+            for item in value
+        ]
+    return value
+
+
+def _decode_pydantic_schema(
+    codec: BaseCodec,
+    value: bytes | memoryview,
+    schema: type[BaseSchema],
+) -> BaseSchema | None:
+    try:
+        return codec.decode_schema(value, schema)
+    except ValidationError:
+        raise SchemaValidationError()
+
+
+def _deserialize_unversioned(value: bytes | memoryview) -> REDIS_SETTABLE_TYPE:
     try:
-        deserialized_value = orjson.loads(value)
+        return orjson.loads(value)
     except JSONDecodeError as json_error:
         try:  # noqa: WPS505
-            deserialized_value = value.decode(settings.redis_encoding)
+            return bytes(value).decode(settings.redis_encoding)
         except UnicodeDecodeError:
             raise JSONDecoderError(value) from json_error
 
-    if isinstance(deserialized_value, dict) and schema:
-        deserialized_value = validate_to_pydantic_schema(deserialized_value, schema)
-    elif isinstance(deserialized_value, Sequence) and schema:
-        deserialized_value = validate_to_pydantic_schemas(deserialized_value, schema)
 
-    return deserialized_value
+def _encode_key_argument(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Type {type(value).__name__} is not supported in keys")
@@ -8,6 +8,9 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from sqlalchemy import URL
 
 from api.enums.app_state import AppEnvironmentEnum
+from api.enums.query import CountStrategyEnum
+from api.enums.redis import RedisCodecEnum
+from api.enums.websocket import WebsocketBackplaneEnum, WebsocketOverflowPolicyEnum
 from cutom_types.database import ISOLATION_LEVEL_TYPE
 
 APP_ROOT = Path(__file__).parent
@@ -53,15 +56,28 @@ class Settings(BaseSettings):
     environment: Literal["test", "local", "dev", "prod"] = "local"
     service_name: str = "Jeopardy"
     secret_key: str = "jeopardy"
+    # Expose internal routes, such as database pool telemetry
+    internal_routes_enabled: bool = False
 
     # Authentication
     algorithm: str = "HS256"
     token_type: str = "bearer"
     access_token_expire_min: int = 60  # in minutes
+    # Threads that hash and verify passwords outside of the event loop
+    password_hash_workers: int = 4
+
+    # Max number of lobby memberships cached in process by every worker
+    lobby_membership_cache_size: int = 10000
+    # Seconds after which cached lobby memberships expire
+    lobby_membership_cache_ttl: float = 60
 
     # Pagination
     page_size: int = 50
     max_query_limit: int = 100
+    # How total number of rows is counted if not requested explicitly
+    pagination_count_strategy: CountStrategyEnum = CountStrategyEnum.exact
+    # Seconds for which total numbers of rows are cached in Redis
+    pagination_count_cache_ttl: int = 60
 
     # Variables for the database
     db_host: str = "localhost"
@@ -73,6 +89,33 @@ class Settings(BaseSettings):
     db_echo_pool: bool = False
     db_isolation_level: ISOLATION_LEVEL_TYPE = "READ COMMITTED"
     db_expire_on_commit: bool = False
+    # Connection pool of every engine, requests running queries concurrently
+    # hold up to three connections at once
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    # Seconds to wait for a free connection
+    db_pool_timeout: float = 10
+    # Seconds after which connections are reopened, -1 to keep them open
+    db_pool_recycle: int = 1800
+    # Test connections with a ping on checkout
+    db_pool_pre_ping: bool = False
+    # URLs of read replicas, reads are sent to the primary if empty
+    db_replica_urls: list[str] = []
+    # Max number of select statement templates cached by every worker,
+    # 0 to build statements on every call
+    db_statement_template_cache_size: int = 500
+    # Prepared statements cached by every connection in SQLAlchemy and in
+    # asyncpg, 0 to disable both when connecting through PgBouncer
+    db_prepared_statement_cache_size: int = 100
+    db_statement_cache_size: int = 100
+    # Name of connections in pg_stat_activity
+    db_application_name: str = "jeopardy"
+    # JIT compilation of queries, which only pays off for long analytical ones
+    db_jit: bool = False
+    # Milliseconds after which statements are cancelled, 0 to disable
+    db_statement_timeout: int = 30000
+    # Max number of rows sent in one batch by bulk inserts and COPY
+    db_bulk_batch_size: int = 1000
 
     # Redis
     redis_host: str = "localhost"
@@ -83,6 +126,39 @@ class Settings(BaseSettings):
     redis_encoding: str = "utf-8"
     redis_namespace: str = "jeopardy_"
     redis_empty_value: str = "not_found"
+    # Seconds after which cached service reads expire, bounds staleness if an
+    # invalidation races with a concurrent read
+    redis_cache_expiration_time: int = 60
+    # Encoding of stored values, `msgpack` requires `msgpack` extra
+    redis_codec: RedisCodecEnum = RedisCodecEnum.json
+    # Max number of connections in the pool of the shared client
+    redis_max_connections: int = 50
+    # Seconds of idleness after which a pooled connection is checked before use
+    redis_health_check_interval: int = 30
+    # Max number of validated schemas cached in process by every worker,
+    # 0 to read cached entries from Redis only
+    redis_local_cache_size: int = 1000
+    # Seconds after which schemas cached in process expire
+    redis_local_cache_ttl: float = 10
+
+    # Websocket
+    # Max number of outbound messages buffered per connection
+    ws_send_queue_size: int = 100
+    # What to do with a connection whose outbound buffer is full
+    ws_overflow_policy: WebsocketOverflowPolicyEnum = (
+        WebsocketOverflowPolicyEnum.drop_oldest
+    )
+    # Send messages as binary frames instead of text frames
+    ws_binary_frames: bool = False
+    # Backplane to share room messages between workers, use `redis` if
+    # `workers_count` is higher than 1
+    ws_backplane: WebsocketBackplaneEnum = WebsocketBackplaneEnum.memory
+    # Number of recent messages per room replayed to reconnecting clients
+    ws_replay_buffer_size: int = 100
+    # Seconds after which a room without connections is evicted
+    ws_room_idle_ttl: int = 300
+    # Seconds between evictions of idle rooms
+    ws_room_gc_interval: int = 60
 
     # Timezone as pytz timezone string
     pytz_timezone: str = "Etc/GMT-5"
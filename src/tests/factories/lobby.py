@@ -1,6 +1,7 @@
 from polyfactory.factories.pydantic_factory import ModelFactory
 
-from api.schemas.lobby import LobbyPlayerCreateSchema
+from api.schemas.lobby import LobbyInDBSchema, LobbyPlayerCreateSchema
+from api.schemas.nested.player import LobbyWithPlayersSchema
 from api.schemas.player import LobbyPlayerAddSchema
 
 
@@ -10,3 +11,11 @@ class LobbyPlayerCreateFactory(ModelFactory[LobbyPlayerCreateSchema]):
 
 class LobbyPlayerAddFactory(ModelFactory[LobbyPlayerAddSchema]):
     __model__ = LobbyPlayerAddSchema
+
+
+class LobbyWithPlayersFactory(ModelFactory[LobbyWithPlayersSchema]):
+    __model__ = LobbyWithPlayersSchema
+
+
+class LobbyInDBFactory(ModelFactory[LobbyInDBSchema]):
+    __model__ = LobbyInDBSchema
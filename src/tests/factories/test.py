@@ -1,6 +1,10 @@
-from fixtures.schemas import MockSchema
+from fixtures.schemas import MockKeyedSchema, MockSchema
 from polyfactory.factories.pydantic_factory import ModelFactory
 
 
 class TestSchemaFactory(ModelFactory[MockSchema]):
     __model__ = MockSchema
+
+
+class TestKeyedSchemaFactory(ModelFactory[MockKeyedSchema]):
+    __model__ = MockKeyedSchema
@@ -20,6 +20,7 @@ from database.manager import (
     DatabaseConnectionManager,
     create_database_connection_manager,
 )
+from database.membership import lobby_membership_cache
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +62,12 @@ async def _reset_database(test_db_url: URL) -> AsyncGenerator[None, None]:
     await recreate_test_database(test_db_url)
 
 
+@pytest.fixture(autouse=True)
+def _clear_lobby_membership_cache() -> Generator[None, None, None]:
+    yield
+    lobby_membership_cache.clear()
+
+
 @pytest.fixture
 async def db_manager(
     _setup_database: None,
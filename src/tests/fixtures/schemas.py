@@ -2,7 +2,7 @@ from datetime import datetime
 
 import pytest
 
-from api.schemas.base import BaseSchema
+from api.schemas.base import BaseSchema, CreatedAtSchemaMixin, IDSchemaMixin
 from api.schemas.pagination import PaginatedResultsSchema
 from api.schemas.query import DateTimeSchema, OrderSchema, PaginationSchema
 
@@ -12,10 +12,18 @@ class MockSchema(BaseSchema):
     name: str
 
 
+class MockKeyedSchema(BaseSchema, IDSchemaMixin, CreatedAtSchemaMixin):
+    name: str
+
+
 class MockPaginatedResultSchema(PaginatedResultsSchema):
     items: list[MockSchema]
 
 
+class MockKeyedPaginatedResultSchema(PaginatedResultsSchema):
+    items: list[MockKeyedSchema]
+
+
 @pytest.fixture(scope="session")
 def pagination_schema(default_page: int, default_page_size: int) -> PaginationSchema:
     return PaginationSchema(page=default_page, page_size=default_page_size)
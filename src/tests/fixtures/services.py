@@ -1,9 +1,15 @@
+from typing import AsyncGenerator
+
 import pytest
 from fastapi import Request
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from api.services import LobbyService, PlayerService, RouteService, UserService
 from api.services.pagination import PaginationService
 from database.dals import LobbyDAL, PlayerDAL, UserDAL
+from services.redis.cache import RedisCache
+from settings import settings
 
 
 @pytest.fixture
@@ -29,3 +35,23 @@ async def pagination_service(no_auth_request: Request) -> PaginationService:
 @pytest.fixture
 async def route_service(no_auth_request: Request) -> RouteService:
     return RouteService(request=no_auth_request)
+
+
+@pytest.fixture
+async def redis_cache() -> AsyncGenerator[RedisCache, None]:
+    namespace = f"{settings.redis_namespace}:test"
+    redis_client = Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        password=settings.redis_pass,
+        socket_connect_timeout=1,
+    )
+    try:
+        await redis_client.ping()
+    except RedisError:
+        await redis_client.aclose()
+        pytest.skip("Redis is not available")
+    yield RedisCache(redis_client=redis_client, namespace=namespace)
+    async for test_key in redis_client.scan_iter(f"{namespace}:*"):
+        await redis_client.delete(test_key)
+    await redis_client.aclose()
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import statistics
+import time
+from typing import Awaitable, Callable
+from unittest.mock import AsyncMock
+
+import pytest
+from factories.user import UserCreateFactory
+from fastapi import WebSocket
+from starlette.websockets import WebSocketState
+
+from api.authnetication import PasswordHasher, hash_password, verify_password
+from api.messages import LobbyConnectMessage
+from api.services import Room
+
+logger = logging.getLogger(__name__)
+
+LOGIN_STORM_SIZE = 8
+HASHER_WORKERS = 2
+TICK_INTERVAL = 0.005
+
+
+async def verify_on_event_loop(password: str, hashed_password: str) -> None:
+    for _ in range(LOGIN_STORM_SIZE):
+        verify_password(password, hashed_password)
+        await asyncio.sleep(0)
+
+
+async def measure_delivery_during_storm(
+    room_id: int,
+    login_storm: Callable[[], Awaitable],
+    hasher: PasswordHasher | None = None,
+) -> tuple[list[float], int]:
+    delivered = asyncio.Event()
+
+    async def mark_delivered(*args) -> None:
+        delivered.set()
+
+    websocket = AsyncMock(spec=WebSocket)
+    websocket.client_state = WebSocketState.CONNECTED
+    websocket.send_text.side_effect = mark_delivered
+    room = Room(room_id)
+    connection = await room.create_connection(room_id, websocket)
+
+    latencies = []
+    max_queue_depth = 0
+    async with connection:
+        storm = asyncio.create_task(login_storm())
+        while not storm.done():
+            delivered.clear()
+            start = time.perf_counter()
+            await room.send(LobbyConnectMessage(player_id=room_id))
+            await delivered.wait()
+            latencies.append(time.perf_counter() - start)
+            if hasher is not None:
+                max_queue_depth = max(max_queue_depth, hasher.queue_depth)
+            await asyncio.sleep(TICK_INTERVAL)
+        await storm
+    return latencies, max_queue_depth
+
+
+def log_latencies(mode: str, latencies: list[float]) -> None:
+    logger.warning(
+        "Websocket delivery latency during %d logins %s: median %.1f us, max %.1f us",
+        LOGIN_STORM_SIZE,
+        mode,
+        statistics.median(latencies) * 1e6,
+        max(latencies) * 1e6,
+    )
+
+
+@pytest.mark.benchmark
+async def test_websocket_latency_during_login_storm(default_id: int):
+    password = UserCreateFactory.build().password
+    hashed_password = hash_password(password)
+    hasher = PasswordHasher(max_workers=HASHER_WORKERS)
+
+    async def verify_in_thread_pool() -> None:
+        await asyncio.gather(
+            *(
+                hasher.verify(password, hashed_password)
+                for _ in range(LOGIN_STORM_SIZE)
+            ),
+        )
+
+    blocking_latencies, _ = await measure_delivery_during_storm(
+        default_id,
+        lambda: verify_on_event_loop(password, hashed_password),
+    )
+    pooled_latencies, max_queue_depth = await measure_delivery_during_storm(
+        default_id,
+        verify_in_thread_pool,
+        hasher,
+    )
+    hasher.close()
+
+    log_latencies("on event loop", blocking_latencies)
+    log_latencies("in thread pool", pooled_latencies)
+    logger.warning("Max hashing queue depth: %d", max_queue_depth)
+    assert max_queue_depth == LOGIN_STORM_SIZE - HASHER_WORKERS
+    assert hasher.pending_count == 0
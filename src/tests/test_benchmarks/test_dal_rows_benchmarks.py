@@ -0,0 +1,101 @@
+import logging
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.schemas.lobby import LobbyInDBSchema
+from api.schemas.user import UserInDBSchema
+from api.services.mixins import DBModelValidatorMixin
+from database.dals import LobbyDAL, UserDAL
+from database.models.lobby import LobbyModel
+from database.models.user import UserModel
+
+logger = logging.getLogger(__name__)
+
+PAGE_ROUNDS = 20
+ROWS_COUNT = 1000
+
+
+async def measure_page_time(select_page: Callable[[], Awaitable[Any]]) -> float:
+    page_times = []
+    for _ in range(PAGE_ROUNDS):
+        start = time.perf_counter()
+        await select_page()
+        page_times.append(time.perf_counter() - start)
+    return statistics.median(page_times)
+
+
+def log_page_times(name: str, models_time: float, rows_time: float) -> None:
+    logger.warning(
+        "%s of %d rows, median over %d rounds: models %.2f ms, rows %.2f ms",
+        name,
+        ROWS_COUNT,
+        PAGE_ROUNDS,
+        models_time * 1e3,
+        rows_time * 1e3,
+    )
+
+
+@pytest.mark.benchmark
+async def test_get_lobbies_time(db_session: AsyncSession, lobby_dal: LobbyDAL):
+    created_at = datetime(year=2000, month=1, day=1)
+    await db_session.execute(
+        insert(LobbyModel),
+        [
+            {"name": f"lobby_{row_id}", "created_at": created_at + timedelta(row_id)}
+            for row_id in range(ROWS_COUNT)
+        ],
+    )
+
+    async def select_models() -> list[LobbyInDBSchema]:
+        lobbies = await lobby_dal.select_page(limit=ROWS_COUNT)
+        return DBModelValidatorMixin.validate(lobbies, LobbyInDBSchema)
+
+    async def select_rows() -> list[LobbyInDBSchema]:
+        lobbies = await lobby_dal.get_lobbies(limit=ROWS_COUNT)
+        return DBModelValidatorMixin.validate(lobbies, LobbyInDBSchema)
+
+    log_page_times(
+        "get_lobbies",
+        models_time=await measure_page_time(select_models),
+        rows_time=await measure_page_time(select_rows),
+    )
+
+
+@pytest.mark.benchmark
+async def test_get_users_time(db_session: AsyncSession, user_dal: UserDAL):
+    created_at = datetime(year=2000, month=1, day=1)
+    await db_session.execute(
+        insert(UserModel),
+        [
+            {
+                "username": f"user_{row_id}",
+                "password": f"password_{row_id}",
+                "is_active": True,
+                "created_at": created_at + timedelta(row_id),
+            }
+            for row_id in range(ROWS_COUNT)
+        ],
+    )
+
+    async def select_models() -> list[UserInDBSchema]:
+        users = await user_dal.select_page(
+            limit=ROWS_COUNT,
+            where={"is_active": True},
+        )
+        return DBModelValidatorMixin.validate(users, UserInDBSchema)
+
+    async def select_rows() -> list[UserInDBSchema]:
+        users = await user_dal.get_users(limit=ROWS_COUNT)
+        return DBModelValidatorMixin.validate(users, UserInDBSchema)
+
+    log_page_times(
+        "get_users",
+        models_time=await measure_page_time(select_models),
+        rows_time=await measure_page_time(select_rows),
+    )
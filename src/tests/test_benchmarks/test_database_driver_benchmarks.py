@@ -0,0 +1,52 @@
+import logging
+import statistics
+import time
+
+import pytest
+from sqlalchemy import bindparam, cast, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from database.manager import (
+    DatabaseConnectionManager,
+    create_database_connection_manager,
+)
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+QUERY_ROUNDS = 500
+JSON_VALUE = {f"key_{index}": {"id": index, "name": "lobby"} for index in range(50)}
+
+
+async def measure_query_time(engine: AsyncEngine) -> float:
+    query = select(cast(bindparam("json_value", type_=JSONB), JSONB))
+    query_times = []
+    async with engine.connect() as connection:
+        for _ in range(QUERY_ROUNDS):
+            start = time.perf_counter()
+            await connection.execute(query, {"json_value": JSON_VALUE})
+            query_times.append(time.perf_counter() - start)
+    return statistics.median(query_times)
+
+
+@pytest.mark.benchmark
+async def test_driver_round_trip_time():
+    default_engine = create_async_engine(settings.db_url)
+    db_manager: DatabaseConnectionManager = create_database_connection_manager()
+    try:
+        default_time = await measure_query_time(default_engine)
+        tuned_time = await measure_query_time(db_manager._engine)  # noqa: WPS437
+    except (OSError, DBAPIError):
+        pytest.skip("Database is not available")
+    finally:
+        await default_engine.dispose()
+        await db_manager.close()
+
+    logger.warning(
+        "JSONB round trip median, %d queries: default %.1f us, tuned %.1f us",
+        QUERY_ROUNDS,
+        default_time * 1e6,
+        tuned_time * 1e6,
+    )
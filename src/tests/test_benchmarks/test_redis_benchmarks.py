@@ -0,0 +1,64 @@
+import functools
+import logging
+import statistics
+import time
+from typing import Any, Awaitable, Callable
+
+import pytest
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from services.redis.manager import RedisConnectionManager
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+REQUEST_ROUNDS = 200
+BENCHMARK_KEY = f"{settings.redis_namespace}:benchmark"
+
+
+async def request_with_new_client() -> None:
+    redis_client = Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        password=settings.redis_pass,
+        socket_timeout=settings.redis_socket_timeout,
+    )
+    await redis_client.ping()
+    await redis_client.get(BENCHMARK_KEY)
+    await redis_client.aclose()
+
+
+async def measure_latency(request: Callable[[], Awaitable[Any]]) -> float:
+    start = time.perf_counter()
+    await request()
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+async def test_redis_client_per_request_overhead():
+    redis_manager = RedisConnectionManager()
+    redis_manager.connect()
+    try:
+        await redis_manager.client.ping()
+    except RedisError:
+        await redis_manager.close()
+        pytest.skip("Redis is not available")
+
+    request_with_shared_client = functools.partial(
+        redis_manager.client.get,
+        BENCHMARK_KEY,
+    )
+    per_request_latencies = []
+    shared_latencies = []
+    for _ in range(REQUEST_ROUNDS):
+        per_request_latencies.append(await measure_latency(request_with_new_client))
+        shared_latencies.append(await measure_latency(request_with_shared_client))
+    await redis_manager.close()
+
+    logger.warning(
+        "Redis GET median, %d requests: new client %.1f us, shared client %.1f us",
+        REQUEST_ROUNDS,
+        statistics.median(per_request_latencies) * 1e6,
+        statistics.median(shared_latencies) * 1e6,
+    )
@@ -0,0 +1,60 @@
+import logging
+import statistics
+import time
+
+import pytest
+from factories.lobby import LobbyWithPlayersFactory
+from orjson import orjson
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from api.enums.redis import RedisCodecEnum
+from api.schemas.nested.player import LobbyWithPlayersSchema
+from api.schemas.player import PlayerInDBSchema
+from exceptions.service.serialization import CodecNotAvailableError
+from services.redis.codecs import codec_registry
+from services.redis.utils import deserialize, serialize
+
+logger = logging.getLogger(__name__)
+
+DECODE_ROUNDS = 500
+PLAYERS_COUNT = 50
+
+
+class PlayerInDBFactory(ModelFactory[PlayerInDBSchema]):
+    __model__ = PlayerInDBSchema
+
+
+def measure_decode_time(serialized_lobby: bytes) -> float:
+    decode_times = []
+    for _ in range(DECODE_ROUNDS):
+        start = time.perf_counter()
+        deserialize(serialized_lobby, LobbyWithPlayersSchema)
+        decode_times.append(time.perf_counter() - start)
+    return statistics.median(decode_times)
+
+
+def log_encoding(name: str, encoded_lobby: bytes) -> None:
+    logger.warning(
+        "Lobby with %d players, %s: %d bytes, decode median %.1f us",
+        PLAYERS_COUNT,
+        name,
+        len(encoded_lobby),
+        measure_decode_time(encoded_lobby) * 1e6,
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("codec_name", list(RedisCodecEnum))
+def test_redis_codec_size_and_decode_time(codec_name: RedisCodecEnum):
+    try:
+        codec = codec_registry.get(codec_name)
+    except CodecNotAvailableError:
+        pytest.skip(f"Codec {codec_name.value} is not installed")
+    lobby = LobbyWithPlayersFactory.build(
+        players=PlayerInDBFactory.batch(PLAYERS_COUNT),
+    )
+    unversioned_lobby = orjson.dumps(lobby.model_dump(mode="json"))
+    serialized_lobby = serialize(lobby, codec=codec)
+
+    log_encoding("unversioned JSON", unversioned_lobby)
+    log_encoding(f"{codec_name.value} codec", serialized_lobby)
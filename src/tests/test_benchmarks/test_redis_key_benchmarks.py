@@ -0,0 +1,64 @@
+import hashlib
+import logging
+import statistics
+import time
+from typing import Any, Callable
+
+import pytest
+from factories.test import TestSchemaFactory
+
+from services.redis.utils import KeyTemplate, make_key
+
+logger = logging.getLogger(__name__)
+
+KEY_ROUNDS = 5000
+
+
+def make_repr_key(namespace: str, prefix: str, kwargs: dict[str, Any]) -> str:
+    key_string = f"{()}:{kwargs}".encode()
+    entity_key = hashlib.md5(key_string, usedforsecurity=False)
+    return f"{namespace}:{prefix}:{entity_key.hexdigest()}"
+
+
+def measure_key_time(make: Callable[[], str]) -> float:
+    key_times = []
+    for _ in range(KEY_ROUNDS):
+        start = time.perf_counter()
+        make()
+        key_times.append(time.perf_counter() - start)
+    return statistics.median(key_times)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("argument_type", ["id", "schema"])
+def test_cache_key_time(argument_type: str, default_id: int):
+    if argument_type == "id":
+        kwargs = {"lobby_id": default_id}
+    else:
+        kwargs = {"lobby": TestSchemaFactory.build()}
+    key_template = KeyTemplate(
+        namespace="benchmark",
+        prefix="lobby",
+        parameters=list(kwargs),
+    )
+
+    repr_time = measure_key_time(
+        lambda: make_repr_key("benchmark", "lobby", kwargs),
+    )
+    canonical_time = measure_key_time(
+        lambda: make_key("benchmark", "lobby", args=(), kwargs=kwargs),
+    )
+    template_time = measure_key_time(lambda: key_template.make_key(kwargs))
+    key_times = {
+        "repr and md5": repr_time,
+        "canonical": canonical_time,
+        "template": template_time,
+    }
+    for key_maker, key_time in key_times.items():
+        logger.warning(
+            "Cache key of %s argument, %s: median %.2f us over %d rounds",
+            argument_type,
+            key_maker,
+            key_time * 1e6,
+            KEY_ROUNDS,
+        )
@@ -0,0 +1,174 @@
+import logging
+import statistics
+import time
+from typing import Any, Awaitable, Callable
+
+import pytest
+from factories.lobby import LobbyInDBFactory, LobbyWithPlayersFactory
+from factories.user import UserInDBFactory
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from api.responses import SchemaResponse
+from api.schemas.base import BaseSchema
+from api.schemas.lobby import PaginatedLobbiesSchema
+from api.schemas.nested.player import LobbyWithLinkSchema, LobbyWithLinkShowSchema
+from api.schemas.pagination import PaginatedResultsSchema
+from api.schemas.player import PlayerInDBSchema
+from api.schemas.user import PaginatedUsersInDBSchema, PaginatedUsersShowSchema
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_ROUNDS = 500
+PAGE_ROUNDS = 50
+PLAYERS_COUNT = 50
+JOIN_URL = "http://localhost/join"
+
+
+class PlayerInDBFactory(ModelFactory[PlayerInDBSchema]):
+    __model__ = PlayerInDBSchema
+
+
+async def measure_time(
+    create_response: Callable[[], Awaitable[Any]],
+    rounds: int,
+) -> float:
+    response_times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await create_response()
+        response_times.append(time.perf_counter() - start)
+    return statistics.median(response_times)
+
+
+def create_fastapi_response(
+    response_model: type[BaseSchema],
+) -> Callable[[Any], Awaitable[bytes]]:
+    response_field = create_model_field(
+        name="Response",
+        type_=response_model,
+        mode="serialization",
+    )
+
+    async def create_response(content: Any) -> bytes:
+        response_content = await serialize_response(
+            field=response_field,
+            response_content=content,
+        )
+        return ORJSONResponse(response_content).body
+
+    return create_response
+
+
+async def measure_schema_response(content: Any, schema: type[BaseSchema]) -> bytes:
+    return SchemaResponse(content, schema=schema).body
+
+
+def create_page(
+    page_schema: type[PaginatedResultsSchema],
+    items: list[BaseSchema],
+) -> PaginatedResultsSchema:
+    return page_schema(
+        page=1,
+        page_size=len(items),
+        page_count=1,
+        total=len(items),
+        items=items,
+        next=None,
+        previous=None,
+    )
+
+
+@pytest.mark.benchmark
+async def test_lobby_response_time():
+    lobby = LobbyWithPlayersFactory.build(
+        players=PlayerInDBFactory.batch(PLAYERS_COUNT),
+    )
+    create_response = create_fastapi_response(LobbyWithLinkShowSchema)
+
+    revalidated_time = await measure_time(
+        lambda: create_response(
+            LobbyWithLinkSchema.model_validate(
+                {**lobby.model_dump(), "join_url": JOIN_URL},
+            ),
+        ),
+        rounds=RESPONSE_ROUNDS,
+    )
+    constructed_time = await measure_time(
+        lambda: create_response(
+            LobbyWithLinkSchema.from_base(lobby, join_url=JOIN_URL),
+        ),
+        rounds=RESPONSE_ROUNDS,
+    )
+    schema_response_time = await measure_time(
+        lambda: measure_schema_response(
+            LobbyWithLinkSchema.from_base(lobby, join_url=JOIN_URL),
+            LobbyWithLinkShowSchema,
+        ),
+        rounds=RESPONSE_ROUNDS,
+    )
+    response_times = {
+        "revalidated": revalidated_time,
+        "constructed": constructed_time,
+        "schema response": schema_response_time,
+    }
+    for response, response_time in response_times.items():
+        logger.warning(
+            "Lobby response with %d players, %s: median %.1f us over %d rounds",
+            PLAYERS_COUNT,
+            response,
+            response_time * 1e6,
+            RESPONSE_ROUNDS,
+        )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("page_size", [100, 1000])
+@pytest.mark.parametrize(
+    ("page", "response_model"),
+    [
+        (
+            lambda page_size: create_page(
+                PaginatedLobbiesSchema,
+                LobbyInDBFactory.batch(page_size),
+            ),
+            PaginatedLobbiesSchema,
+        ),
+        (
+            lambda page_size: create_page(
+                PaginatedUsersInDBSchema,
+                UserInDBFactory.batch(page_size),
+            ),
+            PaginatedUsersShowSchema,
+        ),
+    ],
+    ids=["lobbies", "users"],
+)
+async def test_page_response_time(
+    page_size: int,
+    page: Callable[[int], PaginatedResultsSchema],
+    response_model: type[PaginatedResultsSchema],
+):
+    content = page(page_size)
+    create_response = create_fastapi_response(response_model)
+    fastapi_body = await create_response(content)
+    schema_response_body = await measure_schema_response(content, response_model)
+    assert fastapi_body == schema_response_body
+
+    fastapi_time = await measure_time(
+        lambda: create_response(content),
+        rounds=PAGE_ROUNDS,
+    )
+    schema_response_time = await measure_time(
+        lambda: measure_schema_response(content, response_model),
+        rounds=PAGE_ROUNDS,
+    )
+    logger.warning(
+        "%s page of %d items, median: response_model %.2f ms, schema response %.2f ms",
+        response_model.__name__,
+        page_size,
+        fastapi_time * 1e3,
+        schema_response_time * 1e3,
+    )
@@ -0,0 +1,59 @@
+import logging
+import statistics
+import time
+from datetime import datetime
+from typing import Any, Callable
+
+import pytest
+from sqlalchemy import Select
+
+from database.query_managers import UserQueryManager
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_ROUNDS = 2000
+
+SELECT_CALLS = {
+    "user": {
+        "where": {"id": 1, "is_active": True},
+        "related": ["lobbies", "player_associations"],
+    },
+    "page": {
+        "where": {"is_active": True},
+        "order": {"created_at": "desc", "id": "desc"},
+        "limit": 100,
+        "seek": ("lt", {"created_at": datetime(year=2000, month=1, day=1), "id": 1}),
+    },
+}
+
+
+def measure_statement_time(create_statement: Callable[[], Select]) -> float:
+    statement_times = []
+    for _ in range(STATEMENT_ROUNDS):
+        start = time.perf_counter()
+        statement = create_statement()
+        statement._generate_cache_key()  # noqa: WPS437
+        statement_times.append(time.perf_counter() - start)
+    return statistics.median(statement_times)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("select_call", SELECT_CALLS)
+def test_select_statement_time(select_call: str):
+    select_kwargs: dict[str, Any] = SELECT_CALLS[select_call]
+
+    select_time = measure_statement_time(
+        lambda: UserQueryManager.select(**select_kwargs),
+    )
+    template_time = measure_statement_time(
+        lambda: UserQueryManager.select_template(**select_kwargs)[0],
+    )
+    timings = {"built": select_time, "template": template_time}
+    for timing_name, timing in timings.items():
+        logger.warning(
+            "%s select statement and cache key, %s median over %d rounds: %.2f us",
+            select_call,
+            timing_name,
+            STATEMENT_ROUNDS,
+            timing * 1e6,
+        )
@@ -0,0 +1,78 @@
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable
+
+import pytest
+
+from api.schemas.base import BaseSchema
+from api.schemas.lobby import LobbyInDBSchema
+from api.schemas.user import UserInDBSchema
+from api.services.mixins import DBModelValidatorMixin
+from database.base_model import BaseDBModel
+from database.models.lobby import LobbyModel
+from database.models.user import UserModel
+
+logger = logging.getLogger(__name__)
+
+
+def create_lobby_row(row_id: int, created_at: datetime) -> dict[str, Any]:
+    return {"id": row_id, "name": f"lobby_{row_id}", "created_at": created_at}
+
+
+def create_user_row(row_id: int, created_at: datetime) -> dict[str, Any]:
+    return {
+        "id": row_id,
+        "username": f"user_{row_id}",
+        "password": f"password_{row_id}",
+        "is_active": True,
+        "created_at": created_at,
+        "modified_at": created_at,
+    }
+
+
+def measure_time(validate: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    validate()
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("rows_count", [1000, 10000, 100000])
+@pytest.mark.parametrize(
+    ("schema", "db_model", "create_row"),
+    [
+        (LobbyInDBSchema, LobbyModel, create_lobby_row),
+        (UserInDBSchema, UserModel, create_user_row),
+    ],
+)
+def test_bulk_validation_time(
+    rows_count: int,
+    schema: type[BaseSchema],
+    db_model: type[BaseDBModel],
+    create_row: Callable[[int, datetime], dict[str, Any]],
+):
+    created_at = datetime.now()
+    rows = [create_row(row_id, created_at) for row_id in range(rows_count)]
+    db_models = [db_model(**row) for row in rows]
+
+    loop_time = measure_time(
+        lambda: [schema.model_validate(model) for model in db_models],
+    )
+    bulk_time = measure_time(
+        lambda: DBModelValidatorMixin.validate(db_models, schema),
+    )
+    rows_time = measure_time(lambda: DBModelValidatorMixin.validate(rows, schema))
+    validation_times = {
+        "model_validate loop": loop_time,
+        "bulk validation of models": bulk_time,
+        "bulk validation of rows": rows_time,
+    }
+    for validation, validation_time in validation_times.items():
+        logger.warning(
+            "%d rows of %s, %s: %.1f ms",
+            rows_count,
+            schema.__name__,
+            validation,
+            validation_time * 1e3,
+        )
@@ -0,0 +1,146 @@
+import asyncio
+import json
+import logging
+import statistics
+import time
+from typing import AsyncGenerator
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import WebSocket
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from starlette.websockets import WebSocketState
+from utilities import measure_async_cpu_time
+
+from api.messages import LobbyConnectMessage, UserMessage
+from api.services import ConnectionManager, InMemoryBackplane, RedisBackplane, Room
+from api.services.websocket.backplane import BaseBackplane
+from settings import settings
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_ROUNDS = 50
+DELIVERY_ROUNDS = 100
+
+
+@pytest.fixture(params=["memory", "redis"])
+async def worker_backplanes(
+    request: pytest.FixtureRequest,
+) -> AsyncGenerator[tuple[BaseBackplane, BaseBackplane], None]:
+    if request.param == "memory":
+        backplane = InMemoryBackplane()
+        yield backplane, backplane
+        return
+
+    redis_clients = [
+        Redis(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            password=settings.redis_pass,
+            socket_connect_timeout=1,
+        )
+        for _ in range(2)
+    ]
+    try:
+        await redis_clients[0].ping()
+    except RedisError:
+        for redis_client in redis_clients:
+            await redis_client.aclose()
+        pytest.skip("Redis is not available")
+    sender_backplane, receiver_backplane = [
+        RedisBackplane(client) for client in redis_clients
+    ]
+    yield sender_backplane, receiver_backplane
+    await sender_backplane.close()
+    await receiver_backplane.close()
+
+
+def create_mock_websocket() -> AsyncMock:
+    mock_websocket = AsyncMock(spec=WebSocket)
+    mock_websocket.client_state = WebSocketState.CONNECTED
+    return mock_websocket
+
+
+async def create_room(room_id: int, room_size: int) -> Room:
+    room = Room(room_id)
+    for connection_id in range(room_size):
+        await room.create_connection(connection_id, create_mock_websocket())
+    return room
+
+
+async def send_encoding_per_receiver(room: Room, message_text: str) -> None:
+    message = UserMessage(message=message_text, sender=room.id)
+    for connection in room._connections.values():
+        connection.enqueue(json.dumps(message.to_dict()))
+
+
+async def send_encoding_once(room: Room, message_text: str) -> None:
+    await room.send(UserMessage(message=message_text, sender=room.id))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("room_size", [1, 10, 30, 100])
+async def test_broadcast_cpu_time(default_id: int, room_size: int):
+    message_text = "Which planet is known as the Red Planet?"
+    per_receiver_room = await create_room(default_id, room_size)
+    per_receiver_time = await measure_async_cpu_time(
+        send_encoding_per_receiver,
+        per_receiver_room,
+        message_text,
+        rounds=BROADCAST_ROUNDS,
+    )
+    encode_once_room = await create_room(default_id, room_size)
+    encode_once_time = await measure_async_cpu_time(
+        send_encoding_once,
+        encode_once_room,
+        message_text,
+        rounds=BROADCAST_ROUNDS,
+    )
+
+    logger.warning(
+        "Broadcast CPU time, room size %d: per receiver %.1f us, encode once %.1f us",
+        room_size,
+        per_receiver_time * 1e6,
+        encode_once_time * 1e6,
+    )
+
+
+@pytest.mark.benchmark
+async def test_cross_worker_delivery_latency(
+    default_id: int,
+    worker_backplanes: tuple[BaseBackplane, BaseBackplane],
+):
+    sender_backplane, receiver_backplane = worker_backplanes
+    sender_worker = ConnectionManager(backplane=sender_backplane)
+    receiver_worker = ConnectionManager(backplane=receiver_backplane)
+    delivered = asyncio.Event()
+
+    async def mark_delivered(*args) -> None:
+        delivered.set()
+
+    receiver_websocket = create_mock_websocket()
+    receiver_websocket.send_text.side_effect = mark_delivered
+    receiver_connection = await receiver_worker.create_connection(
+        room_id=default_id,
+        connection_id=default_id,
+        websocket=receiver_websocket,
+    )
+    sender_room = sender_worker.get_or_create_room(default_id)
+
+    latencies = []
+    async with receiver_connection:
+        for _ in range(DELIVERY_ROUNDS):
+            delivered.clear()
+            start = time.perf_counter()
+            await sender_room.send(LobbyConnectMessage(player_id=default_id))
+            await asyncio.wait_for(delivered.wait(), timeout=1)
+            latencies.append(time.perf_counter() - start)
+
+    logger.warning(
+        "Cross worker delivery latency, %s backplane: median %.1f us, max %.1f us",
+        type(sender_backplane).__name__,
+        statistics.median(latencies) * 1e6,
+        max(latencies) * 1e6,
+    )
+    assert len(latencies) == DELIVERY_ROUNDS
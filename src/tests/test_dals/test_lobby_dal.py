@@ -1,6 +1,14 @@
+from datetime import datetime
+
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import AsyncSession
 from utilities import choose_from_list
 
+from api.enums import CursorDirectionEnum, OrderQueryEnum
+from api.schemas.lobby import LobbyCreateSchema
+from api.schemas.query import CursorSchema
 from database.dals import LobbyDAL
+from database.manager import create_database_connection_manager
 from database.models.lobby import LobbyModel
 from database.models.player import PlayerModel
 
@@ -12,8 +20,40 @@ async def test_get_lobbies(
 ):
     fetched_lobbies = await lobby_dal.get_lobbies(default_limit)
     assert len(fetched_lobbies) == len(lobbies)
-    for lobby in fetched_lobbies:
-        assert lobby in lobbies
+    lobbies_by_id = {lobby.id: lobby for lobby in lobbies}
+    for fetched_lobby in fetched_lobbies:
+        lobby = lobbies_by_id[fetched_lobby.id]
+        assert fetched_lobby.name == lobby.name
+        assert fetched_lobby.created_at == lobby.created_at
+
+
+async def test_get_lobbies_with_cursor(
+    lobbies: list[LobbyModel],
+    lobby_dal: LobbyDAL,
+):
+    page_size = 1
+    first_page = await lobby_dal.get_lobbies(limit=page_size)
+    next_cursor = CursorSchema(
+        direction=CursorDirectionEnum.next,
+        order=OrderQueryEnum.desc,
+        created_at=first_page[-1].created_at,
+        id=first_page[-1].id,
+    )
+    next_lobbies = await lobby_dal.get_lobbies(limit=len(lobbies), cursor=next_cursor)
+    assert len(next_lobbies) == len(lobbies) - page_size
+    assert first_page[0] not in next_lobbies
+
+    previous_cursor = CursorSchema(
+        direction=CursorDirectionEnum.previous,
+        order=OrderQueryEnum.desc,
+        created_at=next_lobbies[0].created_at,
+        id=next_lobbies[0].id,
+    )
+    previous_lobbies = await lobby_dal.get_lobbies(
+        limit=page_size,
+        cursor=previous_cursor,
+    )
+    assert previous_lobbies == first_page
 
 
 async def test_get_lobby_by_id(
@@ -30,3 +70,62 @@ async def test_get_lobby_by_id(
     assert len(fetched_lobby.player_associations) == len(players_in_lobby)
     for player in fetched_lobby.player_associations:
         assert player in players_in_lobby
+
+
+async def test_read_own_writes_with_replica(
+    db_session: AsyncSession,
+    test_db_url: URL,
+):
+    replica_db_manager = create_database_connection_manager(
+        db_url=test_db_url,
+        db_replica_urls=[test_db_url],
+    )
+    replica_lobby_dal = LobbyDAL(db_session=db_session, db_manager=replica_db_manager)
+    assert set(replica_db_manager.pool_metrics()) == {"primary", "replica_0"}
+
+    await replica_lobby_dal.get_lobbies(limit=1)
+    replica_checkouts = replica_db_manager.pool_metrics()["replica_0"]["checkouts"]
+    assert replica_checkouts == 1
+
+    lobby = await replica_lobby_dal.create_lobby(LobbyCreateSchema(name="replica"))
+    fetched_lobbies = await replica_lobby_dal.get_lobbies(limit=1)
+    assert fetched_lobbies[0].id == lobby.id
+    pool_metrics = replica_db_manager.pool_metrics()
+    assert pool_metrics["replica_0"]["checkouts"] == replica_checkouts
+    assert pool_metrics["primary"]["checkouts"] == 0
+    await replica_db_manager.close()
+
+
+async def test_copy_rows(lobby_dal: LobbyDAL, default_timestamp: datetime):
+    first_id = 100
+    rows = [
+        {
+            "id": first_id + offset,
+            "name": f"lobby_{offset}",
+            "created_at": default_timestamp,
+        }
+        for offset in range(5)
+    ]
+    copied_count = await lobby_dal.copy_rows(
+        rows,
+        columns=["id", "name", "created_at"],
+        batch_size=2,
+    )
+    assert copied_count == len(rows)
+    copied_lobby = await lobby_dal.get_lobby_by_id(first_id)
+    assert copied_lobby.name == rows[0]["name"]
+
+
+async def test_copy_rows_rolled_back_with_session(
+    db_session: AsyncSession,
+    lobby_dal: LobbyDAL,
+    default_timestamp: datetime,
+):
+    rows = [{"id": 100, "name": "lobby", "created_at": default_timestamp}]
+    copied_count = await lobby_dal.copy_rows(
+        rows,
+        columns=["id", "name", "created_at"],
+    )
+    assert copied_count == len(rows)
+    await db_session.rollback()
+    assert await lobby_dal.get_lobby_by_id(rows[0]["id"]) is None
@@ -3,6 +3,7 @@ from utilities import choose_from_list
 
 from api.enums import PlayerStateEnum
 from database.dals import PlayerDAL
+from database.membership import lobby_membership_cache
 from database.models.player import PlayerModel
 
 
@@ -46,3 +47,76 @@ async def test_ban_player_by_id(
     player = choose_from_list(players_in_lobby)
     banned_player = await player_dal.ban_player_by_id(player.id)
     assert banned_player.state == PlayerStateEnum.banned
+
+
+async def test_check_user_in_lobby(
+    players: list[list[PlayerModel]],
+    player_dal: PlayerDAL,
+):
+    players_in_lobby = choose_from_list(players)
+    player = choose_from_list(players_in_lobby)
+    assert await player_dal.check_user_in_lobby(player.user_id, player.lobby_id)
+    assert lobby_membership_cache.contains(player.user_id, player.lobby_id)
+
+    await player_dal.ban_player_by_id(player.id)
+    assert not lobby_membership_cache.contains(player.user_id, player.lobby_id)
+
+    missing_lobby_id = (
+        max(
+            lobby_player.lobby_id
+            for lobby_players in players
+            for lobby_player in lobby_players
+        )
+        + 1
+    )
+    assert not await player_dal.check_user_in_lobby(player.user_id, missing_lobby_id)
+
+
+async def test_upsert_many(
+    players: list[list[PlayerModel]],
+    player_dal: PlayerDAL,
+):
+    waiting_players = [
+        player
+        for lobby_players in players
+        for player in lobby_players
+        if player.state == PlayerStateEnum.waiting
+    ]
+    rows = [
+        {
+            "id": player.id,
+            "name": player.name,
+            "state": PlayerStateEnum.playing,
+            "user_id": player.user_id,
+            "lobby_id": player.lobby_id,
+        }
+        for player in waiting_players
+    ]
+    upserted_players = await player_dal.upsert_many(
+        rows,
+        constraint="uq_lobby_user",
+        update_columns=["state"],
+        batch_size=1,
+    )
+    assert len(upserted_players) == len(waiting_players)
+    for upserted_player in upserted_players:
+        assert upserted_player.state == PlayerStateEnum.playing
+
+    skipped_players = await player_dal.upsert_many(rows, constraint="uq_lobby_user")
+    assert not skipped_players
+
+
+async def test_upsert_many_invalidates_memberships(
+    players: list[list[PlayerModel]],
+    player_dal: PlayerDAL,
+):
+    player = choose_from_list(choose_from_list(players))
+    assert await player_dal.check_user_in_lobby(player.user_id, player.lobby_id)
+
+    await player_dal.upsert_many(
+        [{"name": player.name, "user_id": player.user_id, "lobby_id": player.lobby_id}],
+        constraint="uq_lobby_user",
+        update_columns=["name"],
+        returning=False,
+    )
+    assert not lobby_membership_cache.contains(player.user_id, player.lobby_id)
@@ -13,10 +13,10 @@ async def test_get_users(
 ):
     active_users = await user_dal.get_users(default_limit)
     assert len(active_users) == len(users["active"])
+    active_user_ids = {user.id for user in users["active"]}
     for user in active_users:
-        assert user in users["active"]
-    for inactive_user in users["inactive"]:
-        assert inactive_user not in active_users
+        assert user.id in active_user_ids
+        assert user.is_active is True
 
 
 async def test_get_user_by_id(
@@ -73,3 +73,21 @@ async def test_disable_user(users: dict[str, list[UserModel]], user_dal: UserDAL
     user = choose_from_list(users["active"])
     disabled_user = await user_dal.disable_user(user.id)
     assert disabled_user.is_active is False
+
+
+async def test_insert_many(user_dal: UserDAL):
+    first_id = 100
+    users_count = 5
+    rows = [
+        {
+            "id": first_id + offset,
+            "username": f"user_{offset}@mail.com",
+            "password": f"password_{offset}",
+        }
+        for offset in range(users_count)
+    ]
+    inserted_users = await user_dal.insert_many(rows, batch_size=2)
+    assert len(inserted_users) == users_count
+    assert [user.id for user in inserted_users] == [row["id"] for row in rows]
+    for inserted_user in inserted_users:
+        assert inserted_user.is_active is True
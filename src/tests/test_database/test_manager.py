@@ -0,0 +1,49 @@
+import asyncpg
+import pytest
+from orjson import orjson
+from sqlalchemy import URL
+
+from database.manager import (
+    DatabaseConnectionManager,
+    create_database_connection_manager,
+    serialize_json,
+)
+
+DB_URL = URL.create(drivername="postgresql+asyncpg", host="localhost")
+
+
+async def open_connection(db_manager: DatabaseConnectionManager) -> None:
+    async with db_manager.connect() as connection:
+        await connection.exec_driver_sql("SELECT 1")
+
+
+async def test_connect_arguments(monkeypatch):
+    connect_arguments = {}
+
+    async def connect(*args, **kwargs):
+        connect_arguments.update(kwargs)
+        raise ConnectionRefusedError()
+
+    monkeypatch.setattr(asyncpg, "connect", connect)
+    db_manager = create_database_connection_manager(
+        db_url=DB_URL,
+        db_prepared_statement_cache_size=0,
+        db_statement_cache_size=0,
+    )
+    with pytest.raises(ConnectionRefusedError):
+        await open_connection(db_manager)
+    await db_manager.close()
+
+    assert connect_arguments["statement_cache_size"] == 0
+    assert "prepared_statement_cache_size" not in connect_arguments
+    assert connect_arguments["server_settings"]["jit"] == "off"
+    assert set(connect_arguments["server_settings"]) == {
+        "application_name",
+        "jit",
+        "statement_timeout",
+    }
+
+
+async def test_json_serializer():
+    json_value = {"id": 1, "name": "lobby"}
+    assert orjson.loads(serialize_json(json_value)) == json_value
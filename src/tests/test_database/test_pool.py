@@ -0,0 +1,23 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from database.pool import InstrumentedQueuePool
+
+
+async def test_pool_statistics():
+    pool = InstrumentedQueuePool(MagicMock, pool_size=1, max_overflow=1, timeout=0.01)
+    connections = [await greenlet_spawn(pool.connect) for _ in range(2)]
+    with pytest.raises(PoolTimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    statistics = pool.statistics
+    assert statistics.checkouts == len(connections)
+    assert statistics.timeouts == 1
+    assert statistics.max_overflow == 1
+    assert statistics.max_wait_time <= statistics.total_wait_time
+    for connection in connections:
+        connection.close()
+    assert pool.checkedout() == 0
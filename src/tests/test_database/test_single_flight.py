@@ -0,0 +1,84 @@
+import asyncio
+import functools
+
+import pytest
+
+from api.context_variables import has_written
+from database.single_flight import SingleFlight
+
+CONCURRENT_CALLS = 3
+
+
+class CoalescedService:
+    def __init__(self, single_flight: SingleFlight, error: Exception | None = None):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self._error = error
+        coalesced = single_flight.coalesce(CoalescedService._get_by_id)
+        self.get_by_id = functools.partial(coalesced, self)
+
+    async def _get_by_id(self, entity_id: int) -> dict:
+        self.calls += 1
+        await self.release.wait()
+        if self._error is not None:
+            raise self._error
+        return {"id": entity_id}
+
+
+async def run_concurrent_calls(service, entity_id: int) -> list:
+    calls = [
+        asyncio.create_task(service.get_by_id(entity_id))
+        for _ in range(CONCURRENT_CALLS)
+    ]
+    await asyncio.sleep(0)
+    service.release.set()
+    return await asyncio.gather(*calls, return_exceptions=True)
+
+
+async def test_concurrent_calls_are_deduplicated(default_id: int):
+    single_flight = SingleFlight()
+    service = CoalescedService(single_flight)
+
+    results = await run_concurrent_calls(service, default_id)
+    assert all(result is results[0] for result in results)
+    assert service.calls == 1
+    assert single_flight.executed_count == 1
+    assert single_flight.deduplicated_count == CONCURRENT_CALLS - 1
+    assert single_flight.in_flight_count == 0
+
+
+async def test_error_is_shared(default_id: int):
+    single_flight = SingleFlight()
+    service = CoalescedService(single_flight, ValueError())
+
+    results = await run_concurrent_calls(service, default_id)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert service.calls == 1
+
+
+async def test_calls_after_write_are_not_deduplicated(default_id: int):
+    single_flight = SingleFlight()
+    service = CoalescedService(single_flight)
+
+    has_written.set(True)
+    await run_concurrent_calls(service, default_id)
+    assert service.calls == CONCURRENT_CALLS
+    assert single_flight.deduplicated_count == 0
+
+
+async def test_waiting_call_runs_if_first_call_is_cancelled(default_id: int):
+    single_flight = SingleFlight()
+    service = CoalescedService(single_flight)
+
+    first_call = asyncio.create_task(service.get_by_id(default_id))
+    await asyncio.sleep(0)
+    waiting_call = asyncio.create_task(service.get_by_id(default_id))
+    await asyncio.sleep(0)
+    first_call.cancel()
+    await asyncio.sleep(0)
+    service.release.set()
+
+    assert await waiting_call == {"id": default_id}
+    with pytest.raises(asyncio.CancelledError):
+        await first_call
+    assert service.calls == 2
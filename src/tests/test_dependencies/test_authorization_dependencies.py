@@ -79,7 +79,7 @@ async def test_check_current_user():
 async def test_check_current_user_in_lobby(
     users: dict[str, list[UserModel]],
     players: list[list[PlayerModel]],
-    user_service: UserService,
+    player_service: PlayerService,
 ):
     players_in_lobby = choose_from_list(players)
     player_in_lobby = choose_from_list(players_in_lobby)
@@ -96,10 +96,9 @@ async def test_check_current_user_in_lobby(
     user = await check_current_user_in_lobby(
         lobby_id=player_in_lobby.lobby_id,
         current_user=current_user,
-        user_service=user_service,
+        player_service=player_service,
     )
-    assert user.id == current_user.user_id
-    assert user.has_lobby(player_in_lobby.lobby_id)
+    assert user == current_user
 
     users_ids_in_lobby = [player.user_id for player in players_in_lobby]
     user_not_in_lobby = next(
@@ -116,7 +115,7 @@ async def test_check_current_user_in_lobby(
         await check_current_user_in_lobby(
             lobby_id=player_in_lobby.lobby_id,
             current_user=current_user_not_in_lobby,
-            user_service=user_service,
+            player_service=player_service,
         )
 
 
@@ -42,3 +42,6 @@ async def test_get_lobby_connection(
         websocket=mock_websocket,
     ):
         assert connection.id == player.id
+        assert lobby_room.connection_count == 1
+    assert lobby_room.connection_count == 0
+    assert lobby_room.idle_since is not None
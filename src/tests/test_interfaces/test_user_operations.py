@@ -3,7 +3,7 @@ from factories.user import UserCreateFactory, UserUpdateFactory
 from sqlalchemy.ext.asyncio import AsyncSession
 from utilities import choose_from_list
 
-from api.authnetication import decode_token
+from api.authnetication import decode_token, verify_password
 from api.interfaces import UserOperationsInterface
 from api.schemas.query import PaginationSchema
 from api.schemas.user import UserCreateSchema, UserUpdateSchema
@@ -70,8 +70,9 @@ async def test_create_user(
 ):
     user_create: UserCreateSchema = UserCreateFactory.build()
     created_user = await user_operations.create_user(user_create)
-    for field, value in user_create.model_dump().items():
+    for field, value in user_create.model_dump(exclude={"password"}).items():
         assert value == getattr(created_user, field)
+    assert verify_password(user_create.password, created_user.password)
 
 
 async def test_update_user(
@@ -1,7 +1,10 @@
 from datetime import datetime
 
+import pytest
+from sqlalchemy.dialects import postgresql
 from utilities import check_queries_equivalent
 
+from exceptions.service.query_manager import RelatedRowsError
 from tests.fixtures.query_managers import TestQueryManager
 
 DEFAULT_ID = 1
@@ -19,7 +22,7 @@ OFFSET {OFFSET}
 """
 
 SELECT_WHERE = f"""
-SELECT date_col, id, bool_col, float_col
+SELECT test.date_col, test.id, test.bool_col, test.float_col
 FROM test
 WHERE test.bool_col = false AND
 test.float_col <= {FLOAT_COL_CLAUSE} AND
@@ -33,6 +36,25 @@ FROM test JOIN child_test ON test.id = child_test.parent_id
 WHERE test.id = {DEFAULT_ID}
 """
 
+SELECT_SEEK = f"""
+SELECT test.bool_col, test.date_col, test.float_col, test.id
+FROM test
+WHERE (test.date_col, test.id) < ('{START_DATE_CLAUSE}', {DEFAULT_ID})
+ORDER BY test.date_col DESC, test.id DESC
+LIMIT {LIMIT}
+"""
+
+SELECT_ESTIMATED_COUNT = """
+SELECT CAST(pg_class.reltuples AS BIGINT) AS reltuples
+FROM pg_class
+WHERE pg_class.oid = to_regclass('test')
+"""
+
+SELECT_EXISTS = f"""
+SELECT EXISTS (SELECT * FROM test
+WHERE test.id = {DEFAULT_ID} AND test.bool_col = false) AS anon_1
+"""
+
 
 async def test_select_limit_offset():
     query = TestQueryManager.select(limit=LIMIT, offset=OFFSET)
@@ -66,3 +88,54 @@ async def test_select_join():
     )
     compiled_query = TestQueryManager.convert_query_to_string(query)
     assert check_queries_equivalent(compiled_query, SELECT_JOIN)
+
+
+async def test_select_exists():
+    query = TestQueryManager.exists(where={"id": DEFAULT_ID, "bool_col": False})
+    compiled_query = TestQueryManager.convert_query_to_string(query)
+    assert check_queries_equivalent(compiled_query, SELECT_EXISTS)
+
+
+async def test_select_seek():
+    query = TestQueryManager.select(
+        seek=("lt", {"date_col": START_DATE_CLAUSE, "id": DEFAULT_ID}),
+        order={"date_col": "desc", "id": "desc"},
+        limit=LIMIT,
+    )
+    compiled_query = TestQueryManager.convert_query_to_string(query)
+    assert check_queries_equivalent(compiled_query, SELECT_SEEK)
+
+
+async def test_select_estimated_count():
+    query = TestQueryManager.estimated_count()
+    compiled_query = TestQueryManager.convert_query_to_string(query)
+    assert check_queries_equivalent(compiled_query, SELECT_ESTIMATED_COUNT)
+
+
+async def test_select_rows():
+    query = TestQueryManager.select(
+        seek=("lt", {"date_col": START_DATE_CLAUSE, "id": DEFAULT_ID}),
+        order={"date_col": "desc", "id": "desc"},
+        limit=LIMIT,
+        rows=True,
+    )
+    compiled_query = TestQueryManager.convert_query_to_string(query)
+    assert check_queries_equivalent(compiled_query, SELECT_SEEK)
+    assert "compile_state_plugin" not in query._propagate_attrs  # noqa: WPS437
+
+
+async def test_select_rows_with_related():
+    with pytest.raises(RelatedRowsError):
+        TestQueryManager.select(related=["children"], rows=True)
+
+
+async def test_upsert():
+    query = TestQueryManager.upsert(
+        constraint="uq_test",
+        update_columns=["float_col"],
+        returning=False,
+    )
+    compiled_query = str(query.compile(dialect=postgresql.dialect()))
+    assert compiled_query.endswith(
+        "ON CONFLICT ON CONSTRAINT uq_test DO UPDATE SET float_col = excluded.float_col",
+    )
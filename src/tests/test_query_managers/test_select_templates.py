@@ -0,0 +1,134 @@
+from datetime import datetime
+
+import pytest
+from utilities import check_queries_equivalent
+
+from database.statement_templates import StatementTemplateCache
+from exceptions.service.query_manager import (
+    InvalidBetweenClauseError,
+    InvalidInClauseError,
+)
+from tests.fixtures.query_managers import TestQueryManager
+
+DEFAULT_ID = 1
+OTHER_ID = 2
+LIMIT = 10
+OFFSET = 5
+FLOAT_COL_CLAUSE = 10
+START_DATE_CLAUSE = datetime(year=2000, month=1, day=1)
+END_DATE_CLAUSE = datetime(year=2010, month=1, day=1)
+
+SELECT_CALLS = [
+    {"limit": LIMIT, "offset": OFFSET},
+    {
+        "columns": ["date_col", "id"],
+        "where": {
+            "bool_col": None,
+            "float_col": ("le", FLOAT_COL_CLAUSE),
+            "date_col": ("between", (START_DATE_CLAUSE, END_DATE_CLAUSE)),
+            "id": ("in", [DEFAULT_ID, OTHER_ID]),
+        },
+        "order": {"date_col": "desc"},
+    },
+    {
+        "where": {
+            "id": ("not_in", (DEFAULT_ID, OTHER_ID)),
+            "date_col": ("between", (None, END_DATE_CLAUSE)),
+            "float_col": ("is_not", None),
+        },
+        "join": ["children"],
+    },
+    {
+        "seek": ("lt", {"date_col": START_DATE_CLAUSE, "id": DEFAULT_ID}),
+        "order": {"date_col": "desc", "id": "desc"},
+        "limit": LIMIT,
+    },
+]
+
+
+@pytest.fixture
+def statement_templates(monkeypatch) -> StatementTemplateCache:
+    cache = StatementTemplateCache()
+    monkeypatch.setattr("database.query_managers.base.statement_templates", cache)
+    return cache
+
+
+@pytest.mark.parametrize("select_call", SELECT_CALLS)
+async def test_select_template_matches_select(statement_templates, select_call):
+    template, parameters = TestQueryManager.select_template(**select_call)
+    compiled_template = TestQueryManager.convert_query_to_string(
+        template.params(parameters),
+    )
+    compiled_query = TestQueryManager.convert_query_to_string(
+        TestQueryManager.select(**select_call),
+    )
+    assert check_queries_equivalent(compiled_template, compiled_query)
+
+
+async def test_select_template_reused_for_other_values(statement_templates):
+    template, parameters = TestQueryManager.select_template(
+        where={"id": DEFAULT_ID},
+        limit=LIMIT,
+    )
+    other_template, other_parameters = TestQueryManager.select_template(
+        where={"id": OTHER_ID},
+        limit=LIMIT + 1,
+    )
+    assert other_template is template
+    assert parameters == {"where_id": DEFAULT_ID, "limit": LIMIT}
+    assert other_parameters == {"where_id": OTHER_ID, "limit": LIMIT + 1}
+    assert statement_templates.misses == 1
+    assert statement_templates.hits == 1
+
+
+async def test_select_template_keyed_by_shape(statement_templates):
+    template, _ = TestQueryManager.select_template(where={"id": DEFAULT_ID})
+    null_template, parameters = TestQueryManager.select_template(where={"id": None})
+    range_template, _ = TestQueryManager.select_template(
+        where={"id": ("gt", DEFAULT_ID)},
+    )
+    assert len({id(template), id(null_template), id(range_template)}) == 3
+    assert not parameters
+    assert statement_templates.misses == 3
+    assert len(statement_templates) == 3
+
+
+async def test_select_template_not_cached_for_expressions(statement_templates):
+    query, parameters = TestQueryManager.select_template(
+        join=[
+            {
+                "model": TestQueryManager._association_models["children"]["model"],
+                "on": TestQueryManager._association_models["children"]["on"],
+            },
+        ],
+        where={"id": DEFAULT_ID},
+    )
+    assert not parameters
+    assert not statement_templates
+    assert check_queries_equivalent(
+        TestQueryManager.convert_query_to_string(query),
+        TestQueryManager.convert_query_to_string(
+            TestQueryManager.select(where={"id": DEFAULT_ID}, join=["children"]),
+        ),
+    )
+
+
+async def test_select_template_validates_values(statement_templates):
+    with pytest.raises(InvalidBetweenClauseError):
+        TestQueryManager.select_template(
+            where={"date_col": ("between", (END_DATE_CLAUSE, START_DATE_CLAUSE))},
+        )
+    with pytest.raises(InvalidInClauseError):
+        TestQueryManager.select_template(where={"id": ("in", DEFAULT_ID)})
+
+
+async def test_statement_template_cache_evicts_least_recent():
+    cache = StatementTemplateCache(max_size=2)
+    first_query = TestQueryManager.select(limit=LIMIT)
+    cache.set("first", first_query)
+    cache.set("second", TestQueryManager.select())
+    cache.get("first")
+    cache.set("third", TestQueryManager.select())
+    assert cache.get("first") is first_query
+    assert cache.get("second") is None
+    assert len(cache) == 2
@@ -0,0 +1,43 @@
+import pytest
+from factories.lobby import LobbyInDBFactory
+from factories.user import UserInDBFactory
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import ResponseValidationError
+from orjson import orjson
+
+from api.responses import SchemaResponse
+from api.schemas.lobby import LobbyInDBSchema, PaginatedLobbiesSchema
+from api.schemas.user import UserShowSchema
+
+
+def test_schema_response_matches_encoded_schema():
+    page = PaginatedLobbiesSchema(
+        page=1,
+        page_size=10,
+        page_count=1,
+        total=2,
+        items=LobbyInDBFactory.batch(2),
+        next=None,
+        previous=None,
+    )
+    response = SchemaResponse(page, schema=PaginatedLobbiesSchema, status_code=201)
+
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert orjson.loads(response.body) == jsonable_encoder(page)
+
+
+def test_schema_response_projects_to_schema():
+    user = UserInDBFactory.build()
+    response = SchemaResponse(user, schema=UserShowSchema)
+
+    response_content = orjson.loads(response.body)
+    assert "password" not in response_content
+    assert response_content == jsonable_encoder(
+        UserShowSchema.model_validate(user, from_attributes=True),
+    )
+
+
+def test_schema_response_raises_validation_error():
+    with pytest.raises(ResponseValidationError):
+        SchemaResponse(UserInDBFactory.build(), schema=LobbyInDBSchema)
@@ -27,7 +27,7 @@ async def test_join_lobby(
         headers=create_auth_header(user),
     ) as websocket:
         data = websocket.receive_json()
-        assert data == connect_message.to_dict()
+        assert data == {**connect_message.to_dict(), "seq": 1}
 
         user_message = "test"
         websocket.send_json({"message": "test"})
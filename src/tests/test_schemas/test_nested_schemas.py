@@ -0,0 +1,40 @@
+from factories.lobby import LobbyWithPlayersFactory
+from polyfactory.factories.pydantic_factory import ModelFactory
+
+from api.schemas.nested.player import (
+    LobbyWithLinkSchema,
+    LobbyWithLinkShowSchema,
+    PlayerWithLinkSchema,
+    PlayerWithLobbyUserSchema,
+)
+
+JOIN_URL = "http://test/join"
+
+
+class PlayerWithLobbyUserFactory(ModelFactory[PlayerWithLobbyUserSchema]):
+    __model__ = PlayerWithLobbyUserSchema
+
+
+async def test_lobby_from_base():
+    lobby = LobbyWithPlayersFactory.build()
+    lobby_with_link = LobbyWithLinkSchema.from_base(lobby, join_url=JOIN_URL)
+    assert lobby_with_link == LobbyWithLinkSchema.model_validate(
+        {**lobby.model_dump(), "join_url": JOIN_URL},
+    )
+    assert lobby_with_link.players is lobby.players
+
+    lobby_show = LobbyWithLinkShowSchema.model_validate(
+        lobby_with_link,
+        from_attributes=True,
+    )
+    assert lobby_show.model_dump() == lobby_with_link.model_dump()
+
+
+async def test_player_from_base():
+    player = PlayerWithLobbyUserFactory.build()
+
+    player_with_link = PlayerWithLinkSchema.from_base(player, join_url=JOIN_URL)
+    assert player_with_link == PlayerWithLinkSchema.model_validate(
+        {**player.model_dump(), "join_url": JOIN_URL},
+    )
+    assert player_with_link.user is player.user
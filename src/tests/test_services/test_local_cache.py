@@ -0,0 +1,46 @@
+from factories.test import TestSchemaFactory
+
+from services.redis.local_cache import LocalCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    local_cache = LocalCache(max_size=2, ttl=60)
+    local_cache.set("first", TestSchemaFactory.build(), tags=["test:1"])
+    local_cache.set("second", TestSchemaFactory.build(), tags=["test:2"])
+
+    assert local_cache.get("first") is not None
+    local_cache.set("third", TestSchemaFactory.build(), tags=["test:3"])
+    assert local_cache.get("second") is None
+    assert local_cache.get("first") is not None
+    assert local_cache.get("third") is not None
+    assert len(local_cache) == 2
+
+
+def test_expired_entry_is_removed():
+    local_cache = LocalCache(max_size=2, ttl=0)
+    local_cache.set("first", TestSchemaFactory.build(), tags=["test:1"])
+
+    assert local_cache.get("first") is None
+    assert not local_cache
+
+
+def test_invalidate_by_tag():
+    schema = TestSchemaFactory.build()
+    local_cache = LocalCache(max_size=10, ttl=60)
+    local_cache.set("first", schema, tags=["test:1", "shared"])
+    local_cache.set("second", None, tags=["test:2", "shared"])
+    local_cache.set("third", schema, tags=["test:3"])
+
+    assert local_cache.get("second").value is None
+    local_cache.invalidate("shared")
+    assert local_cache.get("first") is None
+    assert local_cache.get("second") is None
+    assert local_cache.get("third").value is schema
+
+
+def test_disabled_cache():
+    local_cache = LocalCache(max_size=0, ttl=60)
+    local_cache.set("first", TestSchemaFactory.build(), tags=[])
+
+    assert not local_cache.is_enabled
+    assert local_cache.get("first") is None
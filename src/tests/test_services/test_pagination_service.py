@@ -1,8 +1,14 @@
-from factories.test import TestSchemaFactory
-from fixtures.schemas import MockPaginatedResultSchema
+from unittest.mock import AsyncMock
 
-from api.schemas.query import PaginationSchema
-from api.services.pagination import PaginationService
+import pytest
+from factories.test import TestKeyedSchemaFactory, TestSchemaFactory
+from fixtures.schemas import MockKeyedPaginatedResultSchema, MockPaginatedResultSchema
+
+from api.enums import CountStrategyEnum, CursorDirectionEnum, OrderQueryEnum
+from api.schemas.query import CursorSchema, PaginationSchema
+from api.services.pagination import PaginationService, TotalCountCache
+from exceptions.service.request import CursorQueryParamsError
+from services.redis.dependencies import FakeRedis
 
 
 async def test_paginate(
@@ -31,3 +37,130 @@ async def test_paginate(
     assert f"page={page - 1}" in paginated_result.previous
     assert f"page_size={page_size}" in paginated_result.next
     assert f"page_size={page_size}" in paginated_result.previous
+
+
+async def test_paginate_cursor(
+    batch_size: int,
+    default_page_size: int,
+    pagination_service: PaginationService,
+):
+    test_schemas = sorted(
+        TestKeyedSchemaFactory.batch(batch_size),
+        key=lambda schema: (schema.created_at, schema.id),
+    )
+    cursor = CursorSchema(
+        direction=CursorDirectionEnum.next,
+        order=OrderQueryEnum.asc,
+        created_at=test_schemas[0].created_at,
+        id=test_schemas[0].id,
+    )
+    pagination = PaginationSchema(page=1, page_size=default_page_size, cursor=cursor)
+    fetched_schemas = test_schemas[1 : 1 + pagination.limit]  # noqa: E203
+
+    pagination_service.configure(pagination)
+    paginated_result = pagination_service.paginate(
+        total=batch_size,
+        items=fetched_schemas,
+        result_schema=MockKeyedPaginatedResultSchema,
+    )
+    assert paginated_result.page is None
+    assert paginated_result.items == fetched_schemas[:default_page_size]
+
+    next_cursor = CursorSchema.decode(paginated_result.next_cursor)
+    assert next_cursor.direction is CursorDirectionEnum.next
+    assert next_cursor.order is OrderQueryEnum.asc
+    assert next_cursor.id == paginated_result.items[-1].id
+    previous_cursor = CursorSchema.decode(paginated_result.previous_cursor)
+    assert previous_cursor.direction is CursorDirectionEnum.previous
+    assert previous_cursor.id == paginated_result.items[0].id
+    assert f"cursor={paginated_result.next_cursor}" in paginated_result.next
+    assert f"page_size={default_page_size}" in paginated_result.next
+
+
+async def test_decode_invalid_cursor():
+    with pytest.raises(CursorQueryParamsError):
+        CursorSchema.decode("invalid")
+
+
+async def test_cursor_with_another_order(
+    default_id: int,
+    default_page_size: int,
+    pagination_service: PaginationService,
+):
+    cursor = CursorSchema(
+        direction=CursorDirectionEnum.next,
+        order=OrderQueryEnum.asc,
+        created_at=TestKeyedSchemaFactory.build().created_at,
+        id=default_id,
+    )
+    pagination = PaginationSchema(
+        page=1,
+        page_size=default_page_size,
+        cursor=CursorSchema.decode(cursor.encode()),
+    )
+    with pytest.raises(CursorQueryParamsError):
+        pagination_service.configure(pagination, order=OrderQueryEnum.desc)
+
+
+async def test_paginate_without_total(
+    batch_size: int,
+    default_page_size: int,
+    pagination_service: PaginationService,
+):
+    pagination = PaginationSchema(
+        page=1,
+        page_size=default_page_size,
+        count_strategy=CountStrategyEnum.skipped,
+    )
+    fetched_schemas = TestSchemaFactory.batch(pagination.limit)
+
+    pagination_service.configure(pagination)
+    total = await pagination_service.count(
+        name="test",
+        total_count=AsyncMock(return_value=batch_size),
+        estimated_count=AsyncMock(return_value=batch_size),
+    )
+    paginated_result = pagination_service.paginate(
+        total=total,
+        items=fetched_schemas,
+        result_schema=MockPaginatedResultSchema,
+    )
+    assert paginated_result.total is None
+    assert paginated_result.page_count is None
+    assert paginated_result.count_strategy is CountStrategyEnum.skipped
+    assert paginated_result.items == fetched_schemas[:default_page_size]
+    assert "page=2" in paginated_result.next
+    assert paginated_result.previous is None
+
+
+@pytest.mark.parametrize(
+    ("count_strategy", "exact_calls", "estimated_calls"),
+    [
+        (CountStrategyEnum.exact, 2, 0),
+        (CountStrategyEnum.estimated, 0, 2),
+        (CountStrategyEnum.cached, 1, 0),
+    ],
+)
+async def test_count(
+    count_strategy: CountStrategyEnum,
+    exact_calls: int,
+    estimated_calls: int,
+    batch_size: int,
+    pagination_schema: PaginationSchema,
+    pagination_service: PaginationService,
+):
+    pagination_schema.count_strategy = count_strategy
+    total_count = AsyncMock(return_value=batch_size)
+    estimated_count = AsyncMock(return_value=batch_size)
+    pagination_service._count_cache = TotalCountCache(FakeRedis())  # noqa: WPS437
+
+    pagination_service.configure(pagination_schema)
+    for _ in range(2):
+        total = await pagination_service.count(
+            name="test",
+            total_count=total_count,
+            estimated_count=estimated_count,
+        )
+        assert total == batch_size
+    assert total_count.await_count == exact_calls
+    assert estimated_count.await_count == estimated_calls
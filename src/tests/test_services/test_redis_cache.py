@@ -0,0 +1,130 @@
+import asyncio
+
+from factories.test import TestSchemaFactory
+from fixtures.schemas import MockSchema
+from redis.asyncio import Redis
+
+from api.context_variables import has_written
+from database.membership import LobbyMembershipCache
+from services.redis.cache import RedisCache
+from settings import settings
+
+
+class CachedService:
+    def __init__(self, cache: RedisCache, schema: MockSchema | None):
+        self.calls = 0
+        self._schema = schema
+        self.get_by_id = cache.cached(
+            prefix="test",
+            schema=MockSchema,
+            tags=("test:{entity_id}", "name:{result.name}"),
+        )(self._get_by_id)
+
+    async def _get_by_id(self, entity_id: int) -> MockSchema | None:
+        self.calls += 1
+        return self._schema
+
+
+async def start_invalidation_listener(cache: RedisCache) -> None:
+    await cache.start_invalidation_listener(
+        Redis(
+            host=settings.redis_host,
+            port=settings.redis_port,
+            password=settings.redis_pass,
+        ),
+    )
+    await asyncio.sleep(0.1)
+
+
+async def test_cached_read(default_id: int, redis_cache: RedisCache):
+    schema = TestSchemaFactory.build()
+    service = CachedService(redis_cache, schema)
+
+    assert await service.get_by_id(default_id) == schema
+    assert await service.get_by_id(entity_id=default_id) == schema
+    assert service.calls == 1
+
+    await redis_cache.invalidate(f"name:{schema.name}")
+    assert await service.get_by_id(default_id) == schema
+    assert service.calls == 2
+
+
+async def test_cached_missing_entity(default_id: int, redis_cache: RedisCache):
+    service = CachedService(redis_cache, None)
+
+    assert await service.get_by_id(default_id) is None
+    assert await service.get_by_id(default_id) is None
+    assert service.calls == 1
+
+    await redis_cache.invalidate(f"test:{default_id}")
+    assert await service.get_by_id(default_id) is None
+    assert service.calls == 2
+
+
+async def test_cache_not_available(default_id: int):
+    schema = TestSchemaFactory.build()
+    service = CachedService(RedisCache(), schema)
+
+    assert await service.get_by_id(default_id) == schema
+    assert await service.get_by_id(default_id) == schema
+    assert service.calls == 2
+
+
+async def test_read_after_write_not_cached(default_id: int):
+    schema = TestSchemaFactory.build()
+    cache = RedisCache()
+    service = CachedService(cache, schema)
+    has_written.set(True)
+
+    assert await service.get_by_id(default_id) == schema
+    assert await service.get_by_id(default_id) == schema
+    assert service.calls == 2
+    assert cache.statistics.misses == 0
+    assert cache.local_size == 0
+
+
+async def test_cache_tiers(default_id: int, redis_cache: RedisCache):
+    schema = TestSchemaFactory.build()
+    service = CachedService(redis_cache, schema)
+
+    await service.get_by_id(default_id)
+    assert await service.get_by_id(default_id) is await service.get_by_id(default_id)
+    assert redis_cache.statistics.misses == 1
+    assert redis_cache.statistics.local_hits == 2
+
+    redis_cache._local_cache.clear()  # noqa: WPS437
+    assert await service.get_by_id(default_id) == schema
+    assert redis_cache.statistics.redis_hits == 1
+    assert service.calls == 1
+
+
+async def test_invalidation_from_another_worker(
+    default_id: int,
+    redis_cache: RedisCache,
+):
+    schema = TestSchemaFactory.build()
+    service = CachedService(redis_cache, schema)
+    other_worker_cache = RedisCache(
+        redis_client=redis_cache._redis_client,  # noqa: WPS437
+        namespace=redis_cache._namespace,  # noqa: WPS437
+    )
+    await start_invalidation_listener(redis_cache)
+
+    await service.get_by_id(default_id)
+    assert redis_cache.local_size == 1
+    await other_worker_cache.invalidate(f"test:{default_id}")
+    await asyncio.sleep(0.1)
+    assert redis_cache.local_size == 0
+    await redis_cache.close()
+
+
+async def test_registered_local_cache_invalidated(default_id: int):
+    cache = RedisCache()
+    membership_cache = LobbyMembershipCache(max_size=10, ttl=60)
+    cache.register_local_cache(membership_cache)
+    membership_cache.add(default_id, default_id)
+
+    await cache.invalidate(f"lobby:{default_id + 1}")
+    assert membership_cache.contains(default_id, default_id)
+    await cache.invalidate(f"user:{default_id}")
+    assert not membership_cache.contains(default_id, default_id)
@@ -0,0 +1,41 @@
+import pytest
+from factories.lobby import LobbyWithPlayersFactory
+from orjson import orjson
+
+from api.enums.redis import RedisCodecEnum
+from api.schemas.nested.player import LobbyWithPlayersSchema
+from exceptions.service.serialization import CodecNotAvailableError
+from services.redis.codecs import CodecRegistry, JSONCodec, codec_registry
+from services.redis.utils import deserialize, serialize
+
+
+@pytest.mark.parametrize("codec_name", list(RedisCodecEnum))
+async def test_serialize_with_codec(codec_name: RedisCodecEnum):
+    try:
+        codec = codec_registry.get(codec_name)
+    except CodecNotAvailableError:
+        pytest.skip(f"Codec {codec_name.value} is not installed")
+    lobby = LobbyWithPlayersFactory.build()
+
+    serialized_lobby = serialize(lobby, codec=codec)
+    assert serialized_lobby[0] == codec.version
+    assert deserialize(serialized_lobby, LobbyWithPlayersSchema) == lobby
+    assert deserialize(serialize([lobby], codec=codec), LobbyWithPlayersSchema) == [
+        lobby,
+    ]
+
+
+async def test_deserialize_unversioned_value():
+    lobby = LobbyWithPlayersFactory.build()
+    unversioned_lobby = orjson.dumps(lobby.model_dump(mode="json"))
+
+    assert deserialize(unversioned_lobby, LobbyWithPlayersSchema) == lobby
+    assert deserialize(b"not_found") == "not_found"
+
+
+async def test_codec_not_available():
+    registry = CodecRegistry(default_codec=RedisCodecEnum.msgpack)
+    registry.register(JSONCodec())
+
+    with pytest.raises(CodecNotAvailableError):
+        assert registry.default
@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+
+from factories.test import TestSchemaFactory
+
+from api.enums import PlayerStateEnum
+from services.redis.utils import KeyTemplate, make_key
+
+
+async def test_make_key_is_canonical():
+    schema = TestSchemaFactory.build()
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    key = make_key(
+        namespace="test",
+        prefix="entity",
+        args=(schema,),
+        kwargs={"state": PlayerStateEnum.lead, "created_at": created_at},
+    )
+
+    assert key == make_key(
+        namespace="test",
+        prefix="entity",
+        args=(schema.model_copy(),),
+        kwargs={"created_at": created_at, "state": PlayerStateEnum.lead},
+    )
+    assert key != make_key(
+        namespace="test",
+        prefix="entity",
+        args=(schema,),
+        kwargs={"state": PlayerStateEnum.banned, "created_at": created_at},
+    )
+
+
+async def test_key_template(default_id: int):
+    key_template = KeyTemplate(
+        namespace="test",
+        prefix="entity",
+        parameters=["entity_id"],
+    )
+
+    assert key_template.make_key({"entity_id": default_id}) == (
+        f"test:entity:entity_id={default_id}"
+    )
+    assert key_template.make_key({"entity_id": "name"}) == make_key(
+        namespace="test",
+        prefix="entity",
+        args=(),
+        kwargs={"entity_id": "name"},
+    )
@@ -0,0 +1,22 @@
+import pytest
+
+from exceptions.service.redis import RedisConnectionError
+from services.redis.manager import RedisConnectionManager
+
+MAX_CONNECTIONS = 3
+
+
+async def test_redis_manager_shares_client():
+    redis_manager = RedisConnectionManager(max_connections=MAX_CONNECTIONS)
+    with pytest.raises(RedisConnectionError):
+        assert redis_manager.client
+
+    redis_manager.connect()
+    redis_client = redis_manager.client
+    redis_manager.connect()
+    assert redis_manager.client is redis_client
+    assert redis_client.connection_pool.max_connections == MAX_CONNECTIONS
+
+    await redis_manager.close()
+    with pytest.raises(RedisConnectionError):
+        assert redis_manager.client
@@ -0,0 +1,31 @@
+from factories.test import TestSchemaFactory
+from fastapi import BackgroundTasks
+from fixtures.schemas import MockSchema
+
+from services.redis.dependencies import FakeRedis
+from services.redis.redis_store import RedisStoreService
+
+ENTITIES_COUNT = 3
+
+
+async def test_get_and_set_entities():
+    store_service = RedisStoreService(
+        background_tasks=BackgroundTasks(),
+        store_client=FakeRedis(),
+    )
+    entities = {
+        store_service.make_entity_key("test", entity_id): TestSchemaFactory.build()
+        for entity_id in range(ENTITIES_COUNT)
+    }
+    missing_key = store_service.make_entity_key("test", ENTITIES_COUNT)
+    empty_key = store_service.make_entity_key("test", ENTITIES_COUNT + 1)
+    entity_keys = [*entities, missing_key, empty_key]
+
+    await store_service.set_entities(entities, expire={missing_key: 1})
+    await store_service.set_entity_empty(empty_key)
+    stored_entities, missing_keys = await store_service.get_entities(
+        entity_keys,
+        schema=MockSchema,
+    )
+    assert stored_entities == {**entities, empty_key: None}
+    assert missing_keys == [missing_key]
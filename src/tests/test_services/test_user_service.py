@@ -1,6 +1,7 @@
 from factories.user import UserCreateFactory, UserUpdateFactory
 from utilities import choose_from_list
 
+from api.authnetication import verify_password
 from api.schemas.user import UserCreateSchema, UserUpdateSchema
 from api.services import UserService
 from database.models.lobby import LobbyModel
@@ -52,8 +53,9 @@ async def test_get_user_by_username(
 async def test_create_user(user_service: UserService):
     user_create: UserCreateSchema = UserCreateFactory.build()
     created_user = await user_service.create_user(user_create)
-    for field, value in user_create.model_dump().items():
+    for field, value in user_create.model_dump(exclude={"password"}).items():
         assert value == getattr(created_user, field)
+    assert verify_password(user_create.password, created_user.password)
 
 
 async def test_update_user_by_id(
@@ -0,0 +1,45 @@
+import pytest
+from factories.lobby import LobbyInDBFactory
+
+from api.schemas.lobby import LobbyInDBSchema
+from api.services.mixins import DBModelValidatorMixin
+from database.models.lobby import LobbyModel
+from exceptions.service.schema import SchemaValidationError
+
+LOBBIES_COUNT = 3
+
+
+@pytest.fixture
+def lobby_rows() -> list[dict]:
+    return [lobby.model_dump() for lobby in LobbyInDBFactory.batch(LOBBIES_COUNT)]
+
+
+async def test_validate_db_models(lobby_rows: list[dict]):
+    lobby_models = [LobbyModel(**lobby_row) for lobby_row in lobby_rows]
+    expected_lobbies = [LobbyInDBSchema(**lobby_row) for lobby_row in lobby_rows]
+
+    validated_lobbies = DBModelValidatorMixin.validate(lobby_models, LobbyInDBSchema)
+    assert validated_lobbies == expected_lobbies
+    assert DBModelValidatorMixin.validate(lobby_models[0], LobbyInDBSchema) == (
+        expected_lobbies[0]
+    )
+
+
+async def test_validate_rows(lobby_rows: list[dict]):
+    expected_lobbies = [LobbyInDBSchema(**lobby_row) for lobby_row in lobby_rows]
+
+    validated_lobbies = DBModelValidatorMixin.validate(
+        (lobby_row for lobby_row in lobby_rows),
+        LobbyInDBSchema,
+    )
+    assert validated_lobbies == expected_lobbies
+    assert DBModelValidatorMixin.validate(lobby_rows[0], LobbyInDBSchema) == (
+        expected_lobbies[0]
+    )
+
+
+async def test_validate_invalid_rows(lobby_rows: list[dict]):
+    lobby_rows[-1].pop("name")
+
+    with pytest.raises(SchemaValidationError):
+        DBModelValidatorMixin.validate(lobby_rows, LobbyInDBSchema)
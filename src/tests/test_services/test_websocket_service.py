@@ -0,0 +1,338 @@
+import asyncio
+from contextlib import AsyncExitStack
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import WebSocket
+from redis.exceptions import ConnectionError as RedisConnectionError
+from starlette.websockets import WebSocketState
+
+from api.dependencies.websocket import get_lobby_connection
+from api.enums.websocket import WebsocketOverflowPolicyEnum
+from api.messages import LobbyConnectMessage, LobbyResyncMessage, UserMessage
+from api.services import (
+    Connection,
+    ConnectionManager,
+    InMemoryBackplane,
+    RedisBackplane,
+    Room,
+)
+from exceptions.service.websocket import WebsocketSlowConsumerError
+from settings import settings
+
+
+def create_mock_websocket() -> AsyncMock:
+    mock_websocket = AsyncMock(spec=WebSocket)
+    mock_websocket.client_state = WebSocketState.CONNECTED
+    return mock_websocket
+
+
+async def test_room_send_does_not_wait_for_slow_connection(default_id: int):
+    slow_websocket = create_mock_websocket()
+    fast_websocket = create_mock_websocket()
+    release_slow = asyncio.Event()
+
+    async def wait_for_release(*args) -> None:
+        await release_slow.wait()
+
+    slow_websocket.send_text.side_effect = wait_for_release
+
+    room = Room(default_id)
+    async with AsyncExitStack() as stack:
+        for connection_id, websocket in enumerate((slow_websocket, fast_websocket)):
+            connection = await room.create_connection(connection_id, websocket)
+            await stack.enter_async_context(connection)
+        for _ in range(2):
+            await room.send(LobbyConnectMessage(player_id=default_id))
+        await asyncio.sleep(0)
+
+        assert fast_websocket.send_text.await_count == 2
+        assert slow_websocket.send_text.await_count == 1
+        assert room.get_connection(0).pending_count == 1
+        release_slow.set()
+
+
+@pytest.mark.parametrize(
+    ("overflow_policy", "expected_messages"),
+    [
+        (WebsocketOverflowPolicyEnum.drop_oldest, ["2", "3"]),
+        (WebsocketOverflowPolicyEnum.drop_newest, ["1", "2"]),
+    ],
+)
+async def test_connection_overflow_drop(
+    overflow_policy: WebsocketOverflowPolicyEnum,
+    expected_messages: list[str],
+):
+    connection = Connection(
+        connection_id=1,
+        websocket=create_mock_websocket(),
+        queue_size=2,
+        overflow_policy=overflow_policy,
+    )
+    for player_id in range(1, 4):
+        connection.enqueue(LobbyConnectMessage(player_id=player_id).to_frame())
+
+    assert connection.pending_count == 2
+    assert connection.dropped_count == 1
+    queued_frames = [connection._queue.get_nowait() for _ in range(2)]
+    for queued_frame, expected_player_id in zip(queued_frames, expected_messages):
+        assert f"Player {expected_player_id} " in queued_frame
+
+
+async def test_connection_overflow_disconnect():
+    mock_websocket = create_mock_websocket()
+    connection = Connection(
+        connection_id=1,
+        websocket=mock_websocket,
+        queue_size=1,
+        overflow_policy=WebsocketOverflowPolicyEnum.disconnect,
+    )
+    connection.enqueue(LobbyConnectMessage(player_id=1).to_frame())
+    connection.enqueue(LobbyConnectMessage(player_id=2).to_frame())
+
+    slow_consumer_error = WebsocketSlowConsumerError()
+    async with connection:
+        await asyncio.sleep(0)
+        mock_websocket.close.assert_awaited_once_with(
+            code=slow_consumer_error.ws_status_code,
+            reason=slow_consumer_error.detail,
+        )
+    mock_websocket.send_text.assert_not_awaited()
+
+
+@pytest.mark.parametrize("binary", [True, False])
+async def test_room_send_encodes_message_once(default_id: int, binary: bool):
+    room = Room(default_id)
+    websockets = [create_mock_websocket() for _ in range(3)]
+    message = LobbyConnectMessage(player_id=default_id)
+
+    async with AsyncExitStack() as stack:
+        for connection_id, websocket in enumerate(websockets):
+            connection = await room.create_connection(connection_id, websocket)
+            await stack.enter_async_context(connection)
+
+        stack.enter_context(patch.object(settings, "ws_binary_frames", binary))
+        mock_to_dict = stack.enter_context(
+            patch.object(message, "to_dict", wraps=message.to_dict),
+        )
+        await room.send(message)
+        await asyncio.sleep(0)
+        mock_to_dict.assert_called_once()
+
+    for mock_websocket in websockets:
+        send_method = mock_websocket.send_bytes if binary else mock_websocket.send_text
+        send_method.assert_awaited_once_with(message.to_frame(binary=binary))
+
+
+async def test_room_send_across_workers(default_id: int):
+    backplane = InMemoryBackplane()
+    sender_worker = ConnectionManager(backplane=backplane)
+    receiver_worker = ConnectionManager(backplane=backplane)
+    sender_websocket = create_mock_websocket()
+    receiver_websocket = create_mock_websocket()
+    message = LobbyConnectMessage(player_id=default_id)
+
+    sender_connection = await sender_worker.create_connection(
+        room_id=default_id,
+        connection_id=1,
+        websocket=sender_websocket,
+    )
+    receiver_connection = await receiver_worker.create_connection(
+        room_id=default_id,
+        connection_id=2,
+        websocket=receiver_websocket,
+    )
+    async with AsyncExitStack() as stack:
+        for connection in (sender_connection, receiver_connection):
+            await stack.enter_async_context(connection)
+        await sender_worker.get_room(default_id).send(message, connection_ids=[2])
+        await asyncio.sleep(0)
+
+    receiver_websocket.send_text.assert_awaited_once_with(message.to_frame())
+    sender_websocket.send_text.assert_not_awaited()
+
+
+async def test_lobby_connection_is_removed_once_closed(default_id: int):
+    conn_manager = ConnectionManager()
+    room = conn_manager.get_or_create_room(default_id)
+    replaced_connection = await room.create_connection(1, create_mock_websocket())
+    lobby_connection = get_lobby_connection(
+        lobby_room=room,
+        current_player=MagicMock(id=1),
+        conn_manager=conn_manager,
+        websocket=create_mock_websocket(),
+    )
+    connection = await anext(lobby_connection)
+    assert room.idle_since is None
+
+    room.remove_connection(replaced_connection)
+    assert room.get_connection(1) is connection
+
+    await lobby_connection.aclose()
+    assert room.connection_count == 0
+    assert room.idle_since is not None
+
+
+async def test_evict_idle_rooms(default_id: int):
+    backplane = InMemoryBackplane()
+    conn_manager = ConnectionManager(backplane=backplane)
+    idle_room = conn_manager.get_or_create_room(default_id)
+    await idle_room.subscribe()
+    busy_room = conn_manager.get_or_create_room(default_id + 1)
+    connection = await conn_manager.create_connection(
+        room_id=busy_room.id,
+        connection_id=1,
+        websocket=create_mock_websocket(),
+    )
+    assert conn_manager.room_count == 2
+    assert conn_manager.connection_count == 1
+
+    assert await conn_manager.evict_idle_rooms(idle_ttl=settings.ws_room_idle_ttl) == 0
+    assert await conn_manager.evict_idle_rooms(idle_ttl=0) == 1
+    assert conn_manager.get_room(idle_room.id) is None
+    assert idle_room.channel not in backplane._handlers
+
+    conn_manager.remove_connection(room_id=busy_room.id, connection=connection)
+    assert conn_manager.connection_count == 0
+    assert await conn_manager.evict_idle_rooms(idle_ttl=0) == 1
+    assert conn_manager.room_count == 0
+
+
+async def test_room_collector_evicts_idle_rooms(default_id: int):
+    conn_manager = ConnectionManager()
+    conn_manager.get_or_create_room(default_id)
+    conn_manager.start_room_collector(interval=0, idle_ttl=0)
+    await asyncio.sleep(0.01)
+    await conn_manager.close()
+
+    assert conn_manager.room_count == 0
+
+
+async def test_room_replays_missed_messages(default_id: int):
+    room = Room(default_id)
+    connection = await room.create_connection(1, create_mock_websocket())
+    await room.send(LobbyConnectMessage(player_id=default_id))
+    messages = [
+        UserMessage(message="missed", sender=default_id),
+        UserMessage(message="private", sender=default_id, receivers=[2]),
+        UserMessage(message="direct", sender=default_id, receivers=[1]),
+    ]
+    for message in messages:
+        await room.send(message, connection_ids=message.receivers)
+    room.remove_connection(connection)
+    assert room.last_seq == 4
+
+    connection = await room.create_connection(1, create_mock_websocket(), since=1)
+
+    queued_frames = [connection._queue.get_nowait() for _ in range(2)]
+    assert queued_frames == [messages[0].to_frame(), messages[2].to_frame()]
+    assert connection.pending_count == 0
+
+
+async def test_room_replay_without_messages(default_id: int):
+    room = Room(default_id)
+    assert room.last_seq == 0
+
+    connection = await room.create_connection(1, create_mock_websocket(), since=0)
+
+    assert connection.pending_count == 0
+
+
+@pytest.mark.parametrize("since", [0, 5])
+async def test_room_replay_requests_resync(default_id: int, since: int):
+    room = Room(default_id, replay_size=2)
+    await room.subscribe()
+    for player_id in range(3):
+        await room.send(LobbyConnectMessage(player_id=player_id))
+
+    connection = await room.create_connection(1, create_mock_websocket(), since=since)
+
+    assert connection.pending_count == 1
+    assert connection._queue.get_nowait() == LobbyResyncMessage().to_frame()
+
+
+class DelayedSequenceBackplane(InMemoryBackplane):
+    def __init__(self):
+        super().__init__()
+        self.published_sequences = []
+
+    async def publish(self, channel: str, payload: bytes) -> None:
+        """Record sequence numbers of published messages."""
+        self.published_sequences.append(Room._decode_payload(payload)[0])
+        await super().publish(channel, payload)
+
+    async def next_sequence(self, channel: str) -> int:
+        """
+        Get sequence number after a delay, which is shorter for later numbers.
+
+        :return: sequence number
+        """
+        sequence = await super().next_sequence(channel)
+        await asyncio.sleep(0.01 / sequence)
+        return sequence
+
+
+async def test_concurrent_sends_are_published_in_order(default_id: int):
+    backplane = DelayedSequenceBackplane()
+    room = Room(default_id, backplane=backplane)
+    await room.subscribe()
+
+    await asyncio.gather(
+        room.send(LobbyConnectMessage(player_id=1)),
+        room.send(LobbyConnectMessage(player_id=2)),
+    )
+
+    assert backplane.published_sequences == [1, 2]
+    assert room.last_seq == 2
+
+
+async def test_room_buffers_messages_received_out_of_order(default_id: int):
+    room = Room(default_id, replay_size=2)
+    for sequence in (3, 1, 2):
+        message = LobbyConnectMessage(player_id=sequence)
+        message.set_sequence(sequence)
+        await room._handle_payload(room._encode_payload(message, None))
+
+    assert [buffered[0] for buffered in room._replay_buffer] == [2, 3]
+    assert room.last_seq == 3
+
+
+async def test_backplane_drops_sequence_of_unsubscribed_channel(default_id: int):
+    backplane = InMemoryBackplane()
+    room = Room(default_id, backplane=backplane)
+    await room.send(LobbyConnectMessage(player_id=default_id))
+    assert room.channel not in backplane._sequences
+
+    await room.subscribe()
+    await room.send(LobbyConnectMessage(player_id=default_id))
+    assert backplane._sequences[room.channel] == 1
+
+    await room.unsubscribe()
+    assert room.channel not in backplane._sequences
+
+
+async def listen_until_cancelled(messages: list[dict]):
+    for message in messages:
+        yield message
+    await asyncio.Event().wait()
+
+
+async def test_redis_backplane_resubscribes_after_error():
+    message = {"channel": b"room", "data": b"payload"}
+    pubsub = MagicMock(subscribe=AsyncMock(), aclose=AsyncMock())
+    pubsub.listen.side_effect = [
+        RedisConnectionError(),
+        listen_until_cancelled([message]),
+    ]
+    redis_client = MagicMock(aclose=AsyncMock())
+    redis_client.pubsub.return_value = pubsub
+    backplane = RedisBackplane(redis_client)
+    handler = AsyncMock()
+
+    with patch.object(settings, "redis_socket_timeout", 0):
+        await backplane.subscribe("room", handler)
+        await asyncio.sleep(0.01)
+    await backplane.close()
+
+    handler.assert_awaited_once_with(b"payload")
+    assert pubsub.subscribe.await_count == 3
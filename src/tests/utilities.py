@@ -1,6 +1,8 @@
 import os
 import random
 import re
+import time
+from typing import Any, Awaitable, Callable
 
 from alembic.config import Config
 from alembic.operations import Operations
@@ -175,3 +177,45 @@ def create_auth_header(user: UserModel) -> dict[str, str]:
         data=user_token.model_dump(by_alias=True),
     )
     return {"Authorization": f"Bearer {access_token}"}
+
+
+def measure_cpu_time(
+    func: Callable[..., Any],
+    *args,
+    rounds: int = 100,
+    **kwargs,
+) -> float:
+    """
+    Measure average CPU time of a function call.
+
+    :param func: function to measure
+    :param args: function args
+    :param rounds: number of calls
+    :param kwargs: function kwargs
+    :return: CPU time per call in seconds
+    """
+    start = time.process_time()
+    for _ in range(rounds):
+        func(*args, **kwargs)
+    return (time.process_time() - start) / rounds
+
+
+async def measure_async_cpu_time(
+    func: Callable[..., Awaitable[Any]],
+    *args,
+    rounds: int = 100,
+    **kwargs,
+) -> float:
+    """
+    Measure average CPU time of a coroutine function call.
+
+    :param func: coroutine function to measure
+    :param args: function args
+    :param rounds: number of calls
+    :param kwargs: function kwargs
+    :return: CPU time per call in seconds
+    """
+    start = time.process_time()
+    for _ in range(rounds):
+        await func(*args, **kwargs)
+    return (time.process_time() - start) / rounds